@@ -5,13 +5,16 @@ from fastapi import (
     File,
     Form,
     Depends,
+    Query,
 )
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import StreamingResponse
 
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, HttpUrl
-from typing import Optional
+from pydantic import BaseModel, Field, HttpUrl
+from typing import List, Optional
+import asyncio
 import json
 from pathlib import Path
 import logging
@@ -19,8 +22,17 @@ from datetime import datetime
 from dotenv import load_dotenv
 
 # Import existing modules
-from src.scraper import LinkedInScraper
-from src.database import Database
+from src.scraper import LinkedInScraper, GuestJobFetcher
+from src import config
+from src.browser_pool import BrowserPool
+from src.request_filter import RequestFilter
+from src.rate_limiter import rate_limiter
+from src.session_registry import SessionRegistry
+from src.search_crawler import JobSearchCrawler
+from src.work_queue import ScrapeQueue, run_worker
+from src.job_refresher import refresh_jobs
+from src.database import AsyncJobStore, open_async_database
+from src.db_cache import CachedJobStore
 from src.llm_generator import LLMGenerator
 from src.stats_generator import generate_job_stats
 from src.pdf_converter import convert_md_to_pdf
@@ -61,6 +73,21 @@ class JobURLRequest(BaseModel):
     url: HttpUrl
 
 
+class BatchScrapeRequest(BaseModel):
+    urls: List[HttpUrl] = Field(..., min_length=1, max_length=1000)
+    concurrency: int = Field(4, ge=1, le=32)
+
+
+class QueueRequest(BaseModel):
+    urls: List[HttpUrl] = Field(..., min_length=1, max_length=10000)
+
+
+class CrawlRequest(BaseModel):
+    keywords: str = Field(..., min_length=1)
+    location: str = ""
+    max_pages: Optional[int] = Field(None, ge=1, le=100)
+
+
 class JobResponse(BaseModel):
     job_id: int
     title: str
@@ -82,7 +109,15 @@ class UserSync(BaseModel):
     picture: Optional[str] = None
 
 
-# Global state (minimal - scraper creates its own instances now)
+# Global state: shared Chromium pool, started on app startup
+browser_pool: Optional[BrowserPool] = None
+request_filter: Optional[RequestFilter] = RequestFilter.from_config()
+job_fetcher: Optional[GuestJobFetcher] = None
+database: Optional[AsyncJobStore] = None
+scrape_queue: Optional[ScrapeQueue] = None
+session_registry: Optional[SessionRegistry] = None
+background_tasks: List[asyncio.Task] = []
+refresh_lock = asyncio.Lock()
 
 
 # Dependency to get current user from Firebase token
@@ -104,6 +139,13 @@ async def get_current_user(
         return None
 
 
+def get_db() -> AsyncJobStore:
+    """Shared async database created on startup"""
+    if database is None:
+        raise HTTPException(status_code=503, detail="Database not initialized")
+    return database
+
+
 # Dependency to require authentication
 async def require_auth(user=Depends(get_current_user)):
     """Require authentication"""
@@ -122,15 +164,98 @@ async def startup_event():
     Path("logs").mkdir(exist_ok=True)
     # Path("static").mkdir(exist_ok=True) # Static no longer needed on backend
 
-    # Initialize database
-    Database()
+    # One async store (DATABASE_BACKEND) shared by every request
+    global database
+    database = await open_async_database()
+    if config.DB_CACHE_ENABLED:
+        database = CachedJobStore.from_config(database)
     logger.info("Database initialized")
 
+    # Shared HTTP client for the browserless fast path
+    global browser_pool, job_fetcher
+    if config.SCRAPER_HTTP_FAST_PATH:
+        job_fetcher = GuestJobFetcher()
+        await job_fetcher.start()
+
+    # Warm up the shared browser pool so scrapes skip Chromium cold start
+    browser_pool = BrowserPool()
+    try:
+        await browser_pool.start()
+    except Exception as e:
+        # Pool retries lazily on first scrape
+        logger.error(f"Failed to start browser pool: {e}")
+
+    # Logged-in accounts shared by every scraper, if enabled
+    global session_registry
+    if config.SCRAPER_AUTHENTICATED:
+        session_registry = SessionRegistry.from_config()
+        if not len(session_registry):
+            logger.warning("No LinkedIn cookie jars found, scraping anonymously")
+            session_registry = None
+
+    # Persistent scrape queue; resume whatever a previous run left behind
+    global scrape_queue
+    scrape_queue = ScrapeQueue()
+    recovered = scrape_queue.recover()
+    if recovered:
+        logger.info(f"♻️ Requeued {recovered} interrupted URL(s)")
+    logger.info(f"Scrape queue: {scrape_queue.stats()}")
+    scraper = _new_scraper()
+    for _ in range(config.SCRAPE_QUEUE_WORKERS):
+        background_tasks.append(
+            asyncio.create_task(run_worker(scrape_queue, scraper, database))
+        )
+
+    if config.REFRESH_INTERVAL_HOURS > 0:
+        background_tasks.append(asyncio.create_task(_refresh_periodically()))
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down...")
+    for task in list(background_tasks):
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    if scrape_queue:
+        scrape_queue.close()
+    if browser_pool:
+        await browser_pool.close()
+    if session_registry:
+        await session_registry.close()
+    if job_fetcher:
+        await job_fetcher.close()
+    if database:
+        await database.close()
+
+
+def _new_scraper() -> LinkedInScraper:
+    """Scraper sharing the app-wide browser pool, request filter, HTTP client and sessions"""
+    return LinkedInScraper(
+        pool=browser_pool,
+        request_filter=request_filter,
+        fetcher=job_fetcher,
+        session=session_registry,
+    )
+
+
+async def _run_refresh():
+    """Refresh stored jobs unless a refresh is already running"""
+    if refresh_lock.locked():
+        logger.info("Refresh already running, skipping")
+        return None
+    async with refresh_lock:
+        return await refresh_jobs(database, _new_scraper())
+
+
+async def _refresh_periodically():
+    """Re-scrape stored jobs every REFRESH_INTERVAL_HOURS"""
+    while True:
+        await asyncio.sleep(config.REFRESH_INTERVAL_HOURS * 3600)
+        try:
+            await _run_refresh()
+        except Exception as e:
+            logger.error(f"❌ Scheduled refresh failed: {e}")
 
 
 @app.get("/")
@@ -143,6 +268,9 @@ async def root():
             "docs": "/docs",
             "health": "/api/health",
             "scrape": "/api/scrape",
+            "scrape_batch": "/api/scrape/batch",
+            "crawl": "/api/crawl",
+            "queue": "/api/queue",
             "jobs": "/api/jobs",
         },
         "note": "Frontend is hosted separately on Firebase",
@@ -157,22 +285,25 @@ async def health_check():
         "timestamp": datetime.now().isoformat(),
         "version": "2.0.0",
         "auth": "Firebase OAuth2",
+        "browser_pool": browser_pool.stats() if browser_pool else None,
+        "blocked_traffic": request_filter.totals.to_dict() if request_filter else None,
+        "rate_limits": rate_limiter.stats(),
+        "sessions": session_registry.stats() if session_registry else None,
+        "db_cache": database.stats() if isinstance(database, CachedJobStore) else None,
     }
 
 
 # Authentication endpoints
 @app.post("/api/auth/sync")
-async def sync_user(user=Depends(require_auth)):
+async def sync_user(user=Depends(require_auth), db: AsyncJobStore = Depends(get_db)):
     """Sync Firebase user with local database"""
     try:
-        db = Database()
-
         # Check if user exists
-        existing_user = db.get_user_by_email(user["email"])
+        existing_user = await db.get_user_by_email(user["email"])
 
         if not existing_user:
             # Create new user (no password needed for OAuth2)
-            user_id = db.create_user(user["email"], hashed_password="oauth2")
+            user_id = await db.create_user(user["email"], hashed_password="oauth2")
             logger.info(f"Created new user: {user['email']}")
         else:
             user_id = existing_user["id"]
@@ -192,19 +323,21 @@ async def sync_user(user=Depends(require_auth)):
 
 # Job scraping endpoints
 @app.post("/api/scrape", response_model=JobResponse)
-async def scrape_job(request: JobURLRequest, user=Depends(get_current_user)):
+async def scrape_job(
+    request: JobURLRequest,
+    user=Depends(get_current_user),
+    db: AsyncJobStore = Depends(get_db),
+):
     """
     Scrape a LinkedIn job posting anonymously (no LinkedIn login required).
     Only publicly visible data will be extracted.
     """
     try:
-        db = Database()
-
         # Normalize URL first
         normalized_url = LinkedInScraper.normalize_linkedin_url(str(request.url))
 
         # Check if this job already exists in database
-        existing_job = db.check_job_exists(normalized_url)
+        existing_job = await db.check_job_exists(normalized_url)
         if existing_job:
             logger.info(f"⚠️ Job already exists in database: {existing_job['title']}")
             raise HTTPException(
@@ -214,15 +347,12 @@ async def scrape_job(request: JobURLRequest, user=Depends(get_current_user)):
 
         logger.info(f"🔍 Scraping job anonymously: {normalized_url}")
 
-        # Create anonymous scraper (no authentication needed!)
-        scraper = LinkedInScraper()
+        # Anonymous scraper borrowing a context from the shared pool
+        scraper = _new_scraper()
 
         # Scrape the job
         result = await scraper.scrape_job_post(normalized_url)
 
-        # Close browser
-        await scraper.close()
-
         if not result:
             raise HTTPException(
                 status_code=404,
@@ -230,7 +360,7 @@ async def scrape_job(request: JobURLRequest, user=Depends(get_current_user)):
             )
 
         # Save to database
-        job_id = db.save_job(result)
+        job_id = await db.save_job(result)
 
         logger.info(f"✅ Job scraped and saved with ID: {job_id}")
 
@@ -250,9 +380,126 @@ async def scrape_job(request: JobURLRequest, user=Depends(get_current_user)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/scrape/batch")
+async def scrape_jobs_batch(
+    request: BatchScrapeRequest,
+    user=Depends(get_current_user),
+    db: AsyncJobStore = Depends(get_db),
+):
+    """
+    Scrape many LinkedIn job postings concurrently.
+
+    Streams newline-delimited JSON, one line per URL as soon as it finishes:
+    ``{"url", "status", "job_id", "title", "company"}`` where status is
+    "exists", "scraped" or "failed". Jobs already in the database are
+    skipped without being scraped.
+    """
+    scraper = _new_scraper()
+    concurrency = request.concurrency
+    if browser_pool:
+        concurrency = min(concurrency, browser_pool.capacity)
+
+    async def _results():
+        async for item in scraper.scrape_many(
+            [str(url) for url in request.urls], concurrency=concurrency, db=db
+        ):
+            job = item["job"] or {}
+            job_id = job.get("id")
+            if item["status"] == "scraped":
+                try:
+                    job_id = await db.save_job(job)
+                except Exception as e:
+                    logger.error(f"❌ Error saving {item['url']}: {e}")
+                    item["status"] = "failed"
+            yield json.dumps(
+                {
+                    "url": item["url"],
+                    "status": item["status"],
+                    "job_id": job_id,
+                    "title": job.get("title"),
+                    "company": job.get("company"),
+                }
+            ) + "\n"
+
+    return StreamingResponse(_results(), media_type="application/x-ndjson")
+
+
+@app.post("/api/crawl", status_code=202)
+async def crawl_search(request: CrawlRequest, user=Depends(require_auth)):
+    """
+    Crawl a LinkedIn job search (keywords + location) in the background.
+
+    Job IDs found on the public search listing are de-duplicated against
+    the queue and the database, then scraped and saved by background
+    workers.
+    """
+
+    async def _crawl():
+        crawler = JobSearchCrawler(fetcher=job_fetcher)
+        try:
+            await crawler.crawl(
+                request.keywords,
+                request.location,
+                scrape_queue,
+                max_pages=request.max_pages,
+                db=database,
+            )
+        except Exception as e:
+            logger.error(f"❌ Error crawling {request.keywords!r}: {e}")
+        finally:
+            await crawler.close()
+
+    task = asyncio.create_task(_crawl())
+    background_tasks.append(task)
+    task.add_done_callback(background_tasks.remove)
+    return {
+        "message": "Crawl started",
+        "keywords": request.keywords,
+        "location": request.location,
+        "queued": len(scrape_queue),
+    }
+
+
+@app.post("/api/queue", status_code=202)
+async def enqueue_jobs(
+    request: QueueRequest,
+    user=Depends(require_auth),
+    db: AsyncJobStore = Depends(get_db),
+):
+    """
+    Queue LinkedIn job URLs for background scraping.
+
+    The queue is stored on disk, so large imports survive restarts. URLs
+    already in the database or already queued are skipped.
+    """
+    try:
+        urls = LinkedInScraper.prepare_urls(str(url) for url in request.urls)
+        existing = await db.get_existing_jobs(urls)
+        added = scrape_queue.enqueue(url for url in urls if url not in existing)
+        return {"added": added, "skipped": len(urls) - added, "queue": scrape_queue.stats()}
+    except Exception as e:
+        logger.error(f"❌ Error queueing jobs: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/queue")
+async def queue_status(user=Depends(get_current_user)):
+    """Number of queued URLs in each state (pending, in_flight, done, failed)"""
+    return scrape_queue.stats()
+
+
+@app.post("/api/queue/retry")
+async def retry_failed_jobs(user=Depends(require_auth)):
+    """Give URLs that exhausted their attempts another full set of retries"""
+    return {"requeued": scrape_queue.retry_failed(), "queue": scrape_queue.stats()}
+
+
 @app.post("/api/generate-cv")
 async def generate_cv(
-    job_id: int = Form(...), cv_file: UploadFile = File(...), user=Depends(require_auth)
+    job_id: int = Form(...),
+    cv_file: UploadFile = File(...),
+    user=Depends(require_auth),
+    db: AsyncJobStore = Depends(get_db),
 ):
     """Generate a tailored CV for a job using Google Gemini API (Server-side key)"""
     try:
@@ -277,8 +524,7 @@ async def generate_cv(
             current_cv_text = cv_content.decode("utf-8")
 
         # Get job from database
-        db = Database()
-        job = db.get_job(job_id)
+        job = await db.get_job(job_id)
 
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -297,7 +543,7 @@ async def generate_cv(
         convert_md_to_pdf(cv_filename, pdf_filename)
 
         # Save to database
-        db.save_generated_cv(job_id, current_cv_text, tailored_cv)
+        await db.save_generated_cv(job_id, current_cv_text, tailored_cv)
 
         return {
             "job_id": job_id,
@@ -359,25 +605,98 @@ async def generate_stats(user=Depends(get_current_user)):
 
 
 @app.get("/api/jobs")
-async def list_jobs(limit: int = 1000, offset: int = 0, user=Depends(get_current_user)):
-    """List all scraped jobs"""
+async def list_jobs(
+    limit: int = Query(default=1000, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    user=Depends(get_current_user),
+    db: AsyncJobStore = Depends(get_db),
+):
+    """
+    List scraped jobs, newest first.
+
+    Pass the returned ``next_cursor`` as ``cursor`` to fetch the next page;
+    it is null on the last page.
+    """
     try:
-        db = Database()
-        jobs = db.get_all_jobs(limit=limit, offset=offset)
+        jobs, next_cursor = await db.get_jobs_page(limit=limit, cursor=cursor)
 
-        return {"jobs": jobs, "total": len(jobs), "limit": limit, "offset": offset}
+        return {
+            "jobs": jobs,
+            "total": len(jobs),
+            "limit": limit,
+            "next_cursor": next_cursor,
+        }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing jobs: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/jobs/search")
+async def search_jobs(
+    q: str = "",
+    skills: List[str] = Query(default=[]),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    user=Depends(get_current_user),
+    db: AsyncJobStore = Depends(get_db),
+):
+    """
+    Full-text search over job titles, companies and descriptions.
+
+    ``q`` holds keywords (all must match); each ``skills`` parameter is a
+    phrase that must also appear. Results are ranked by relevance and carry
+    only the list-view fields plus ``rank``.
+    """
+    try:
+        jobs, total = await db.search_jobs(q, skills, limit=limit, offset=offset)
+        next_offset = offset + len(jobs) if offset + len(jobs) < total else None
+        return {
+            "jobs": jobs,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_offset": next_offset,
+        }
+
+    except Exception as e:
+        logger.error(f"Error searching jobs: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/jobs/refresh", status_code=202)
+async def refresh_stored_jobs(user=Depends(require_auth)):
+    """
+    Re-scrape every stored open job in the background.
+
+    Only postings whose description changed are written back (and their
+    stats/CV artifacts invalidated); postings that return 404 are marked
+    closed.
+    """
+    if refresh_lock.locked():
+        return {"message": "Refresh already running"}
+
+    async def _refresh():
+        try:
+            await _run_refresh()
+        except Exception as e:
+            logger.error(f"❌ Refresh failed: {e}")
+
+    task = asyncio.create_task(_refresh())
+    background_tasks.append(task)
+    task.add_done_callback(background_tasks.remove)
+    return {"message": "Refresh started"}
+
+
 @app.get("/api/jobs/{job_id}")
-async def get_job(job_id: int, user=Depends(get_current_user)):
+async def get_job(
+    job_id: int, user=Depends(get_current_user), db: AsyncJobStore = Depends(get_db)
+):
     """Get a specific job by ID"""
     try:
-        db = Database()
-        job = db.get_job(job_id)
+        job = await db.get_job(job_id)
 
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -392,11 +711,12 @@ async def get_job(job_id: int, user=Depends(get_current_user)):
 
 
 @app.delete("/api/jobs/{job_id}")
-async def delete_job(job_id: int, user=Depends(require_auth)):
+async def delete_job(
+    job_id: int, user=Depends(require_auth), db: AsyncJobStore = Depends(get_db)
+):
     """Delete a job"""
     try:
-        db = Database()
-        success = db.delete_job(job_id)
+        success = await db.delete_job(job_id)
 
         if not success:
             raise HTTPException(status_code=404, detail="Job not found")
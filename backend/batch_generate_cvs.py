@@ -7,7 +7,8 @@ This script processes all jobs in the database and generates tailored CVs for ea
 import os
 import logging
 from dotenv import load_dotenv
-from src.database import Database
+from src import config
+from src.database import open_database
 from src.llm_generator import LLMGenerator
 from src.pdf_converter import convert_md_to_pdf
 
@@ -44,11 +45,11 @@ def main():
     logger.info(f"✅ Loaded current CV from {cv_file}")
     
     # Initialize database and LLM
-    db = Database()
+    db = open_database()
     llm = LLMGenerator()
     
     # Get all jobs from database
-    jobs = db.get_all_jobs()
+    jobs = list(db.iter_jobs(columns="id, title, company, full_description"))
     
     if not jobs:
         logger.warning("⚠️ No jobs found in database")
@@ -57,51 +58,65 @@ def main():
     
     logger.info(f"📊 Found {len(jobs)} job(s) in database")
     
-    # Process each job
-    for i, job in enumerate(jobs, 1):
-        job_id = job['id']
-        title = job['title']
-        company = job['company']
+    # One bulk lookup instead of a query per job
+    existing_cvs = db.get_generated_cv_ids([job['id'] for job in jobs])
+    pending = []
+    
+    def flush():
+        if pending:
+            db.save_generated_cvs(pending)
+            logger.info(f"💾 Saved {len(pending)} CV(s) to database")
+            pending.clear()
+    
+    # Process each job; the finally keeps generated CVs if the run is cut short
+    try:
+        for i, job in enumerate(jobs, 1):
+            job_id = job['id']
+            title = job['title']
+            company = job['company']
         
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing Job {i}/{len(jobs)}")
-        logger.info(f"📋 Title: {title}")
-        logger.info(f"🏢 Company: {company}")
-        logger.info(f"{'='*60}")
+            logger.info(f"\n{'='*60}")
+            logger.info(f"Processing Job {i}/{len(jobs)}")
+            logger.info(f"📋 Title: {title}")
+            logger.info(f"🏢 Company: {company}")
+            logger.info(f"{'='*60}")
         
-        # Check if CV already generated
-        existing_cv = db.get_generated_cv(job_id)
-        if existing_cv:
-            logger.info("⏭️  CV already generated for this job. Skipping...")
-            continue
+            # Check if CV already generated
+            if job_id in existing_cvs:
+                logger.info("⏭️  CV already generated for this job. Skipping...")
+                continue
         
-        # Generate tailored CV
-        logger.info("🧠 Generating tailored CV...")
-        try:
-            tailored_cv = llm.generate_tailored_cv(
-                job_description=job['full_description'],
-                current_cv=current_cv
-            )
+            # Generate tailored CV
+            logger.info("🧠 Generating tailored CV...")
+            try:
+                tailored_cv = llm.generate_tailored_cv(
+                    job_description=job['full_description'],
+                    current_cv=current_cv
+                )
             
-            # Save to file
-            output_file = f"data/tailored_cv_{job_id}.md"
-            with open(output_file, "w") as f:
-                f.write(tailored_cv)
+                # Save to file
+                output_file = f"data/tailored_cv_{job_id}.md"
+                with open(output_file, "w") as f:
+                    f.write(tailored_cv)
             
-            logger.info(f"✅ Saved to: {output_file}")
+                logger.info(f"✅ Saved to: {output_file}")
             
-            # Save to database
-            db.save_generated_cv(job_id, current_cv, tailored_cv)
-            logger.info("💾 Saved to database")
+                # Queue for the next save
+                pending.append((job_id, current_cv, tailored_cv))
+                if len(pending) >= config.CV_SAVE_BATCH_SIZE:
+                    flush()
             
-            # Convert to PDF
-            pdf_file = f"data/tailored_cv_{job_id}.pdf"
-            if convert_md_to_pdf(output_file, pdf_file):
-                logger.info(f"📄 PDF saved to: {pdf_file}")
+                # Convert to PDF
+                pdf_file = f"data/tailored_cv_{job_id}.pdf"
+                if convert_md_to_pdf(output_file, pdf_file):
+                    logger.info(f"📄 PDF saved to: {pdf_file}")
             
-        except Exception as e:
-            logger.error(f"❌ Error generating CV: {str(e)}")
-            continue
+            except Exception as e:
+                logger.error(f"❌ Error generating CV: {str(e)}")
+                continue
+    
+    finally:
+        flush()
     
     logger.info(f"\n{'='*60}")
     logger.info("✅ Batch processing completed!")
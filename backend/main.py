@@ -4,6 +4,7 @@ import logging
 import sys
 from src.linkedin_auth import LinkedInAuth
 from src.scraper import LinkedInScraper
+from src.session_manager import AuthSessionManager
 from dotenv import load_dotenv
 
 # Configure logging
@@ -48,30 +49,16 @@ async def main():
         headless=True, slow_mo=100
     )
 
+    # Validates the saved cookies (or logs in) once; the context is then
+    # reused for every scrape until LinkedIn shows a login wall
+    session = AuthSessionManager(linkedin_auth, email=email, password=password)
+    scraper = LinkedInScraper(session=session)
+
     try:
-        # Try to use existing cookies first
-        if await linkedin_auth.is_logged_in():
-            logger.info("✅ Already logged in with saved cookies")
-        else:
-            # Perform login
-            logger.info("🔐 Performing LinkedIn login...")
-            success = await linkedin_auth.login(email, password)
-            if not success:
-                logger.error("❌ Login failed - check credentials and logs")
-                return
-            else:
-                logger.info("✅ LinkedIn authentication completed successfully!")
-                logger.info("🍪 Session cookies saved for future sessions")
-
-        # Get authenticated context
-        context = await linkedin_auth.get_authenticated_context()
-        if not context:
+        if not await session.context():
             logger.error("Could not get authenticated context")
             return
 
-        # Initialize scraper
-        scraper = LinkedInScraper(context)
-
         # Get URL from user
         if len(sys.argv) > 1:
             url = sys.argv[1]
@@ -105,8 +92,8 @@ async def main():
             logger.info("Result saved to data/last_scrape.json")
 
             # Save to Database
-            from src.database import Database
-            db = Database()
+            from src.database import open_database
+            db = open_database()
             job_id = db.save_job(result)
             logger.info(f"Job saved to database with ID: {job_id}")
 
@@ -194,7 +181,8 @@ async def main():
     except Exception as e:
         logger.error(f"❌ Main execution error: {str(e)}")
     finally:
-        await linkedin_auth.close_browser()
+        await scraper.close()
+        await session.close()
 
 
 if __name__ == "__main__":
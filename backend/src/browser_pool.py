@@ -0,0 +1,215 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext
+
+from . import config
+
+logger = logging.getLogger(__name__)
+
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+]
+
+
+class _PooledBrowser:
+    """Book-keeping for a single Chromium process owned by the pool"""
+
+    def __init__(self, browser: Browser, slot: int):
+        self.browser = browser
+        self.slot = slot
+        self.active = 0
+        self.pages_served = 0
+        self.retiring = False
+        self.crashed = False
+
+    @property
+    def healthy(self) -> bool:
+        return not self.crashed and self.browser.is_connected()
+
+
+class BrowserPool:
+    """
+    App-lifetime pool of headless Chromium browsers.
+
+    Each browser hands out at most ``max_contexts`` isolated contexts at a
+    time. A browser is recycled (replaced by a fresh process) once it has
+    served ``recycle_after`` pages, or as soon as it is found disconnected.
+    Recycled browsers finish their in-flight contexts before being closed.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        max_contexts: Optional[int] = None,
+        recycle_after: Optional[int] = None,
+        headless: Optional[bool] = None,
+    ):
+        self.size = max(1, size or config.BROWSER_POOL_SIZE)
+        self.max_contexts = max(1, max_contexts or config.BROWSER_MAX_CONTEXTS)
+        self.recycle_after = (
+            config.BROWSER_RECYCLE_AFTER if recycle_after is None else recycle_after
+        )
+        self.headless = config.HEADLESS if headless is None else headless
+        self.playwright = None
+        self._browsers: List[_PooledBrowser] = []
+        self._retiring: List[_PooledBrowser] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._lock = asyncio.Lock()
+        self._launched = 0
+
+    @property
+    def capacity(self) -> int:
+        """Total number of contexts the pool can hand out concurrently"""
+        return self.size * self.max_contexts
+
+    async def start(self):
+        """Launch Playwright and all pooled browsers"""
+        async with self._lock:
+            if self.playwright:
+                return
+            self.playwright = await async_playwright().start()
+            self._slots = asyncio.Semaphore(self.capacity)
+            try:
+                for slot in range(self.size):
+                    self._browsers.append(await self._launch(slot))
+            except Exception:
+                for pooled in self._browsers:
+                    await self._close_browser(pooled)
+                self._browsers = []
+                await self.playwright.stop()
+                self.playwright = None
+                raise
+        logger.info(
+            f"✅ Browser pool started: {self.size} browser(s) x "
+            f"{self.max_contexts} context(s)"
+        )
+
+    async def close(self):
+        """Close every browser and stop Playwright"""
+        async with self._lock:
+            for pooled in self._browsers + self._retiring:
+                pooled.retiring = True
+                await self._close_browser(pooled)
+            self._browsers = []
+            self._retiring = []
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
+        logger.info("✅ Browser pool closed")
+
+    @asynccontextmanager
+    async def context(self, **options) -> AsyncIterator[BrowserContext]:
+        """
+        Borrow an isolated browser context.
+
+        Blocks while the pool is at capacity. The context is closed and its
+        slot returned when the ``async with`` block exits.
+
+        Args:
+            **options: Passed through to ``Browser.new_context``
+        """
+        if not self.playwright:
+            await self.start()
+
+        async with self._slots:
+            context, pooled = await self._new_context(options)
+            try:
+                yield context
+            finally:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+                await self._release(pooled)
+
+    def stats(self) -> Dict:
+        """Snapshot of pool usage for health checks"""
+        return {
+            "browsers": len(self._browsers),
+            "retiring": len(self._retiring),
+            "max_contexts_per_browser": self.max_contexts,
+            "active_contexts": sum(b.active for b in self._browsers + self._retiring),
+            "pages_served": sum(b.pages_served for b in self._browsers),
+            "browsers_launched": self._launched,
+        }
+
+    async def _new_context(self, options: Dict):
+        """Create a context on the least loaded browser, retrying once on crash"""
+        for attempt in range(2):
+            pooled = await self._checkout()
+            try:
+                context = await pooled.browser.new_context(**options)
+            except Exception as e:
+                pooled.crashed = True
+                await self._release(pooled)
+                if attempt:
+                    raise
+                logger.warning(f"⚠️ Browser {pooled.slot} failed to open a context: {e}")
+                continue
+
+            def _count_page(_page, pooled=pooled):
+                pooled.pages_served += 1
+
+            context.on("page", _count_page)
+            return context, pooled
+
+    async def _checkout(self) -> _PooledBrowser:
+        async with self._lock:
+            for i, pooled in enumerate(self._browsers):
+                if not pooled.healthy:
+                    logger.warning(f"♻️ Browser {pooled.slot} crashed, relaunching")
+                    self._retire(pooled)
+                    self._browsers[i] = await self._launch(pooled.slot)
+                elif self.recycle_after and pooled.pages_served >= self.recycle_after:
+                    logger.info(
+                        f"♻️ Recycling browser {pooled.slot} after "
+                        f"{pooled.pages_served} pages"
+                    )
+                    self._retire(pooled)
+                    self._browsers[i] = await self._launch(pooled.slot)
+
+            pooled = min(self._browsers, key=lambda b: b.active)
+            pooled.active += 1
+            return pooled
+
+    async def _release(self, pooled: _PooledBrowser):
+        pooled.active -= 1
+        if pooled.retiring and pooled.active == 0:
+            if pooled in self._retiring:
+                self._retiring.remove(pooled)
+            await self._close_browser(pooled)
+
+    def _retire(self, pooled: _PooledBrowser):
+        pooled.retiring = True
+        if pooled.active:
+            self._retiring.append(pooled)
+        else:
+            asyncio.ensure_future(self._close_browser(pooled))
+
+    async def _launch(self, slot: int) -> _PooledBrowser:
+        browser = await self.playwright.chromium.launch(
+            headless=self.headless, args=CHROMIUM_ARGS
+        )
+        pooled = _PooledBrowser(browser, slot)
+
+        def _on_disconnected(_browser, pooled=pooled):
+            if not pooled.retiring:
+                logger.error(f"❌ Browser {pooled.slot} disconnected unexpectedly")
+                pooled.crashed = True
+
+        browser.on("disconnected", _on_disconnected)
+        self._launched += 1
+        return pooled
+
+    async def _close_browser(self, pooled: _PooledBrowser):
+        try:
+            if pooled.browser.is_connected():
+                await pooled.browser.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Error closing browser {pooled.slot}: {e}")
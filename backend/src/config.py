@@ -0,0 +1,230 @@
+"""
+Runtime configuration read from environment variables.
+
+Values are read once at import time; ``.env`` is loaded first so local
+development picks them up without exporting anything.
+"""
+
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to ``default``"""
+    value = os.getenv(name)
+    try:
+        return int(value) if value is not None else default
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float environment variable, falling back to ``default``"""
+    value = os.getenv(name)
+    try:
+        return float(value) if value is not None else default
+    except ValueError:
+        return default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable (true/false, 1/0, yes/no)"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_list(name: str, default: list) -> list:
+    """Read a comma separated environment variable into a list"""
+    value = os.getenv(name)
+    if value is None:
+        return list(default)
+    return [item.strip().lower() for item in value.split(",") if item.strip()]
+
+
+# ------------------------------------------------------------
+# Database
+# ------------------------------------------------------------
+# Storage backend: "supabase" (hosted Postgres) or "sqlite" (local file)
+DATABASE_BACKEND = os.getenv("DATABASE_BACKEND", "supabase").strip().lower()
+# SQLite file used when DATABASE_BACKEND=sqlite
+DATABASE_PATH = os.getenv("DATABASE_PATH", "data/jobs.db")
+# Timeout for Supabase (PostgREST) requests made by the API
+SUPABASE_TIMEOUT_SECONDS = _env_float("SUPABASE_TIMEOUT_SECONDS", 30.0)
+# Rows per request for bulk writes and lookups (save_jobs, save_generated_cvs, ...)
+DB_BATCH_SIZE = _env_int("DB_BATCH_SIZE", 500)
+# Generated CVs per save in batch_generate_cvs; small so an interrupted run
+# keeps the records of the LLM calls it already paid for
+CV_SAVE_BATCH_SIZE = _env_int("CV_SAVE_BATCH_SIZE", 20)
+# Read-through cache of job rows, URL lookups and list pages in the API
+DB_CACHE_ENABLED = _env_bool("DB_CACHE_ENABLED", True)
+DB_CACHE_MAX_ENTRIES = _env_int("DB_CACHE_MAX_ENTRIES", 10000)
+DB_CACHE_TTL_SECONDS = _env_float("DB_CACHE_TTL_SECONDS", 300.0)
+# Share the cache between API workers through Redis (e.g. redis://localhost:6379/0)
+DB_CACHE_REDIS_URL = os.getenv("DB_CACHE_REDIS_URL")
+
+
+# ------------------------------------------------------------
+# Browser pool
+# ------------------------------------------------------------
+HEADLESS = _env_bool("HEADLESS", True)
+
+# Number of Chromium processes kept alive for the lifetime of the app
+BROWSER_POOL_SIZE = _env_int("BROWSER_POOL_SIZE", 1)
+
+# Maximum number of concurrent contexts handed out per browser
+BROWSER_MAX_CONTEXTS = _env_int("BROWSER_MAX_CONTEXTS", 4)
+
+# Restart a browser after it has served this many pages (0 = never)
+BROWSER_RECYCLE_AFTER = _env_int("BROWSER_RECYCLE_AFTER", 200)
+
+
+# ------------------------------------------------------------
+# Scraping selectors
+# ------------------------------------------------------------
+# Alternative selector table (defaults to src/job_selectors.json)
+SCRAPER_SELECTORS_PATH = os.getenv("SCRAPER_SELECTORS_PATH")
+
+
+# ------------------------------------------------------------
+# Browserless fast path
+# ------------------------------------------------------------
+# Try plain HTTP + HTML parsing before falling back to Chromium
+SCRAPER_HTTP_FAST_PATH = _env_bool("SCRAPER_HTTP_FAST_PATH", True)
+
+# Per-request timeout for the HTTP fast path, in seconds
+SCRAPER_HTTP_TIMEOUT = _env_float("SCRAPER_HTTP_TIMEOUT", 15.0)
+
+
+# ------------------------------------------------------------
+# Scraping waits
+# ------------------------------------------------------------
+# Longest wait for the title/description to appear after navigation
+SCRAPER_READY_TIMEOUT_MS = _env_int("SCRAPER_READY_TIMEOUT_MS", 8000)
+
+# Longest wait for the description to expand after clicking "See more"
+SCRAPER_EXPAND_TIMEOUT_MS = _env_int("SCRAPER_EXPAND_TIMEOUT_MS", 2000)
+
+
+# ------------------------------------------------------------
+# Scraping request filter
+# ------------------------------------------------------------
+# Abort subresources we never read while scraping text
+SCRAPER_BLOCK_RESOURCES = _env_bool("SCRAPER_BLOCK_RESOURCES", True)
+
+SCRAPER_BLOCKED_RESOURCE_TYPES = _env_list(
+    "SCRAPER_BLOCKED_RESOURCE_TYPES", ["image", "media", "font", "stylesheet"]
+)
+
+# Extra domains to block on top of the built-in tracker list
+SCRAPER_BLOCKED_DOMAINS = _env_list("SCRAPER_BLOCKED_DOMAINS", [])
+
+# Domains that are never blocked, whatever their resource type
+SCRAPER_ALLOWED_DOMAINS = _env_list("SCRAPER_ALLOWED_DOMAINS", [])
+
+
+# ------------------------------------------------------------
+# Rate limiting
+# ------------------------------------------------------------
+# Hosts (and their subdomains) whose traffic goes through the rate limiter
+RATE_LIMIT_HOSTS = _env_list("RATE_LIMIT_HOSTS", ["linkedin.com"])
+
+# Sustained requests per second and burst size per host
+RATE_LIMIT_HOST_RPS = _env_float("RATE_LIMIT_HOST_RPS", 1.0)
+RATE_LIMIT_HOST_BURST = _env_int("RATE_LIMIT_HOST_BURST", 5)
+
+# Sustained requests per second and burst size per logged-in session
+RATE_LIMIT_SESSION_RPS = _env_float("RATE_LIMIT_SESSION_RPS", 0.2)
+RATE_LIMIT_SESSION_BURST = _env_int("RATE_LIMIT_SESSION_BURST", 3)
+
+# Random extra delay (up to this many seconds) added to queued requests
+RATE_LIMIT_JITTER_SECONDS = _env_float("RATE_LIMIT_JITTER_SECONDS", 0.5)
+
+# Each 429/999/login wall halves the rate, down to rate / RATE_LIMIT_MAX_SLOWDOWN
+RATE_LIMIT_MAX_SLOWDOWN = _env_float("RATE_LIMIT_MAX_SLOWDOWN", 16.0)
+
+# Each clean response multiplies the slowdown by this factor (back towards 1)
+RATE_LIMIT_RECOVERY = _env_float("RATE_LIMIT_RECOVERY", 0.9)
+
+
+# ------------------------------------------------------------
+# Authenticated sessions
+# ------------------------------------------------------------
+# Re-validate a logged-in session after this long even without a login wall
+AUTH_SESSION_TTL_SECONDS = _env_float("AUTH_SESSION_TTL_SECONDS", 3600.0)
+
+# Scrape through logged-in LinkedIn accounts instead of anonymously (API)
+SCRAPER_AUTHENTICATED = _env_bool("SCRAPER_AUTHENTICATED", False)
+
+# Directory of cookie jars, one JSON file per LinkedIn account
+LINKEDIN_SESSIONS_DIR = os.getenv("LINKEDIN_SESSIONS_DIR", "data/sessions")
+
+# A challenged account is sidelined this long, doubling per further strike
+SESSION_COOLDOWN_SECONDS = _env_float("SESSION_COOLDOWN_SECONDS", 900.0)
+
+# Upper bound on an account's cooldown
+SESSION_MAX_COOLDOWN_SECONDS = _env_float("SESSION_MAX_COOLDOWN_SECONDS", 21600.0)
+
+
+# ------------------------------------------------------------
+# Job search crawler
+# ------------------------------------------------------------
+# Request budget for search result pages
+CRAWLER_PAGES_PER_SECOND = _env_float("CRAWLER_PAGES_PER_SECOND", 0.5)
+
+# Upper bound on result pages fetched per query
+CRAWLER_MAX_PAGES = _env_int("CRAWLER_MAX_PAGES", 40)
+
+
+# ------------------------------------------------------------
+# Persistent scrape queue
+# ------------------------------------------------------------
+# SQLite file holding queued URLs; survives restarts
+SCRAPE_QUEUE_PATH = os.getenv("SCRAPE_QUEUE_PATH", "data/scrape_queue.db")
+
+# Number of API background workers draining the queue
+SCRAPE_QUEUE_WORKERS = _env_int("SCRAPE_QUEUE_WORKERS", 2)
+
+# A URL is marked failed (poison) after this many attempts
+SCRAPE_QUEUE_MAX_ATTEMPTS = _env_int("SCRAPE_QUEUE_MAX_ATTEMPTS", 5)
+
+# Retry delay after the first failure, doubled on each further failure
+SCRAPE_QUEUE_BACKOFF_SECONDS = _env_float("SCRAPE_QUEUE_BACKOFF_SECONDS", 30.0)
+
+# Upper bound on the retry delay
+SCRAPE_QUEUE_BACKOFF_MAX_SECONDS = _env_float("SCRAPE_QUEUE_BACKOFF_MAX_SECONDS", 3600.0)
+
+# How long an idle worker sleeps before polling the queue again
+SCRAPE_QUEUE_POLL_SECONDS = _env_float("SCRAPE_QUEUE_POLL_SECONDS", 2.0)
+
+
+# ------------------------------------------------------------
+# Job refresh
+# ------------------------------------------------------------
+# Re-scrape stored jobs every N hours from the API (0 = only on demand)
+REFRESH_INTERVAL_HOURS = _env_float("REFRESH_INTERVAL_HOURS", 0.0)
+
+# Jobs read from the database per refresh batch
+REFRESH_BATCH_SIZE = _env_int("REFRESH_BATCH_SIZE", 200)
+
+# Maximum job posts fetched at once while refreshing
+REFRESH_CONCURRENCY = _env_int("REFRESH_CONCURRENCY", 4)
+
+
+# ------------------------------------------------------------
+# Market statistics
+# ------------------------------------------------------------
+# Descriptions per spaCy nlp.pipe batch when normalising job text
+STATS_NLP_BATCH_SIZE = _env_int("STATS_NLP_BATCH_SIZE", 256)
+
+# Worker processes for normalisation (1 = in-process)
+STATS_NLP_PROCESSES = _env_int("STATS_NLP_PROCESSES", 1)
+
+# SQLite cache of normalised descriptions reused across stats runs ("" = off)
+STATS_NORMALIZE_CACHE_PATH = os.getenv("STATS_NORMALIZE_CACHE_PATH", "data/normalized_cache.db")
+
+# Hash buckets for terms outside the skill vocabularies (bounds stats memory)
+STATS_EMERGING_FEATURES = _env_int("STATS_EMERGING_FEATURES", 2**20)
@@ -1,46 +1,160 @@
 # src/cookies_manager.py
 import json
 import os
+import tempfile
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Parsed storage states by file path: {path: (mtime, state)}. Shared by
+# every CookiesManager so contexts for the same account never re-read disk.
+_STATE_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# sessionStorage is not part of Playwright's storage_state; it is kept next
+# to it under this key, as [{"origin", "sessionStorage": [{name, value}]}]
+SESSION_STORAGE_KEY = "sessionStorage"
+
+# Set in a tab once its sessionStorage has been restored, so later
+# navigations don't overwrite what the page changed since
+_RESTORED_MARKER = "__li_session_restored"
+
+# Reads one page's sessionStorage (run with page.evaluate)
+READ_SESSION_STORAGE = """
+() => ({
+    origin: location.origin,
+    sessionStorage: Object.keys(sessionStorage).map(
+        (name) => ({ name, value: sessionStorage.getItem(name) })
+    ),
+})
+"""
+
+_RESTORE_SESSION_STORAGE = """
+(() => {
+    const saved = %s;
+    const items = saved[location.origin];
+    if (!items || sessionStorage.getItem(%s) !== null) return;
+    for (const { name, value } of items) sessionStorage.setItem(name, value);
+    sessionStorage.setItem(%s, "1");
+})();
+"""
+
+
+def playwright_state(state: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """The part of a snapshot accepted by ``browser.new_context(storage_state=...)``"""
+    if state is None:
+        return None
+    return {"cookies": state.get("cookies", []), "origins": state.get("origins", [])}
+
+
+def session_storage_entry(page_storage: Dict[str, Any]) -> Dict[str, Any]:
+    """Snapshot entry for the result of ``READ_SESSION_STORAGE``"""
+    return {
+        "origin": page_storage["origin"],
+        "sessionStorage": [
+            item for item in page_storage["sessionStorage"] if item["name"] != _RESTORED_MARKER
+        ],
+    }
+
+
+def session_storage_script(state: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Init script restoring the snapshot's sessionStorage in each new tab
+    (``context.add_init_script``), or None if there is nothing to restore.
+    """
+    saved = {
+        entry["origin"]: entry["sessionStorage"]
+        for entry in (state or {}).get(SESSION_STORAGE_KEY, [])
+        if entry["sessionStorage"]
+    }
+    if not saved:
+        return None
+    marker = json.dumps(_RESTORED_MARKER)
+    return _RESTORE_SESSION_STORAGE % (json.dumps(saved), marker, marker)
+
+
 class CookiesManager:
+    """
+    Persists one LinkedIn account's Playwright ``storage_state``.
+
+    The file holds the full snapshot (cookies plus each origin's local
+    storage) written atomically, with the open tabs' sessionStorage under
+    ``SESSION_STORAGE_KEY`` since Playwright does not capture it. Files
+    from older versions that contain a bare cookie list are still read.
+    """
+
     def __init__(self, cookies_file: str = "data/cookies.json"):
         self.cookies_file = cookies_file
         self.cookies_dir = os.path.dirname(cookies_file)
         Path(self.cookies_dir).mkdir(parents=True, exist_ok=True)
-    
-    def save_cookies(self, cookies: List[Dict[str, Any]]) -> None:
-        """Save cookies to file - SAVE ALL COOKIES without filtering"""
+
+    def save_storage_state(self, state: Dict[str, Any]) -> None:
+        """Atomically replace the snapshot on disk and in the cache"""
         try:
-            # DON'T filter cookies - save everything
-            # LinkedIn uses multiple domains: .linkedin.com, .www.linkedin.com, etc.
-            with open(self.cookies_file, 'w', encoding='utf-8') as f:
-                json.dump(cookies, f, indent=2)
-            logger.info(f"✅ Saved {len(cookies)} cookies to {self.cookies_file}")
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cookies_dir or ".", prefix=".state-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(state, f, separators=(",", ":"))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.cookies_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            _STATE_CACHE[self.cookies_file] = (os.path.getmtime(self.cookies_file), state)
+            logger.info(
+                f"✅ Saved storage state ({len(state.get('cookies', []))} cookies, "
+                f"{len(state.get('origins', []))} origins) to {self.cookies_file}"
+            )
         except Exception as e:
-            logger.error(f"❌ Error saving cookies: {str(e)}")
-    
-    def load_cookies(self) -> List[Dict[str, Any]]:
-        """Load cookies from file"""
+            logger.error(f"❌ Error saving storage state: {str(e)}")
+
+    def load_storage_state(self) -> Optional[Dict[str, Any]]:
+        """
+        The account's storage state, ready to pass to
+        ``browser.new_context(storage_state=playwright_state(...))``.
+
+        Served from the in-memory cache unless the file changed on disk.
+        Returns None if there is no snapshot yet.
+        """
+        try:
+            mtime = os.path.getmtime(self.cookies_file)
+        except OSError:
+            logger.warning(f"⚠️ No storage state found at {self.cookies_file}")
+            return None
+
+        cached = _STATE_CACHE.get(self.cookies_file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
         try:
-            if os.path.exists(self.cookies_file):
-                with open(self.cookies_file, 'r', encoding='utf-8') as f:
-                    cookies = json.load(f)
-                logger.info(f"✅ Loaded {len(cookies)} cookies from {self.cookies_file}")
-                return cookies
-            else:
-                logger.warning(f"⚠️ No cookies file found at {self.cookies_file}")
-                return []
+            with open(self.cookies_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         except Exception as e:
-            logger.error(f"❌ Error loading cookies: {str(e)}")
-            return []
-    
+            logger.error(f"❌ Error loading storage state: {str(e)}")
+            return None
+
+        # Older files hold just the cookie list
+        state = {"cookies": data, "origins": []} if isinstance(data, list) else data
+        _STATE_CACHE[self.cookies_file] = (mtime, state)
+        logger.info(f"✅ Loaded storage state from {self.cookies_file}")
+        return state
+
+    def save_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """Save cookies, keeping any web storage already in the snapshot"""
+        state = self.load_storage_state() or {"origins": []}
+        self.save_storage_state({**state, "cookies": cookies})
+
+    def load_cookies(self) -> List[Dict[str, Any]]:
+        """Load cookies from the snapshot"""
+        state = self.load_storage_state()
+        return state["cookies"] if state else []
+
     def cookies_exist(self) -> bool:
         """Check if cookies file exists"""
         exists = os.path.exists(self.cookies_file)
         logger.info(f"🍪 Cookies file exists: {exists}")
-        return exists
\ No newline at end of file
+        return exists
@@ -1,7 +1,23 @@
 import os
+import json
+import base64
 import logging
+from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from . import config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -9,6 +25,7 @@ logger = logging.getLogger(__name__)
 
 try:
     from supabase import create_client, Client
+    from supabase import acreate_client, AsyncClient, AsyncClientOptions
 
     HAS_SUPABASE = True
 except ImportError:
@@ -29,7 +46,612 @@ def _serialize_datetime(data):
     return data
 
 
-class Database:
+def _supabase_settings() -> Tuple[str, str]:
+    """Read SUPABASE_URL/SUPABASE_KEY, raising if missing or not installed"""
+    supabase_url = os.getenv("SUPABASE_URL")
+    supabase_key = os.getenv("SUPABASE_KEY")
+
+    if not HAS_SUPABASE:
+        raise RuntimeError(
+            "Supabase package is not installed. "
+            "Install it with: pip install supabase"
+        )
+
+    if not supabase_url or not supabase_key:
+        raise RuntimeError(
+            "Supabase configuration missing. "
+            "Please set SUPABASE_URL and SUPABASE_KEY environment variables. "
+            "See docs/SUPABASE_SETUP.md for setup instructions."
+        )
+    return supabase_url, supabase_key
+
+
+def _job_row(job_data: Dict) -> Dict:
+    """
+    Columns written for a scraped job, on insert and on every update.
+
+    ``scraped_at`` is not among them: it is the keyset of job listings and
+    must stay fixed once a job is stored, so rewrites stamp ``refreshed_at``.
+    """
+    return {
+        "title": job_data["title"],
+        "company": job_data["company"],
+        "poster": job_data.get("poster"),
+        "description": job_data.get("description"),
+        "full_description": job_data.get("full_description"),
+        "content_hash": job_data.get("content_hash"),
+        "refreshed_at": datetime.now().isoformat(),
+    }
+
+
+def _job_upsert_row(job_data: Dict) -> Dict:
+    """
+    Row for inserting or updating a job by URL.
+
+    ``scraped_at`` is only kept on insert: SQLite leaves it out of the
+    conflict update and on Supabase the ``jobs_keep_scraped_at`` trigger
+    (docs/SUPABASE_SETUP.md) restores the stored value.
+    """
+    row = {"url": job_data["url"], "status": "open", **_job_row(job_data)}
+    row["scraped_at"] = row["refreshed_at"]
+    return row
+
+
+def _job_upsert_rows(jobs: Iterable[Dict]) -> List[Dict]:
+    """
+    Rows for a bulk jobs upsert, one per URL.
+
+    Postgres rejects an upsert that touches the same row twice, so the last
+    entry for a repeated URL wins.
+    """
+    rows = {}
+    for job in jobs:
+        rows[job["url"]] = _job_upsert_row(job)
+    return list(rows.values())
+
+
+def _cv_row(job_id: int, original_cv: str, tailored_cv: str) -> Dict:
+    return {
+        "job_id": job_id,
+        "original_cv_content": original_cv,
+        "tailored_cv_content": tailored_cv,
+        "generated_at": datetime.now().isoformat(),
+    }
+
+
+def _chunks(items: List, size: int) -> Iterator[List]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+# Columns returned by job listings
+JOB_LIST_COLUMNS = "id, url, title, company, poster, scraped_at"
+
+
+def encode_cursor(row: Dict) -> str:
+    """Opaque cursor pointing just past ``row`` in (scraped_at, id) order"""
+    raw = json.dumps([row["scraped_at"], row["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Inverse of ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        scraped_at, job_id = json.loads(base64.urlsafe_b64decode(padded))
+        return str(scraped_at), int(job_id)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+
+def _with_keys(columns: str) -> str:
+    """Make sure the keyset columns are selected"""
+    names = [c.strip() for c in columns.split(",") if c.strip()]
+    for key in ("id", "scraped_at"):
+        if key not in names and "*" not in names:
+            names.append(key)
+    return ", ".join(names)
+
+
+def _jobs_page_query(
+    table, limit: int, columns: str, cursor: Optional[str], since: Optional[str]
+):
+    """
+    Keyset page of jobs, newest first, ordered by (scraped_at, id).
+
+    Each page seeks straight past the previous page's last row instead of
+    counting an offset, so every page costs the same and rows inserted or
+    updated during a scan are neither skipped nor repeated (``scraped_at``
+    never changes after insert).
+    """
+    query = table.select(_with_keys(columns))
+    if since:
+        query = query.gte("scraped_at", since)
+    if cursor:
+        scraped_at, job_id = decode_cursor(cursor)
+        query = query.or_(
+            f'scraped_at.lt."{scraped_at}",'
+            f'and(scraped_at.eq."{scraped_at}",id.lt.{job_id})'
+        )
+    return (
+        query.order("scraped_at", desc=True)
+        .order("id", desc=True)
+        .limit(limit)
+    )
+
+
+def _page_result(rows: List[Dict], limit: int) -> Tuple[List[Dict], Optional[str]]:
+    next_cursor = encode_cursor(rows[-1]) if rows and len(rows) == limit else None
+    return _serialize_datetime(rows), next_cursor
+
+
+def _search_result(rows: List[Dict]) -> Tuple[List[Dict], int]:
+    """Split the per-row ``total`` window count off search results"""
+    total = rows[0]["total"] if rows else 0
+    rows = [{k: v for k, v in row.items() if k != "total"} for row in rows]
+    return _serialize_datetime(rows), total
+
+
+def _search_params(query: str, skills: Iterable[str], limit: int, offset: int) -> Dict:
+    """Arguments of the ``search_jobs`` SQL function (docs/SUPABASE_SETUP.md)"""
+    return {
+        "query": query or "",
+        "skills": [skill for skill in skills if skill],
+        "max_rows": limit,
+        "skip": offset,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Supabase operations shared by Database and AsyncDatabase. Each builder
+# returns the PostgREST queries of one store method plus how to turn their
+# responses into its return value; the two classes only differ in whether
+# they execute those queries blocking or awaited.
+# ---------------------------------------------------------------------------
+
+_RAISE = object()
+
+
+class _SupabaseOp(NamedTuple):
+    # Request builders, executed in order; generators build each query only
+    # once the previous one has run
+    queries: Iterable[Any]
+    # Maps the list of responses to the method's return value
+    result: Callable[[List[Any]], Any]
+    # Error log wording, e.g. "saving job to" -> "Error saving job to Supabase"
+    action: str
+    # Returned (instead of re-raising) when a query fails
+    on_error: Any = _RAISE
+
+
+def _rows(responses: List[Any]) -> List[Dict]:
+    """Every row returned by the responses, in order"""
+    return [row for response in responses for row in response.data or []]
+
+
+def _first_row(responses: List[Any]) -> Optional[Dict]:
+    rows = _rows(responses)
+    return _serialize_datetime(rows[0]) if rows else None
+
+
+def _first_id(responses: List[Any]) -> Optional[int]:
+    rows = _rows(responses)
+    return rows[0]["id"] if rows else None
+
+
+def _no_result(responses: List[Any]) -> None:
+    return None
+
+
+def _save_job_op(supabase, job_data: Dict) -> _SupabaseOp:
+    return _SupabaseOp(
+        [supabase.table("jobs").upsert(_job_upsert_row(job_data), on_conflict="url")],
+        _first_id,
+        "saving job to",
+    )
+
+
+def _save_jobs_op(supabase, jobs: Iterable[Dict], batch_size: Optional[int]) -> _SupabaseOp:
+    rows = _job_upsert_rows(jobs)
+    return _SupabaseOp(
+        (
+            supabase.table("jobs").upsert(chunk, on_conflict="url")
+            for chunk in _chunks(rows, batch_size or config.DB_BATCH_SIZE)
+        ),
+        lambda responses: {row["url"]: row["id"] for row in _rows(responses)},
+        "saving jobs to",
+    )
+
+
+def _check_job_exists_op(supabase, url: str) -> _SupabaseOp:
+    return _SupabaseOp(
+        [supabase.table("jobs").select("id, title, company, scraped_at").eq("url", url)],
+        _first_row,
+        "checking job in",
+        on_error=None,
+    )
+
+
+def _get_existing_jobs_op(supabase, urls: List[str], chunk_size: int) -> _SupabaseOp:
+    return _SupabaseOp(
+        (
+            supabase.table("jobs")
+            .select("id, url, title, company, scraped_at")
+            .in_("url", chunk)
+            for chunk in _chunks(list(urls), chunk_size)
+        ),
+        lambda responses: {row["url"]: _serialize_datetime(row) for row in _rows(responses)},
+        "checking jobs in",
+        on_error={},
+    )
+
+
+def _get_open_jobs_op(supabase, after_id: int, limit: int) -> _SupabaseOp:
+    return _SupabaseOp(
+        [
+            supabase.table("jobs")
+            .select("id, url, content_hash, full_description")
+            .neq("status", "closed")
+            .gt("id", after_id)
+            .order("id")
+            .limit(limit)
+        ],
+        _rows,
+        "getting open jobs from",
+    )
+
+
+def _update_job_content_op(supabase, job_id: int, job_data: Dict) -> _SupabaseOp:
+    return _SupabaseOp(
+        [supabase.table("jobs").update(_job_row(job_data)).eq("id", job_id)],
+        _no_result,
+        "updating job in",
+    )
+
+
+def _mark_jobs_closed_op(supabase, job_ids: List[int]) -> _SupabaseOp:
+    closed = {"status": "closed", "closed_at": datetime.now().isoformat()}
+    return _SupabaseOp(
+        [supabase.table("jobs").update(closed).in_("id", job_ids)] if job_ids else [],
+        _no_result,
+        "closing jobs in",
+    )
+
+
+def _get_job_op(supabase, job_id: int) -> _SupabaseOp:
+    return _SupabaseOp(
+        [supabase.table("jobs").select("*").eq("id", job_id)],
+        _first_row,
+        "getting job from",
+        on_error=None,
+    )
+
+
+def _get_jobs_page_op(
+    supabase, limit: int, cursor: Optional[str], columns: str, since: Optional[str]
+) -> _SupabaseOp:
+    return _SupabaseOp(
+        [_jobs_page_query(supabase.table("jobs"), limit, columns, cursor, since)],
+        lambda responses: _page_result(_rows(responses), limit),
+        "getting jobs from",
+    )
+
+
+def _search_jobs_op(
+    supabase, query: str, skills: Iterable[str], limit: int, offset: int
+) -> _SupabaseOp:
+    return _SupabaseOp(
+        [supabase.rpc("search_jobs", _search_params(query, skills, limit, offset))],
+        lambda responses: _search_result(_rows(responses)),
+        "searching jobs in",
+    )
+
+
+def _delete_job_op(supabase, job_id: int) -> _SupabaseOp:
+    # CV generations reference the job, so they go first; Supabase returns
+    # the deleted rows, so an empty result means there was no such job
+    return _SupabaseOp(
+        [
+            supabase.table("cv_generations").delete().eq("job_id", job_id),
+            supabase.table("jobs").delete().eq("id", job_id),
+        ],
+        lambda responses: bool(responses[-1].data),
+        "deleting job from",
+        on_error=False,
+    )
+
+
+def _save_generated_cvs_op(
+    supabase, cvs: Iterable[Tuple[int, str, str]], batch_size: Optional[int]
+) -> _SupabaseOp:
+    rows = [_cv_row(*cv) for cv in cvs]
+    return _SupabaseOp(
+        (
+            supabase.table("cv_generations").insert(chunk)
+            for chunk in _chunks(rows, batch_size or config.DB_BATCH_SIZE)
+        ),
+        lambda responses: {row["job_id"]: row["id"] for row in _rows(responses)},
+        "saving CVs to",
+    )
+
+
+def _get_generated_cv_ids_op(
+    supabase, job_ids: Iterable[int], batch_size: Optional[int]
+) -> _SupabaseOp:
+    ids = list(dict.fromkeys(job_ids))
+    return _SupabaseOp(
+        (
+            supabase.table("cv_generations")
+            .select("id, job_id")
+            .in_("job_id", chunk)
+            .order("id")
+            for chunk in _chunks(ids, batch_size or config.DB_BATCH_SIZE)
+        ),
+        # Ordered by id, so the latest CV of each job wins
+        lambda responses: {row["job_id"]: row["id"] for row in _rows(responses)},
+        "checking CVs in",
+    )
+
+
+def _delete_generated_cvs_op(
+    supabase, job_ids: Iterable[int], batch_size: Optional[int]
+) -> _SupabaseOp:
+    ids = list(dict.fromkeys(job_ids))
+    return _SupabaseOp(
+        (
+            supabase.table("cv_generations").delete().in_("job_id", chunk)
+            for chunk in _chunks(ids, batch_size or config.DB_BATCH_SIZE)
+        ),
+        _no_result,
+        "deleting CVs from",
+    )
+
+
+def _create_user_op(supabase, email: str, hashed_password: str) -> _SupabaseOp:
+    return _SupabaseOp(
+        [supabase.table("users").insert({"email": email, "hashed_password": hashed_password})],
+        _first_id,
+        "creating user in",
+    )
+
+
+def _get_user_by_email_op(supabase, email: str) -> _SupabaseOp:
+    return _SupabaseOp(
+        [supabase.table("users").select("*").eq("email", email)],
+        _first_row,
+        "getting user from",
+        on_error=None,
+    )
+
+
+class JobStore(ABC):
+    """
+    Storage interface used by the scraper, API and scripts.
+
+    Implemented by ``Database`` (Supabase) and ``SQLiteDatabase`` (local
+    file); ``open_database()`` picks one from ``DATABASE_BACKEND``. Rows are
+    plain dicts with ISO timestamp strings.
+    """
+
+    @abstractmethod
+    def save_job(self, job_data: Dict) -> int:
+        """Insert or update a job by URL; returns its id"""
+
+    @abstractmethod
+    def save_jobs(
+        self, jobs: Iterable[Dict], batch_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Bulk ``save_job``; returns url -> id"""
+
+    @abstractmethod
+    def check_job_exists(self, url: str) -> Optional[Dict]:
+        """{id, title, company, scraped_at} of the job at ``url``, or None"""
+
+    @abstractmethod
+    def get_existing_jobs(self, urls: List[str], chunk_size: int = 200) -> Dict[str, Dict]:
+        """Bulk ``check_job_exists``; returns url -> row for stored URLs"""
+
+    @abstractmethod
+    def get_open_jobs(self, after_id: int = 0, limit: int = 200) -> List[Dict]:
+        """{id, url, content_hash, full_description} of jobs not marked closed, by id"""
+
+    @abstractmethod
+    def update_job_content(self, job_id: int, job_data: Dict):
+        """Overwrite the scraped fields of an existing job"""
+
+    @abstractmethod
+    def mark_jobs_closed(self, job_ids: List[int]):
+        """Flag jobs whose posting has been taken down"""
+
+    @abstractmethod
+    def get_job(self, job_id: int) -> Optional[Dict]:
+        """Every column of one job, or None"""
+
+    @abstractmethod
+    def get_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        columns: str = JOB_LIST_COLUMNS,
+        since: Optional[str] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """One keyset page of jobs, newest first; returns (rows, next_cursor)"""
+
+    @abstractmethod
+    def search_jobs(
+        self,
+        query: str = "",
+        skills: Iterable[str] = (),
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[Dict], int]:
+        """
+        Ranked full-text search over title, company and full description.
+
+        Args:
+            query: Free-text keywords; every word must match (stemmed)
+            skills: Phrases that must all appear, e.g. ["machine learning"]
+            limit: Maximum rows to return
+            offset: Rows to skip
+
+        Returns:
+            (rows, total): list-view columns plus ``rank``, best match first,
+            and the number of matching jobs
+        """
+
+    @abstractmethod
+    def delete_job(self, job_id: int) -> bool:
+        """Delete a job and its generated CVs; False if it did not exist"""
+
+    @abstractmethod
+    def save_generated_cv(self, job_id: int, original_cv: str, tailored_cv: str):
+        """Save one generated CV"""
+
+    @abstractmethod
+    def save_generated_cvs(
+        self, cvs: Iterable[Tuple[int, str, str]], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        """Bulk ``save_generated_cv``; returns job_id -> cv id"""
+
+    @abstractmethod
+    def get_generated_cv_ids(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        """job_id -> latest cv id, for the jobs that have a generated CV"""
+
+    @abstractmethod
+    def delete_generated_cvs(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ):
+        """Delete the generated CVs of jobs whose description changed"""
+
+    @abstractmethod
+    def create_user(self, email: str, hashed_password: str) -> int:
+        """Create a user; raises if the email is taken"""
+
+    @abstractmethod
+    def get_user_by_email(self, email: str) -> Optional[Dict]:
+        """The user row for ``email``, or None"""
+
+    def iter_jobs(
+        self,
+        batch_size: int = 1000,
+        columns: str = JOB_LIST_COLUMNS,
+        since: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """Stream every job, ``batch_size`` rows per query (see ``get_jobs_page``)"""
+        cursor = None
+        while True:
+            rows, cursor = self.get_jobs_page(batch_size, cursor, columns, since)
+            yield from rows
+            if cursor is None:
+                return
+
+    def close(self):
+        """Release connections held by the backend"""
+
+
+class AsyncJobStore(ABC):
+    """Non-blocking ``JobStore`` used by the API (same methods, awaited)"""
+
+    @abstractmethod
+    async def save_job(self, job_data: Dict) -> int: ...
+
+    @abstractmethod
+    async def save_jobs(
+        self, jobs: Iterable[Dict], batch_size: Optional[int] = None
+    ) -> Dict[str, int]: ...
+
+    @abstractmethod
+    async def check_job_exists(self, url: str) -> Optional[Dict]: ...
+
+    @abstractmethod
+    async def get_existing_jobs(
+        self, urls: List[str], chunk_size: int = 200
+    ) -> Dict[str, Dict]: ...
+
+    @abstractmethod
+    async def get_open_jobs(self, after_id: int = 0, limit: int = 200) -> List[Dict]: ...
+
+    @abstractmethod
+    async def update_job_content(self, job_id: int, job_data: Dict): ...
+
+    @abstractmethod
+    async def mark_jobs_closed(self, job_ids: List[int]): ...
+
+    @abstractmethod
+    async def get_job(self, job_id: int) -> Optional[Dict]: ...
+
+    @abstractmethod
+    async def get_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        columns: str = JOB_LIST_COLUMNS,
+        since: Optional[str] = None,
+    ) -> Tuple[List[Dict], Optional[str]]: ...
+
+    @abstractmethod
+    async def search_jobs(
+        self,
+        query: str = "",
+        skills: Iterable[str] = (),
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[Dict], int]: ...
+
+    @abstractmethod
+    async def delete_job(self, job_id: int) -> bool: ...
+
+    @abstractmethod
+    async def save_generated_cv(self, job_id: int, original_cv: str, tailored_cv: str): ...
+
+    @abstractmethod
+    async def save_generated_cvs(
+        self, cvs: Iterable[Tuple[int, str, str]], batch_size: Optional[int] = None
+    ) -> Dict[int, int]: ...
+
+    @abstractmethod
+    async def get_generated_cv_ids(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ) -> Dict[int, int]: ...
+
+    @abstractmethod
+    async def delete_generated_cvs(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ): ...
+
+    @abstractmethod
+    async def create_user(self, email: str, hashed_password: str) -> int: ...
+
+    @abstractmethod
+    async def get_user_by_email(self, email: str) -> Optional[Dict]: ...
+
+    async def iter_jobs(
+        self,
+        batch_size: int = 1000,
+        columns: str = JOB_LIST_COLUMNS,
+        since: Optional[str] = None,
+    ) -> AsyncIterator[Dict]:
+        """Stream every job, ``batch_size`` rows per query"""
+        cursor = None
+        while True:
+            rows, cursor = await self.get_jobs_page(batch_size, cursor, columns, since)
+            for row in rows:
+                yield row
+            if cursor is None:
+                return
+
+    async def close(self):
+        """Release connections held by the backend"""
+
+
+class Database(JobStore):
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize Supabase database connection.
@@ -41,28 +663,11 @@ class Database:
         Raises:
             RuntimeError: If Supabase is not configured or package not installed
         """
-        # Check for Supabase configuration
-        self.supabase_url = os.getenv("SUPABASE_URL")
-        self.supabase_key = os.getenv("SUPABASE_KEY")
-
-        if not HAS_SUPABASE:
-            raise RuntimeError(
-                "Supabase package is not installed. "
-                "Install it with: pip install supabase"
-            )
-
-        if not self.supabase_url or not self.supabase_key:
-            raise RuntimeError(
-                "Supabase configuration missing. "
-                "Please set SUPABASE_URL and SUPABASE_KEY environment variables. "
-                "See docs/SUPABASE_SETUP.md for setup instructions."
-            )
+        self.supabase_url, self.supabase_key = _supabase_settings()
 
         logger.info("🚀 Connecting to Supabase Database...")
         try:
             self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
-            # Test connection by checking if we can access the database
-            self._verify_supabase_connection()
             logger.info("✅ Successfully connected to Supabase")
         except Exception as e:
             logger.error(f"❌ Supabase connection failed: {e}")
@@ -71,156 +676,150 @@ class Database:
                 "Please check your SUPABASE_URL and SUPABASE_KEY."
             )
 
-    def _verify_supabase_connection(self):
-        """Verify Supabase connection by attempting to query"""
+    def _run(self, op: _SupabaseOp):
+        """Execute an operation's queries in order and build its result"""
         try:
-            # Try to query jobs table (will create if doesn't exist via Supabase dashboard)
-            self.supabase.table("jobs").select("id").limit(1).execute()
-        except Exception:
-            # If table doesn't exist, that's okay - we'll create it via SQL
-            logger.info("Tables may need to be created in Supabase dashboard")
-            pass
+            return op.result([query.execute() for query in op.queries])
+        except Exception as e:
+            logger.error(f"Error {op.action} Supabase: {e}")
+            if op.on_error is _RAISE:
+                raise
+            return op.on_error
 
     def save_job(self, job_data: Dict) -> int:
         """Save job to database"""
-        try:
-            # Prepare data for Supabase
-            data = {
-                "url": job_data["url"],
-                "title": job_data["title"],
-                "company": job_data["company"],
-                "poster": job_data.get("poster"),
-                "description": job_data.get("description"),
-                "full_description": job_data.get("full_description"),
-                "scraped_at": datetime.now().isoformat(),
-            }
+        return self._run(_save_job_op(self.supabase, job_data))
 
-            # Upsert (insert or update)
-            result = (
-                self.supabase.table("jobs").upsert(data, on_conflict="url").execute()
-            )
+    def save_jobs(
+        self, jobs: Iterable[Dict], batch_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Upsert many scraped jobs with one request per batch.
 
-            if result.data and len(result.data) > 0:
-                return result.data[0]["id"]
-            return None
-        except Exception as e:
-            logger.error(f"Error saving job to Supabase: {e}")
-            raise
+        Args:
+            jobs: Job dicts as built by the scraper
+            batch_size: Rows per upsert (defaults to ``DB_BATCH_SIZE``)
+
+        Returns:
+            Mapping of url -> job id
+        """
+        return self._run(_save_jobs_op(self.supabase, jobs, batch_size))
 
     def check_job_exists(self, url: str) -> Optional[Dict]:
         """Check if job exists by URL"""
-        try:
-            result = (
-                self.supabase.table("jobs")
-                .select("id, title, company, scraped_at")
-                .eq("url", url)
-                .execute()
-            )
+        return self._run(_check_job_exists_op(self.supabase, url))
 
-            if result.data and len(result.data) > 0:
-                return _serialize_datetime(result.data[0])
-            return None
-        except Exception as e:
-            logger.error(f"Error checking job in Supabase: {e}")
-            return None
+    def get_existing_jobs(self, urls: List[str], chunk_size: int = 200) -> Dict[str, Dict]:
+        """
+        Bulk existence check for many URLs.
+
+        Returns a mapping of url -> {id, title, company, scraped_at} for the
+        URLs already stored. URLs are looked up in chunks to keep the
+        PostgREST query string within limits.
+        """
+        return self._run(_get_existing_jobs_op(self.supabase, urls, chunk_size))
+
+    def get_open_jobs(self, after_id: int = 0, limit: int = 200) -> List[Dict]:
+        """
+        Jobs not marked closed, ordered by id, for refreshing.
+
+        Pages by id (``after_id`` = last id of the previous page) so rows
+        closed while iterating don't shift the pages.
+        """
+        return self._run(_get_open_jobs_op(self.supabase, after_id, limit))
+
+    def update_job_content(self, job_id: int, job_data: Dict):
+        """Overwrite the scraped fields of an existing job"""
+        self._run(_update_job_content_op(self.supabase, job_id, job_data))
+
+    def mark_jobs_closed(self, job_ids: List[int]):
+        """Flag jobs whose posting has been taken down"""
+        self._run(_mark_jobs_closed_op(self.supabase, job_ids))
 
     def get_job(self, job_id: int) -> Optional[Dict]:
         """Get job by ID"""
-        try:
-            result = self.supabase.table("jobs").select("*").eq("id", job_id).execute()
-
-            if result.data and len(result.data) > 0:
-                return _serialize_datetime(result.data[0])
-            return None
-        except Exception as e:
-            logger.error(f"Error getting job from Supabase: {e}")
-            return None
+        return self._run(_get_job_op(self.supabase, job_id))
 
     def save_generated_cv(self, job_id: int, original_cv: str, tailored_cv: str):
         """Save generated CV"""
-        try:
-            data = {
-                "job_id": job_id,
-                "original_cv_content": original_cv,
-                "tailored_cv_content": tailored_cv,
-                "generated_at": datetime.now().isoformat(),
-            }
+        self._run(_save_generated_cvs_op(self.supabase, [(job_id, original_cv, tailored_cv)], 1))
 
-            self.supabase.table("cv_generations").insert(data).execute()
-        except Exception as e:
-            logger.error(f"Error saving CV to Supabase: {e}")
-            raise
+    def save_generated_cvs(
+        self, cvs: Iterable[Tuple[int, str, str]], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        """
+        Save many generated CVs with one insert per batch.
 
-    def get_all_jobs(
-        self, limit: int = 10, offset: int = 0, include_description: bool = False
-    ) -> List[Dict]:
-        """Get all jobs with pagination"""
-        try:
-            select_query = "id, url, title, company, poster, scraped_at"
-            if include_description:
-                select_query += ", full_description"
+        Args:
+            cvs: (job_id, original_cv, tailored_cv) tuples
+            batch_size: Rows per insert (defaults to ``DB_BATCH_SIZE``)
 
-            result = (
-                self.supabase.table("jobs")
-                .select(select_query)
-                .order("scraped_at", desc=True)
-                .range(offset, offset + limit - 1)
-                .execute()
-            )
+        Returns:
+            Mapping of job_id -> id of the new cv_generations row
+        """
+        return self._run(_save_generated_cvs_op(self.supabase, cvs, batch_size))
 
-            # Serialize datetime objects to strings
-            return _serialize_datetime(result.data) if result.data else []
-        except Exception as e:
-            logger.error(f"Error getting jobs from Supabase: {e}")
-            return []
+    def get_generated_cv_ids(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        """
+        Bulk lookup of which jobs already have a generated CV.
 
-    def delete_job(self, job_id: int) -> bool:
-        """Delete job and associated CVs"""
-        try:
-            # Delete CV generations first
-            self.supabase.table("cv_generations").delete().eq(
-                "job_id", job_id
-            ).execute()
+        Returns:
+            Mapping of job_id -> id of its latest cv_generations row, for the
+            jobs that have one
+        """
+        return self._run(_get_generated_cv_ids_op(self.supabase, job_ids, batch_size))
 
-            # Delete job
-            result = self.supabase.table("jobs").delete().eq("id", job_id).execute()
+    def delete_generated_cvs(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ):
+        """Delete the generated CVs of the given jobs"""
+        self._run(_delete_generated_cvs_op(self.supabase, job_ids, batch_size))
 
-            return result.data is not None
-        except Exception as e:
-            logger.error(f"Error deleting job from Supabase: {e}")
-            return False
+    def get_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        columns: str = JOB_LIST_COLUMNS,
+        since: Optional[str] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        One keyset page of jobs, newest first.
+
+        Args:
+            limit: Maximum rows to return
+            cursor: ``next_cursor`` of the previous page, or None for the first
+            columns: Columns to select (``id`` and ``scraped_at`` are always added)
+            since: Only jobs scraped at or after this ISO timestamp
+
+        Returns:
+            (rows, next_cursor); next_cursor is None on the last page
+        """
+        return self._run(_get_jobs_page_op(self.supabase, limit, cursor, columns, since))
+
+    def search_jobs(
+        self,
+        query: str = "",
+        skills: Iterable[str] = (),
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[Dict], int]:
+        """Ranked tsvector search through the ``search_jobs`` SQL function"""
+        return self._run(_search_jobs_op(self.supabase, query, skills, limit, offset))
+
+    def delete_job(self, job_id: int) -> bool:
+        """Delete job and associated CVs; False if there was no such job"""
+        return self._run(_delete_job_op(self.supabase, job_id))
 
     # User management methods
     def create_user(self, email: str, hashed_password: str) -> int:
         """Create a new user"""
-        try:
-            data = {
-                "email": email,
-                "hashed_password": hashed_password,
-            }
-
-            result = self.supabase.table("users").insert(data).execute()
-
-            if result.data and len(result.data) > 0:
-                return result.data[0]["id"]
-            return None
-        except Exception as e:
-            logger.error(f"Error creating user in Supabase: {e}")
-            raise
+        return self._run(_create_user_op(self.supabase, email, hashed_password))
 
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get user by email"""
-        try:
-            result = (
-                self.supabase.table("users").select("*").eq("email", email).execute()
-            )
-
-            if result.data and len(result.data) > 0:
-                return _serialize_datetime(result.data[0])
-            return None
-        except Exception as e:
-            logger.error(f"Error getting user from Supabase: {e}")
-            return None
+        return self._run(_get_user_by_email_op(self.supabase, email))
 
     def get_user_by_id(self, user_id: int) -> Optional[Dict]:
         """Get user by ID"""
@@ -284,3 +883,177 @@ class Database:
         except Exception as e:
             logger.error(f"Error deleting credentials from Supabase: {e}")
             return False
+
+
+class AsyncDatabase(AsyncJobStore):
+    """
+    Non-blocking twin of ``Database`` for the API.
+
+    Built on the async Supabase client, whose PostgREST HTTP client keeps a
+    pool of keep-alive (HTTP/2) connections. Create one instance at startup
+    with ``await AsyncDatabase.create()`` and share it: each call is then a
+    single pooled round trip, with no client setup or verification query.
+    """
+
+    def __init__(self, supabase: "AsyncClient"):
+        self.supabase = supabase
+
+    @classmethod
+    async def create(cls) -> "AsyncDatabase":
+        """
+        Connect to Supabase.
+
+        Raises:
+            RuntimeError: If Supabase is not configured or package not installed
+        """
+        supabase_url, supabase_key = _supabase_settings()
+        logger.info("🚀 Connecting to Supabase Database (async)...")
+        try:
+            client = await acreate_client(
+                supabase_url,
+                supabase_key,
+                options=AsyncClientOptions(
+                    postgrest_client_timeout=config.SUPABASE_TIMEOUT_SECONDS
+                ),
+            )
+        except Exception as e:
+            logger.error(f"❌ Supabase connection failed: {e}")
+            raise RuntimeError(
+                f"Failed to connect to Supabase: {e}. "
+                "Please check your SUPABASE_URL and SUPABASE_KEY."
+            )
+        logger.info("✅ Async Supabase client ready")
+        return cls(client)
+
+    async def close(self):
+        """Close the pooled HTTP connections"""
+        await self.supabase.postgrest.aclose()
+
+    async def _run(self, op: _SupabaseOp):
+        """Await an operation's queries in order and build its result"""
+        try:
+            return op.result([await query.execute() for query in op.queries])
+        except Exception as e:
+            logger.error(f"Error {op.action} Supabase: {e}")
+            if op.on_error is _RAISE:
+                raise
+            return op.on_error
+
+    async def save_job(self, job_data: Dict) -> int:
+        """Save job to database"""
+        return await self._run(_save_job_op(self.supabase, job_data))
+
+    async def save_jobs(
+        self, jobs: Iterable[Dict], batch_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Upsert many scraped jobs (see ``Database.save_jobs``)"""
+        return await self._run(_save_jobs_op(self.supabase, jobs, batch_size))
+
+    async def check_job_exists(self, url: str) -> Optional[Dict]:
+        """Check if job exists by URL"""
+        return await self._run(_check_job_exists_op(self.supabase, url))
+
+    async def get_existing_jobs(
+        self, urls: List[str], chunk_size: int = 200
+    ) -> Dict[str, Dict]:
+        """Bulk existence check for many URLs (see ``Database.get_existing_jobs``)"""
+        return await self._run(_get_existing_jobs_op(self.supabase, urls, chunk_size))
+
+    async def get_open_jobs(self, after_id: int = 0, limit: int = 200) -> List[Dict]:
+        """Jobs not marked closed, ordered by id (see ``Database.get_open_jobs``)"""
+        return await self._run(_get_open_jobs_op(self.supabase, after_id, limit))
+
+    async def update_job_content(self, job_id: int, job_data: Dict):
+        """Overwrite the scraped fields of an existing job"""
+        await self._run(_update_job_content_op(self.supabase, job_id, job_data))
+
+    async def mark_jobs_closed(self, job_ids: List[int]):
+        """Flag jobs whose posting has been taken down"""
+        await self._run(_mark_jobs_closed_op(self.supabase, job_ids))
+
+    async def get_job(self, job_id: int) -> Optional[Dict]:
+        """Get job by ID"""
+        return await self._run(_get_job_op(self.supabase, job_id))
+
+    async def save_generated_cv(self, job_id: int, original_cv: str, tailored_cv: str):
+        """Save generated CV"""
+        await self._run(
+            _save_generated_cvs_op(self.supabase, [(job_id, original_cv, tailored_cv)], 1)
+        )
+
+    async def save_generated_cvs(
+        self, cvs: Iterable[Tuple[int, str, str]], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        """Save many generated CVs (see ``Database.save_generated_cvs``)"""
+        return await self._run(_save_generated_cvs_op(self.supabase, cvs, batch_size))
+
+    async def get_generated_cv_ids(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        """Bulk lookup of jobs with a generated CV (see ``Database.get_generated_cv_ids``)"""
+        return await self._run(_get_generated_cv_ids_op(self.supabase, job_ids, batch_size))
+
+    async def delete_generated_cvs(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ):
+        """Delete the generated CVs of the given jobs"""
+        await self._run(_delete_generated_cvs_op(self.supabase, job_ids, batch_size))
+
+    async def get_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        columns: str = JOB_LIST_COLUMNS,
+        since: Optional[str] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """One keyset page of jobs, newest first (see ``Database.get_jobs_page``)"""
+        return await self._run(_get_jobs_page_op(self.supabase, limit, cursor, columns, since))
+
+    async def search_jobs(
+        self,
+        query: str = "",
+        skills: Iterable[str] = (),
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[Dict], int]:
+        """Ranked full-text search (see ``Database.search_jobs``)"""
+        return await self._run(_search_jobs_op(self.supabase, query, skills, limit, offset))
+
+    async def delete_job(self, job_id: int) -> bool:
+        """Delete job and associated CVs; False if there was no such job"""
+        return await self._run(_delete_job_op(self.supabase, job_id))
+
+    async def create_user(self, email: str, hashed_password: str) -> int:
+        """Create a new user"""
+        return await self._run(_create_user_op(self.supabase, email, hashed_password))
+
+    async def get_user_by_email(self, email: str) -> Optional[Dict]:
+        """Get user by email"""
+        return await self._run(_get_user_by_email_op(self.supabase, email))
+
+
+def _backend() -> str:
+    backend = config.DATABASE_BACKEND
+    if backend not in ("supabase", "sqlite"):
+        raise RuntimeError(
+            f"Unknown DATABASE_BACKEND {backend!r}; use 'supabase' or 'sqlite'"
+        )
+    return backend
+
+
+def open_database() -> JobStore:
+    """The ``JobStore`` selected by ``DATABASE_BACKEND``"""
+    if _backend() == "sqlite":
+        from .sqlite_database import SQLiteDatabase
+
+        return SQLiteDatabase()
+    return Database()
+
+
+async def open_async_database() -> AsyncJobStore:
+    """The ``AsyncJobStore`` selected by ``DATABASE_BACKEND`` (for the API)"""
+    if _backend() == "sqlite":
+        from .sqlite_database import AsyncSQLiteDatabase
+
+        return AsyncSQLiteDatabase()
+    return await AsyncDatabase.create()
@@ -0,0 +1,317 @@
+"""
+Read-through cache in front of the job store.
+
+``CachedJobStore`` wraps any ``AsyncJobStore`` and keeps hot reads -- job
+rows by id, the URL -> job index used by existence checks, and job list
+pages -- in a ``CacheBackend``. Writes through the wrapper invalidate the
+affected entries; list pages are invalidated all at once by bumping a
+generation number, so stale pages simply stop being addressed and age
+out. Every entry also expires after a TTL, which bounds staleness from
+writers that bypass the cache (CLI scripts, other services).
+
+The default backend is a bounded in-process LRU. Multi-worker deployments
+can share one cache (and its invalidations) with ``RedisCache``.
+"""
+
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from . import config
+from .database import JOB_LIST_COLUMNS, AsyncJobStore
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+_MISSING = object()
+
+
+class CacheBackend(ABC):
+    """Key/value store used by ``CachedJobStore``; values are JSON-able"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """The cached value, or ``_MISSING``"""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any):
+        """Store ``value`` under ``key``"""
+
+    @abstractmethod
+    async def delete(self, keys: Iterable[str]):
+        """Drop the given keys (missing ones are ignored)"""
+
+    async def close(self):
+        pass
+
+
+class LRUCache(CacheBackend):
+    """
+    Bounded in-process cache with per-entry TTL.
+
+    Args:
+        max_entries: Least recently used entries are evicted past this size
+        ttl: Seconds an entry stays valid
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries or config.DB_CACHE_MAX_ENTRIES
+        self.ttl = config.DB_CACHE_TTL_SECONDS if ttl is None else ttl
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any):
+        self._entries[key] = (self.clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, keys: Iterable[str]):
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache shared by every API worker through Redis.
+
+    Redis evicts by its own ``maxmemory-policy`` (use ``allkeys-lru``);
+    entries expire after ``ttl`` seconds.
+    """
+
+    def __init__(self, url: str, ttl: Optional[float] = None, prefix: str = "jobcache:"):
+        if not HAS_REDIS:
+            raise RuntimeError(
+                "Redis package is not installed. Install it with: pip install redis"
+            )
+        self.client = aioredis.from_url(url)
+        self.ttl = config.DB_CACHE_TTL_SECONDS if ttl is None else ttl
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Any:
+        raw = await self.client.get(self.prefix + key)
+        return _MISSING if raw is None else json.loads(raw)
+
+    async def set(self, key: str, value: Any):
+        await self.client.set(self.prefix + key, json.dumps(value), ex=max(int(self.ttl), 1))
+
+    async def delete(self, keys: Iterable[str]):
+        keys = [self.prefix + key for key in keys]
+        if keys:
+            await self.client.delete(*keys)
+
+    async def close(self):
+        await self.client.aclose()
+
+
+class _Counter:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def to_dict(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+class CachedJobStore(AsyncJobStore):
+    """
+    ``AsyncJobStore`` that serves repeat reads from a cache.
+
+    Cached: ``get_job`` (rows by id), ``check_job_exists`` (the URL index)
+    and ``get_jobs_page``. Every other call passes straight through; writes
+    drop the entries they could have changed.
+
+    Args:
+        store: Backend store to read through to
+        cache: Cache backend (defaults to an in-process ``LRUCache``)
+    """
+
+    def __init__(self, store: AsyncJobStore, cache: Optional[CacheBackend] = None):
+        self.store = store
+        self.cache = cache or LRUCache()
+        self._counters = {name: _Counter() for name in ("job", "url", "page")}
+
+    @classmethod
+    def from_config(cls, store: AsyncJobStore) -> "CachedJobStore":
+        """Wrap ``store`` with the backend selected by ``DB_CACHE_REDIS_URL``"""
+        if config.DB_CACHE_REDIS_URL:
+            logger.info("🗃️ Job cache shared through Redis")
+            return cls(store, RedisCache(config.DB_CACHE_REDIS_URL))
+        return cls(store)
+
+    def stats(self) -> Dict:
+        """Hit/miss counters per cached read"""
+        stats = {name: counter.to_dict() for name, counter in self._counters.items()}
+        if isinstance(self.cache, LRUCache):
+            stats["entries"] = len(self.cache)
+            stats["evictions"] = self.cache.evictions
+        return stats
+
+    async def close(self):
+        await self.cache.close()
+        await self.store.close()
+
+    async def _read(self, kind: str, key: str, load):
+        value = await self.cache.get(key)
+        if value is not _MISSING:
+            self._counters[kind].hits += 1
+            return value
+        self._counters[kind].misses += 1
+        value = await load()
+        if value is not None:
+            await self.cache.set(key, value)
+        return value
+
+    async def _page_generation(self) -> int:
+        generation = await self.cache.get("pages:gen")
+        return 0 if generation is _MISSING else generation
+
+    async def _invalidate(self, job_ids: Iterable[int] = (), urls: Iterable[str] = ()):
+        """Drop cached rows for these jobs and every cached list page"""
+        keys = []
+        for job_id in job_ids:
+            keys.append(f"job:{job_id}")
+            url = await self.cache.get(f"job_url:{job_id}")
+            if url is not _MISSING:
+                keys.append(f"url:{url}")
+        keys.extend(f"url:{url}" for url in urls)
+        await self.cache.delete(keys)
+        # A fresh, never reused generation: pages cached under an old one
+        # are unreachable even if the generation key itself expires
+        await self.cache.set("pages:gen", time.time_ns())
+
+    # -- cached reads -------------------------------------------------------
+
+    async def get_job(self, job_id: int) -> Optional[Dict]:
+        return await self._read("job", f"job:{job_id}", lambda: self.store.get_job(job_id))
+
+    async def check_job_exists(self, url: str) -> Optional[Dict]:
+        row = await self._read(
+            "url", f"url:{url}", lambda: self.store.check_job_exists(url)
+        )
+        if row is not None:
+            # Lets an invalidation by id find this URL entry
+            await self.cache.set(f"job_url:{row['id']}", url)
+        return row
+
+    async def get_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        columns: str = JOB_LIST_COLUMNS,
+        since: Optional[str] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        generation = await self._page_generation()
+        key = f"page:{generation}:{limit}:{cursor}:{columns}:{since}"
+        rows, next_cursor = await self._read(
+            "page",
+            key,
+            lambda: self.store.get_jobs_page(limit, cursor, columns, since),
+        )
+        return rows, next_cursor
+
+    # -- writes (invalidate) ------------------------------------------------
+
+    async def save_job(self, job_data: Dict) -> int:
+        job_id = await self.store.save_job(job_data)
+        await self._invalidate([job_id] if job_id else [], [job_data["url"]])
+        return job_id
+
+    async def save_jobs(
+        self, jobs: Iterable[Dict], batch_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        saved = await self.store.save_jobs(jobs, batch_size)
+        await self._invalidate(saved.values(), saved.keys())
+        return saved
+
+    async def update_job_content(self, job_id: int, job_data: Dict):
+        await self.store.update_job_content(job_id, job_data)
+        await self._invalidate([job_id], [job_data["url"]] if job_data.get("url") else [])
+
+    async def mark_jobs_closed(self, job_ids: List[int]):
+        await self.store.mark_jobs_closed(job_ids)
+        if job_ids:
+            await self._invalidate(job_ids)
+
+    async def delete_job(self, job_id: int) -> bool:
+        deleted = await self.store.delete_job(job_id)
+        await self._invalidate([job_id])
+        return deleted
+
+    # -- pass-through -------------------------------------------------------
+
+    async def get_existing_jobs(
+        self, urls: List[str], chunk_size: int = 200
+    ) -> Dict[str, Dict]:
+        return await self.store.get_existing_jobs(urls, chunk_size)
+
+    async def get_open_jobs(self, after_id: int = 0, limit: int = 200) -> List[Dict]:
+        return await self.store.get_open_jobs(after_id, limit)
+
+    async def search_jobs(
+        self,
+        query: str = "",
+        skills: Iterable[str] = (),
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[Dict], int]:
+        return await self.store.search_jobs(query, skills, limit, offset)
+
+    async def save_generated_cv(self, job_id: int, original_cv: str, tailored_cv: str):
+        return await self.store.save_generated_cv(job_id, original_cv, tailored_cv)
+
+    async def save_generated_cvs(
+        self, cvs: Iterable[Tuple[int, str, str]], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        return await self.store.save_generated_cvs(cvs, batch_size)
+
+    async def get_generated_cv_ids(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        return await self.store.get_generated_cv_ids(job_ids, batch_size)
+
+    async def delete_generated_cvs(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ):
+        return await self.store.delete_generated_cvs(job_ids, batch_size)
+
+    async def create_user(self, email: str, hashed_password: str) -> int:
+        return await self.store.create_user(email, hashed_password)
+
+    async def get_user_by_email(self, email: str) -> Optional[Dict]:
+        return await self.store.get_user_by_email(email)
@@ -0,0 +1,242 @@
+"""
+Browserless extraction of job fields from server-rendered HTML.
+
+Runs the same selector table as the Playwright path over raw HTML using the
+standard library parser. Supported selector syntax is the subset the table
+uses: tag names, ``.class``, ``#id``, ``[attr]``, ``[attr="v"]``,
+``[attr*="v"]`` and the descendant combinator (whitespace).
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "source", "track", "wbr",
+}
+
+# Elements whose text is never rendered
+HIDDEN_TAGS = {"script", "style", "template", "noscript", "head"}
+
+# Elements that start a new line in innerText
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl",
+    "dt", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "tr",
+    "ul",
+}
+
+_COMPOUND_RE = re.compile(
+    r"""
+    (?P<tag>^[a-zA-Z][a-zA-Z0-9-]*)
+    | \.(?P<cls>[\w-]+)
+    | \#(?P<id>[\w-]+)
+    | \[(?P<attr>[\w-]+)(?:(?P<op>\*?=)["']?(?P<val>[^"'\]]*)["']?)?\]
+    """,
+    re.VERBOSE,
+)
+
+
+class _Compound:
+    """One compound selector, e.g. ``a.topcard__org-name-link[href]``"""
+
+    def __init__(self, text: str):
+        self.tag: Optional[str] = None
+        self.classes: List[str] = []
+        self.id: Optional[str] = None
+        self.attrs: List[Tuple[str, Optional[str], Optional[str]]] = []
+
+        pos = 0
+        while pos < len(text):
+            match = _COMPOUND_RE.match(text, pos)
+            if not match:
+                raise ValueError(f"Unsupported selector: {text!r}")
+            if match.group("tag"):
+                self.tag = match.group("tag").lower()
+            elif match.group("cls"):
+                self.classes.append(match.group("cls"))
+            elif match.group("id"):
+                self.id = match.group("id")
+            else:
+                self.attrs.append(
+                    (match.group("attr").lower(), match.group("op"), match.group("val"))
+                )
+            pos = match.end()
+
+    def matches(self, tag: str, attrs: Dict[str, str]) -> bool:
+        if self.tag and self.tag != tag:
+            return False
+        if self.id and attrs.get("id") != self.id:
+            return False
+        if self.classes:
+            classes = attrs.get("class", "").split()
+            if any(c not in classes for c in self.classes):
+                return False
+        for name, op, value in self.attrs:
+            if name not in attrs:
+                return False
+            if op == "=" and attrs[name] != value:
+                return False
+            if op == "*=" and value not in attrs[name]:
+                return False
+        return True
+
+
+class Selector:
+    """A descendant-combinator chain of compound selectors"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.parts = [_Compound(part) for part in text.split()]
+
+    def matches(self, tag: str, attrs: Dict[str, str], ancestors: List) -> bool:
+        if not self.parts[-1].matches(tag, attrs):
+            return False
+        # Remaining parts must match ancestors, innermost first
+        remaining = self.parts[:-1]
+        for anc_tag, anc_attrs in reversed(ancestors):
+            if not remaining:
+                break
+            if remaining[-1].matches(anc_tag, anc_attrs):
+                remaining.pop()
+        return not remaining
+
+
+class _Capture:
+    def __init__(self, key: Tuple[str, int], depth: int):
+        self.key = key
+        self.depth = depth
+        self.chunks: List[str] = []
+
+
+class _FieldParser(HTMLParser):
+    def __init__(self, selectors: Dict[str, List[Selector]]):
+        super().__init__(convert_charrefs=True)
+        self.selectors = selectors
+        self.stack: List[Tuple[str, Dict[str, str]]] = []
+        self.found: Dict[Tuple[str, int], str] = {}
+        self.captures: List[_Capture] = []
+        self.hidden_depth = 0
+        self.title_chunks: List[str] = []
+        self.in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {k: v or "" for k, v in attrs}
+        if tag == "title":
+            self.in_title = True
+        if tag in BLOCK_TAGS:
+            self._emit("\n")
+
+        if tag not in VOID_TAGS:
+            # querySelector semantics: first element in document order wins
+            for field, selectors in self.selectors.items():
+                for index, selector in enumerate(selectors):
+                    key = (field, index)
+                    if key in self.found or any(c.key == key for c in self.captures):
+                        continue
+                    if selector.matches(tag, attrs, self.stack):
+                        self.captures.append(_Capture(key, len(self.stack)))
+            self.stack.append((tag, attrs))
+            if tag in HIDDEN_TAGS:
+                self.hidden_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in BLOCK_TAGS:
+            self._emit("\n")
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self.in_title = False
+        if tag in VOID_TAGS:
+            if tag in BLOCK_TAGS:
+                self._emit("\n")
+            return
+        # Tolerate unclosed elements by popping up to the matching tag
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == tag:
+                break
+        else:
+            return
+        while len(self.stack) > i:
+            closed, _ = self.stack.pop()
+            if closed in HIDDEN_TAGS:
+                self.hidden_depth -= 1
+            if closed in BLOCK_TAGS:
+                self._emit("\n")
+            self._finish_captures(len(self.stack))
+
+    def handle_data(self, data):
+        if self.in_title:
+            self.title_chunks.append(data)
+        if not self.hidden_depth:
+            self._emit(data)
+
+    def _emit(self, text: str):
+        for capture in self.captures:
+            capture.chunks.append(text)
+
+    def _finish_captures(self, depth: int):
+        still_open = []
+        for capture in self.captures:
+            if capture.depth >= depth:
+                self.found[capture.key] = _clean_text("".join(capture.chunks))
+            else:
+                still_open.append(capture)
+        self.captures = still_open
+
+    def close(self):
+        super().close()
+        for capture in self.captures:
+            self.found[capture.key] = _clean_text("".join(capture.chunks))
+        self.captures = []
+
+
+def _clean_text(text: str) -> str:
+    """Approximate innerText whitespace handling"""
+    lines = [" ".join(line.split()) for line in text.split("\n")]
+    text = "\n".join(lines)
+    return re.sub(r"\n{2,}", "\n", text).strip()
+
+
+def compile_selectors(field_selectors: Dict[str, List[str]]) -> Dict[str, List[Selector]]:
+    """Compile a selector table, dropping selectors outside the supported subset"""
+    compiled = {}
+    for field, selectors in field_selectors.items():
+        compiled[field] = []
+        for text in selectors:
+            try:
+                compiled[field].append(Selector(text))
+            except ValueError:
+                continue
+    return compiled
+
+
+def extract_fields(html: str, selectors: Dict[str, List[Selector]]) -> Dict:
+    """
+    Extract fields from HTML with a compiled selector table.
+
+    Returns the same shape as the Playwright extraction script:
+    ``{"values": {field: text}, "matched": {field: selector}, "pageTitle": str}``
+    """
+    parser = _FieldParser(selectors)
+    parser.feed(html)
+    parser.close()
+
+    values = {}
+    matched = {}
+    for field, field_selectors in selectors.items():
+        values[field] = None
+        matched[field] = None
+        for index, selector in enumerate(field_selectors):
+            text = parser.found.get((field, index))
+            if text:
+                values[field] = text
+                matched[field] = selector.text
+                break
+
+    return {
+        "values": values,
+        "matched": matched,
+        "pageTitle": " ".join("".join(parser.title_chunks).split()),
+    }
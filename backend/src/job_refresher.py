@@ -0,0 +1,130 @@
+"""
+Incremental re-scrape of stored jobs.
+
+Each open job is fetched again and the hash of its normalized description
+is compared with the stored ``content_hash``. Unchanged postings cost no
+database writes; changed ones are rewritten and their derived artifacts
+(market stats, tailored CV files and ``cv_generations`` rows) invalidated;
+postings LinkedIn answers 404/410 for are marked closed.
+"""
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from . import config
+from .scraper import JOB_CLOSED, JOB_OPEN, content_hash
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RefreshResult:
+    checked: int = 0
+    unchanged: int = 0
+    updated: int = 0
+    closed: int = 0
+    failed: int = 0
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def invalidate_artifacts(job_ids: Iterable[int], data_dir: str = "data"):
+    """
+    Remove files derived from job descriptions that are now out of date.
+
+    The stats file is regenerated on the next ``/api/stats`` request;
+    tailored CVs of changed jobs are regenerated on demand (their database
+    rows are removed by ``refresh_jobs``).
+    """
+    paths = [Path(data_dir) / "stats_data.json"]
+    for job_id in job_ids:
+        paths.append(Path(data_dir) / f"tailored_cv_{job_id}.md")
+        paths.append(Path(data_dir) / f"tailored_cv_{job_id}.pdf")
+    for path in paths:
+        if path.exists():
+            path.unlink()
+            logger.info(f"🗑️ Invalidated {path}")
+
+
+def stored_hash(job: Dict) -> Optional[str]:
+    """
+    Content hash of a stored job.
+
+    Rows saved before hashing existed have no ``content_hash``; their hash
+    is computed from the stored description so they don't all look changed.
+    """
+    if job.get("content_hash"):
+        return job["content_hash"]
+    if job.get("full_description"):
+        return content_hash(job["full_description"])
+    return None
+
+
+async def refresh_jobs(
+    db,
+    scraper,
+    batch_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    data_dir: str = "data",
+) -> RefreshResult:
+    """
+    Re-scrape every open job and write back only what changed.
+
+    Args:
+        db: AsyncDatabase to read open jobs from and write changes to
+        scraper: Object with ``async fetch_job_post(url)`` (a LinkedInScraper)
+        batch_size: Jobs read from the database per page
+        concurrency: Maximum jobs fetched at once
+        data_dir: Directory holding stats and CV artifacts
+
+    Returns:
+        Counts of checked, unchanged, updated, closed and failed jobs
+    """
+    batch_size = batch_size or config.REFRESH_BATCH_SIZE
+    semaphore = asyncio.Semaphore(concurrency or config.REFRESH_CONCURRENCY)
+    result = RefreshResult()
+    changed_ids = []
+
+    async def _fetch(job):
+        async with semaphore:
+            try:
+                return await scraper.fetch_job_post(job["url"])
+            except Exception as e:
+                logger.error(f"❌ Error refreshing {job['url']}: {e}")
+                return None, None
+
+    after_id = 0
+    while True:
+        jobs = await db.get_open_jobs(after_id=after_id, limit=batch_size)
+        if not jobs:
+            break
+        after_id = jobs[-1]["id"]
+
+        closed_ids = []
+        outcomes = await asyncio.gather(*(_fetch(job) for job in jobs))
+        for job, (state, scraped) in zip(jobs, outcomes):
+            result.checked += 1
+            if state == JOB_CLOSED:
+                closed_ids.append(job["id"])
+            elif state != JOB_OPEN:
+                result.failed += 1
+            elif scraped["content_hash"] == stored_hash(job):
+                result.unchanged += 1
+            else:
+                await db.update_job_content(job["id"], scraped)
+                changed_ids.append(job["id"])
+                result.updated += 1
+
+        await db.mark_jobs_closed(closed_ids)
+        result.closed += len(closed_ids)
+
+    if changed_ids:
+        # Otherwise batch_generate_cvs keeps skipping them as already generated
+        await db.delete_generated_cvs(changed_ids)
+        invalidate_artifacts(changed_ids, data_dir)
+    logger.info(f"🔄 Refresh finished: {result.to_dict()}")
+    return result
@@ -1,28 +1,104 @@
 import asyncio
 import random
 import time
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError
 import logging
 from typing import Optional, List, Dict, Any
-from .cookies_manager import CookiesManager
+from .cookies_manager import (
+    READ_SESSION_STORAGE,
+    SESSION_STORAGE_KEY,
+    CookiesManager,
+    playwright_state,
+    session_storage_entry,
+    session_storage_script,
+)
+from .rate_limiter import AUTHWALL_MARKERS, RateLimiter, rate_limiter as shared_rate_limiter
 
 logger = logging.getLogger(__name__)
 
 
+# Realistic browser settings shared by every authenticated context
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1920, "height": 1080},
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "locale": "en-US",
+    "timezone_id": "America/New_York",
+    "permissions": ["geolocation"],
+    "java_script_enabled": True,
+    "bypass_csp": True,
+    "screen": {"width": 1920, "height": 1080},
+}
+
+STEALTH_SCRIPT = """
+// Remove automation flags
+delete navigator.__proto__.webdriver;
+
+// Mock languages
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en']
+});
+
+// Mock plugins
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [1, 2, 3, 4, 5]
+});
+
+// Mock Chrome
+window.chrome = {
+    runtime: {},
+    loadTimes: function() {
+        return {
+            requestTime: 0,
+            startLoadTime: 0,
+            commitLoadTime: 0,
+            finishDocumentLoadTime: 0,
+            finishLoadTime: 0,
+            firstPaintTime: 0,
+            firstPaintAfterLoadTime: 0,
+            navigationType: "Other"
+        };
+    }
+};
+"""
+
+
 class LinkedInAuth:
-    def __init__(self, headless: bool = False, slow_mo: int = 100):
+    def __init__(
+        self,
+        headless: bool = False,
+        slow_mo: int = 100,
+        rate_limiter: Optional[RateLimiter] = None,
+        cookies_file: str = "data/cookies.json",
+    ):
         self.headless = headless
         self.slow_mo = slow_mo
-        self.cookies_manager = CookiesManager()
+        self.cookies_manager = CookiesManager(cookies_file)
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.playwright = None
         self.browser: Optional[Browser] = None
-        self.context = None
+        self.context: Optional[BrowserContext] = None
+        self._context_state: Optional[Dict[str, Any]] = None
+
+    @property
+    def session_id(self) -> str:
+        """Rate-limiter session key: one per cookie jar (LinkedIn account)"""
+        return self.cookies_manager.cookies_file
+
+    async def goto(self, page: Page, url: str, **kwargs):
+        """Navigate through the shared rate limiter, reporting the outcome back"""
+        await self.rate_limiter.acquire(url, session=self.session_id)
+        response = await page.goto(url, **kwargs)
+        self.rate_limiter.observe(
+            url, response.status if response else None, page.url, session=self.session_id
+        )
+        return response
 
     async def init_browser(self):
         """Initialize browser with human-like settings"""
-        playwright = await async_playwright().start()
+        self.playwright = await async_playwright().start()
 
         # Launch browser with stealth-like settings
-        self.browser = await playwright.chromium.launch(
+        self.browser = await self.playwright.chromium.launch(
             headless=self.headless,
             slow_mo=self.slow_mo,
             args=[
@@ -32,58 +108,60 @@ class LinkedInAuth:
                 "--disable-dev-shm-usage",
             ],
         )
+        await self._open_main_context()
 
-        # Create context with realistic settings
-        self.context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            locale="en-US",
-            timezone_id="America/New_York",
-            permissions=["geolocation"],
-            java_script_enabled=True,
-            bypass_csp=True,
-            screen={"width": 1920, "height": 1080},
-        )
-
-        # Add stealth script
-        await self.context.add_init_script(
-            """
-            // Remove automation flags
-            delete navigator.__proto__.webdriver;
-            
-            // Mock languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-            
-            // Mock plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            
-            // Mock Chrome
-            window.chrome = {
-                runtime: {},
-                loadTimes: function() {
-                    return {
-                        requestTime: 0,
-                        startLoadTime: 0,
-                        commitLoadTime: 0,
-                        finishDocumentLoadTime: 0,
-                        finishLoadTime: 0,
-                        firstPaintTime: 0,
-                        firstPaintAfterLoadTime: 0,
-                        navigationType: "Other"
-                    };
-                }
-            };
+    async def new_context(self) -> BrowserContext:
         """
+        Create a context restored from the account's cached storage state
+        (cookies, local and session storage), without touching disk when the
+        snapshot is already in memory.
+        """
+        if not self.browser:
+            await self.init_browser()
+        state = self.cookies_manager.load_storage_state()
+        context = await self.browser.new_context(
+            **CONTEXT_OPTIONS, storage_state=playwright_state(state)
         )
+        await context.add_init_script(STEALTH_SCRIPT)
+        restore = session_storage_script(state)
+        if restore:
+            await context.add_init_script(restore)
+        return context
+
+    async def _open_main_context(self):
+        # Remember which snapshot the context was built from
+        self._context_state = self.cookies_manager.load_storage_state()
+        self.context = await self.new_context()
+
+    async def save_session(self):
+        """Snapshot the live context's storage state for this account"""
+        state = await self.context.storage_state()
+        state[SESSION_STORAGE_KEY] = await self._read_session_storage()
+        self.cookies_manager.save_storage_state(state)
+        self._context_state = state
+
+    async def _read_session_storage(self) -> List[Dict[str, Any]]:
+        """sessionStorage of the context's open tabs, one entry per origin"""
+        entries = {}
+        for page in self.context.pages:
+            try:
+                entry = session_storage_entry(await page.evaluate(READ_SESSION_STORAGE))
+            except Exception as e:
+                logger.warning(f"⚠️ Could not read sessionStorage of {page.url}: {e}")
+                continue
+            if entry["origin"].startswith("http") and entry["sessionStorage"]:
+                entries[entry["origin"]] = entry
+        return list(entries.values())
 
     async def close_browser(self):
         """Close browser"""
         if self.browser:
             await self.browser.close()
+            self.browser = None
+            self.context = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
 
     async def human_like_type(
         self, page: Page, selector: str, text: str, delay_range: tuple = (50, 150)
@@ -131,8 +209,11 @@ class LinkedInAuth:
 
         try:
             logger.info("Navigating to LinkedIn login page...")
-            await page.goto(
-                "https://www.linkedin.com/login", wait_until="domcontentloaded", timeout=60000
+            await self.goto(
+                page,
+                "https://www.linkedin.com/login",
+                wait_until="domcontentloaded",
+                timeout=60000,
             )
             await asyncio.sleep(random.uniform(1, 2))
 
@@ -140,8 +221,7 @@ class LinkedInAuth:
             current_url = page.url
             if "feed" in current_url:
                 logger.info("Already logged in - redirected to feed")
-                cookies = await self.context.cookies()
-                self.cookies_manager.save_cookies(cookies)
+                await self.save_session()
                 return True
 
             # Type email
@@ -154,8 +234,9 @@ class LinkedInAuth:
             await self.human_like_type(page, "input#password", password)
             await asyncio.sleep(random.uniform(0.5, 1))
 
-            # Click sign in button
+            # Click sign in button (submitting navigates, so it needs a slot too)
             logger.info("Clicking sign in button...")
+            await self.rate_limiter.acquire(page.url, session=self.session_id)
             await self.human_like_click(page, 'button[type="submit"]')
 
             # Wait for navigation with multiple possible outcomes
@@ -178,9 +259,8 @@ class LinkedInAuth:
                 # Additional wait to ensure page is fully loaded
                 await asyncio.sleep(2)
 
-                # Get and save cookies
-                cookies = await self.context.cookies()
-                self.cookies_manager.save_cookies(cookies)
+                # Snapshot cookies and local storage
+                await self.save_session()
 
                 return True
 
@@ -235,27 +315,26 @@ class LinkedInAuth:
 
         if not self.browser or not self.context:
             await self.init_browser()
+        elif self.cookies_manager.load_storage_state() is not self._context_state:
+            # Snapshot changed since the context was built (e.g. another
+            # process logged in); restart from the new one
+            await self.context.close()
+            await self._open_main_context()
 
         page = await self.context.new_page()
 
         try:
-            # Load ALL cookies
-            cookies = self.cookies_manager.load_cookies()
-            if not cookies:
-                logger.warning("No cookies loaded")
-                return False
-
-            await self.context.add_cookies(cookies)
-            logger.info(f"Added {len(cookies)} cookies to context")
-
             # Navigate to LinkedIn feed directly
             logger.info("Navigating to LinkedIn feed to test cookies...")
-            await page.goto(
-                "https://www.linkedin.com/feed/", wait_until="domcontentloaded", timeout=60000
+            await self.goto(
+                page,
+                "https://www.linkedin.com/feed/",
+                wait_until="domcontentloaded",
+                timeout=60000,
             )
-            await asyncio.sleep(3)
 
-            # Check multiple indicators of successful login
+            # Wait for any indicator of a successful login instead of a
+            # fixed sleep; a login wall never shows one
             success_indicators = [
                 'button[aria-label="Me"]',
                 'button[aria-label="My Network"]',
@@ -264,15 +343,18 @@ class LinkedInAuth:
                 "div#global-nav",
                 'img[alt*="profile"]',
             ]
-
-            for indicator in success_indicators:
+            if not any(m in page.url for m in AUTHWALL_MARKERS):
                 try:
-                    element = await page.query_selector(indicator)
+                    element = await page.wait_for_selector(
+                        ", ".join(success_indicators), state="attached", timeout=8000
+                    )
                     if element:
-                        logger.info(f"✅ Found login indicator: {indicator}")
+                        logger.info("✅ Found login indicator")
+                        # Keep rotated cookies and local storage
+                        await self.save_session()
                         return True
-                except Exception as e:
-                    continue
+                except TimeoutError:
+                    pass
 
             # If we reach here, check what page we're actually on
             current_url = page.url
@@ -294,7 +376,12 @@ class LinkedInAuth:
             await page.close()
 
     async def get_authenticated_context(self):
-        """Get a context with valid authentication"""
+        """
+        Get a context with valid authentication.
+
+        Validates the cookies on every call; ``AuthSessionManager`` caches
+        the validated context instead.
+        """
         if await self.is_logged_in():
             return self.context
         else:
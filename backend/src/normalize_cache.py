@@ -0,0 +1,104 @@
+"""
+On-disk cache of normalised (lemmatised) job descriptions.
+
+Normalising a description with spaCy is the slowest step of a stats run,
+and almost every description is unchanged between runs. Results are
+stored in a local SQLite file keyed by the SHA-256 of the raw description
+and the normalisation pipeline version, so a run only lemmatises new or
+edited descriptions, and changing the model, SYNONYMS or
+COMMON_IRRELEVANT_TERMS invalidates every entry at once.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from . import config
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS normalized_text (
+    version    TEXT NOT NULL,
+    text_hash  TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    PRIMARY KEY (version, text_hash)
+) WITHOUT ROWID;
+"""
+
+# Keys per SELECT ... IN (...) (SQLite's default variable limit is 999+)
+_CHUNK = 500
+
+
+def text_hash(text: str) -> str:
+    """Cache key of a raw description (exact text, so output is identical)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class NormalizedTextCache:
+    """
+    ``(pipeline version, description hash) -> normalised text`` store.
+
+    Args:
+        path: SQLite file (defaults to ``STATS_NORMALIZE_CACHE_PATH``)
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or config.STATS_NORMALIZE_CACHE_PATH
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self._conn.close()
+
+    def get_many(self, version: str, hashes: Iterable[str]) -> Dict[str, str]:
+        """Cached normalised text for the given description hashes"""
+        hashes = list(dict.fromkeys(hashes))
+        found = {}
+        with self._lock:
+            for i in range(0, len(hashes), _CHUNK):
+                chunk = hashes[i : i + _CHUNK]
+                found.update(
+                    self._conn.execute(
+                        "SELECT text_hash, normalized FROM normalized_text "
+                        f"WHERE version = ? AND text_hash IN ({', '.join('?' for _ in chunk)})",
+                        (version, *chunk),
+                    ).fetchall()
+                )
+        return found
+
+    def put_many(self, version: str, items: Iterable[Tuple[str, str]]):
+        """Store ``(description hash, normalised text)`` pairs"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO normalized_text (version, text_hash, normalized) "
+                    "VALUES (?, ?, ?)",
+                    [(version, h, normalized) for h, normalized in items],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def prune(self, version: str) -> int:
+        """Drop entries written by other pipeline versions; returns how many"""
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("DELETE FROM normalized_text WHERE version != ?", (version,))
+            removed = self._conn.total_changes - before
+        if removed:
+            logger.info(f"🧹 Dropped {removed} normalised texts from older pipelines")
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM normalized_text").fetchone()[0]
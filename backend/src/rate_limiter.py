@@ -0,0 +1,230 @@
+"""
+Shared politeness scheduler for LinkedIn traffic.
+
+Every page navigation and HTTP fetch to a rate-limited host first calls
+``rate_limiter.acquire(url, session)``, which waits on a token bucket for
+the host and, for logged-in traffic, one for the session (cookie jar).
+After the response, ``rate_limiter.observe(...)`` reports the outcome: a
+429/999 status or an unexpected login wall slows that host and session
+down, and every clean response lets the rate recover towards its budget.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from . import config
+
+logger = logging.getLogger(__name__)
+
+# Statuses LinkedIn answers with when it wants us to back off
+THROTTLE_STATUSES = (429, 999)
+
+# Final URLs meaning we were bounced to a login wall
+AUTHWALL_MARKERS = ("/authwall", "/login", "/checkpoint", "/signup")
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of rejecting.
+
+    Tokens may go negative: each caller takes one and waits until the
+    bucket would have refilled it, so concurrent callers queue up in order.
+    """
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.slowdown = 1.0
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+
+    @property
+    def effective_rate(self) -> float:
+        return self.rate / self.slowdown
+
+    def reserve(self) -> float:
+        """Take a token; returns seconds to wait before using it"""
+        now = self.clock()
+        rate = self.effective_rate
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / rate
+
+    def throttle(self, max_slowdown: float):
+        """Halve the rate and drop any saved-up burst"""
+        self.slowdown = min(self.slowdown * 2, max_slowdown)
+        self.tokens = min(self.tokens, 0.0)
+
+    def recover(self, factor: float):
+        """Move the rate a step back towards the configured budget"""
+        self.slowdown = max(1.0, self.slowdown * factor)
+
+
+class _WaitStats:
+    def __init__(self):
+        self.requests = 0
+        self.throttled = 0
+        self.waiting = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def to_dict(self, bucket: TokenBucket) -> Dict:
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "waiting": self.waiting,
+            "avg_wait_seconds": round(self.total_wait / self.requests, 3) if self.requests else 0.0,
+            "max_wait_seconds": round(self.max_wait, 3),
+            "rate_per_second": round(bucket.effective_rate, 3),
+            "slowdown": round(bucket.slowdown, 2),
+        }
+
+
+class RateLimiter:
+    """
+    Per-host and per-session token buckets with jitter and adaptive slowdown.
+
+    Only hosts matching ``hosts`` (domain or subdomain) are limited; any
+    other URL passes straight through.
+    """
+
+    def __init__(
+        self,
+        hosts: Optional[list] = None,
+        host_rate: Optional[float] = None,
+        host_burst: Optional[int] = None,
+        session_rate: Optional[float] = None,
+        session_burst: Optional[int] = None,
+        jitter: Optional[float] = None,
+        max_slowdown: Optional[float] = None,
+        recovery: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.hosts = config.RATE_LIMIT_HOSTS if hosts is None else hosts
+        self.host_rate = host_rate or config.RATE_LIMIT_HOST_RPS
+        self.host_burst = host_burst or config.RATE_LIMIT_HOST_BURST
+        self.session_rate = session_rate or config.RATE_LIMIT_SESSION_RPS
+        self.session_burst = session_burst or config.RATE_LIMIT_SESSION_BURST
+        self.jitter = config.RATE_LIMIT_JITTER_SECONDS if jitter is None else jitter
+        self.max_slowdown = max_slowdown or config.RATE_LIMIT_MAX_SLOWDOWN
+        self.recovery = recovery or config.RATE_LIMIT_RECOVERY
+        self.clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, _WaitStats] = {}
+
+    def _limited_host(self, url: str) -> Optional[str]:
+        host = (urlparse(url).hostname or "").lower()
+        for domain in self.hosts:
+            if host == domain or host.endswith("." + domain):
+                return host
+        return None
+
+    def _bucket(self, key: str) -> TokenBucket:
+        if key not in self._buckets:
+            if key.startswith("session:"):
+                bucket = TokenBucket(self.session_rate, self.session_burst, self.clock)
+            else:
+                bucket = TokenBucket(self.host_rate, self.host_burst, self.clock)
+            self._buckets[key] = bucket
+            self._stats[key] = _WaitStats()
+        return self._buckets[key]
+
+    def _keys(self, host: str, session: Optional[str]):
+        keys = [f"host:{host}"]
+        if session:
+            keys.append(f"session:{session}")
+        return keys
+
+    async def acquire(self, url: str, session: Optional[str] = None) -> float:
+        """
+        Wait until a request to ``url`` fits the host and session budgets.
+
+        Args:
+            url: URL about to be requested
+            session: Identifier of the logged-in session making the request,
+                or None for anonymous traffic
+
+        Returns:
+            Seconds spent waiting
+        """
+        host = self._limited_host(url)
+        if not host:
+            return 0.0
+
+        keys = self._keys(host, session)
+        delay = max(self._bucket(key).reserve() for key in keys)
+        if delay > 0 and self.jitter:
+            delay += random.uniform(0, self.jitter)
+
+        for key in keys:
+            self._stats[key].requests += 1
+            self._stats[key].waiting += 1
+        started = self.clock()
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+        finally:
+            waited = self.clock() - started
+            for key in keys:
+                stats = self._stats[key]
+                stats.waiting -= 1
+                stats.total_wait += waited
+                stats.max_wait = max(stats.max_wait, waited)
+        return waited
+
+    def observe(
+        self,
+        url: str,
+        status: Optional[int] = None,
+        final_url: Optional[str] = None,
+        session: Optional[str] = None,
+    ) -> bool:
+        """
+        Feed a response back into the scheduler.
+
+        Args:
+            url: URL that was requested
+            status: HTTP status of the response, if any
+            final_url: URL after redirects
+            session: Session that made the request
+
+        Returns:
+            True if the response was a throttling signal
+        """
+        host = self._limited_host(url)
+        if not host:
+            return False
+
+        authwall = bool(final_url) and any(
+            m in final_url and m not in url for m in AUTHWALL_MARKERS
+        )
+        throttled = status in THROTTLE_STATUSES or authwall
+        for key in self._keys(host, session):
+            bucket = self._bucket(key)
+            if throttled:
+                bucket.throttle(self.max_slowdown)
+                self._stats[key].throttled += 1
+            else:
+                bucket.recover(self.recovery)
+
+        if throttled:
+            reason = f"status {status}" if status in THROTTLE_STATUSES else "login wall"
+            logger.warning(
+                f"🐢 Throttled by {host} ({reason}); now at "
+                f"{self._buckets[f'host:{host}'].effective_rate:.2f} req/s"
+            )
+        return throttled
+
+    def stats(self) -> Dict[str, Dict]:
+        """Queue-wait and throttling metrics per host and per session"""
+        return {key: self._stats[key].to_dict(bucket) for key, bucket in self._buckets.items()}
+
+
+# Shared by every scraper, crawler and auth session in the process
+rate_limiter = RateLimiter()
@@ -0,0 +1,159 @@
+import logging
+from collections import Counter
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import Route, Request, Response
+
+from . import config
+
+logger = logging.getLogger(__name__)
+
+# Analytics, ads and tag managers seen on LinkedIn job pages
+TRACKER_DOMAINS = {
+    "px.ads.linkedin.com",
+    "dc.ads.linkedin.com",
+    "snap.licdn.com",
+    "analytics.pointdrive.linkedin.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "bat.bing.com",
+    "ads.yahoo.com",
+    "adservice.google.com",
+    "scorecardresearch.com",
+    "hotjar.com",
+}
+
+# Rough transfer size of an aborted request, used to estimate bytes saved.
+# Aborted requests never reach the network, so their real size is unknown.
+ESTIMATED_BYTES = {
+    "image": 40_000,
+    "media": 250_000,
+    "font": 35_000,
+    "stylesheet": 30_000,
+    "script": 40_000,
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+
+def _matches_domain(host: str, domains: Iterable[str]) -> bool:
+    """True if ``host`` equals or is a subdomain of any of ``domains``"""
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+class TrafficStats:
+    """Per-page counters of blocked and loaded requests"""
+
+    def __init__(self):
+        self.blocked = 0
+        self.blocked_by_type: Counter = Counter()
+        self.bytes_saved = 0
+        self.bytes_loaded = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "blocked_requests": self.blocked,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "estimated_bytes_saved": self.bytes_saved,
+            "bytes_loaded": self.bytes_loaded,
+        }
+
+
+class RequestFilter:
+    """
+    Route-interception policy that aborts requests the scraper never reads.
+
+    A request is blocked when its resource type is in ``blocked_types`` or
+    its host is a known tracker / in ``blocked_domains``. Hosts listed in
+    ``allowed_domains`` and top-level documents are always let through.
+    """
+
+    def __init__(
+        self,
+        blocked_types: Optional[Iterable[str]] = None,
+        blocked_domains: Optional[Iterable[str]] = None,
+        allowed_domains: Optional[Iterable[str]] = None,
+    ):
+        self.blocked_types = set(
+            config.SCRAPER_BLOCKED_RESOURCE_TYPES
+            if blocked_types is None
+            else blocked_types
+        )
+        self.blocked_domains = TRACKER_DOMAINS | set(
+            config.SCRAPER_BLOCKED_DOMAINS
+            if blocked_domains is None
+            else blocked_domains
+        )
+        self.allowed_domains = set(
+            config.SCRAPER_ALLOWED_DOMAINS
+            if allowed_domains is None
+            else allowed_domains
+        )
+        # Totals across every page this filter was attached to
+        self.totals = TrafficStats()
+        self.pages = 0
+
+    @classmethod
+    def from_config(cls) -> Optional["RequestFilter"]:
+        """Build the filter from settings, or None when blocking is disabled"""
+        if not config.SCRAPER_BLOCK_RESOURCES:
+            return None
+        return cls()
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Decide whether a request should be aborted"""
+        if resource_type == "document":
+            return False
+        host = (urlparse(url).hostname or "").lower()
+        if _matches_domain(host, self.allowed_domains):
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return _matches_domain(host, self.blocked_domains)
+
+    async def attach(self, page) -> TrafficStats:
+        """
+        Install the filter on a page (or context) and return its live stats.
+
+        Args:
+            page: Playwright Page or BrowserContext to intercept requests on
+        """
+        stats = TrafficStats()
+        self.pages += 1
+
+        async def _handle(route: Route, request: Request):
+            if self.should_block(request.url, request.resource_type):
+                saved = ESTIMATED_BYTES.get(
+                    request.resource_type, DEFAULT_ESTIMATED_BYTES
+                )
+                for counters in (stats, self.totals):
+                    counters.blocked += 1
+                    counters.blocked_by_type[request.resource_type] += 1
+                    counters.bytes_saved += saved
+                await route.abort()
+            else:
+                await route.continue_()
+
+        def _on_response(response: Response):
+            try:
+                size = int(response.headers.get("content-length", 0))
+            except ValueError:
+                size = 0
+            stats.bytes_loaded += size
+            self.totals.bytes_loaded += size
+
+        await page.route("**/*", _handle)
+        page.on("response", _on_response)
+        return stats
+
+    def log_stats(self, stats: TrafficStats, url: str):
+        logger.info(
+            f"🚫 Blocked {stats.blocked} request(s) on {url} "
+            f"(~{stats.bytes_saved // 1024} KB saved, "
+            f"{stats.bytes_loaded // 1024} KB loaded)"
+        )
@@ -1,59 +1,371 @@
+import asyncio
+import hashlib
+import json
 import logging
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+import httpx
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-from typing import Optional
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+from . import config
+from .browser_pool import BrowserPool, CHROMIUM_ARGS
+from .html_extractor import compile_selectors, extract_fields
+from .rate_limiter import AUTHWALL_MARKERS, RateLimiter, rate_limiter as shared_rate_limiter
+from .request_filter import RequestFilter
+from .session_manager import AuthSessionManager
+from .session_registry import SessionRegistry
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1920, "height": 1080},
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+}
+
+_DEFAULT_SELECTORS_PATH = str(Path(__file__).with_name("job_selectors.json"))
+
+
+def load_selector_table(path: Optional[str] = None) -> Dict:
+    """
+    Load the versioned selector table.
+
+    The table maps each extracted field to an ordered list of CSS selectors
+    (first non-empty match wins). It lives in ``job_selectors.json`` so
+    selectors can be updated without touching the scraping code; set
+    ``SCRAPER_SELECTORS_PATH`` to use a different file.
+    """
+    path = path or config.SCRAPER_SELECTORS_PATH or _DEFAULT_SELECTORS_PATH
+    with open(path, "r", encoding="utf-8") as f:
+        table = json.load(f)
+    logger.info(f"🧭 Loaded selector table v{table.get('version')} from {path}")
+    return table
+
+SELECTOR_TABLE = load_selector_table()
+FIELD_SELECTORS: Dict[str, List[str]] = SELECTOR_TABLE["fields"]
+TITLE_SELECTORS = FIELD_SELECTORS["title"]
+DESCRIPTION_SELECTORS = FIELD_SELECTORS["description"]
+
+# "See more" toggles for the logged-in and guest layouts
+SEE_MORE_SELECTORS = SELECTOR_TABLE.get("see_more", [])
+
+# Same table compiled for the browserless HTML parser
+COMPILED_SELECTORS = compile_selectors(FIELD_SELECTORS)
+
+# Resolves once any title selector and any description selector is present
+_READY_SCRIPT = """([titles, descriptions]) => {
+    const present = (selectors) => selectors.some((s) => document.querySelector(s));
+    return present(titles) && present(descriptions);
+}"""
+
+# Resolves once the clicked "See more" toggle reports it has expanded
+_EXPANDED_SCRIPT = """(button) => !button.isConnected
+    || button.getAttribute('aria-expanded') === 'true'
+    || /less/i.test(button.innerText)"""
+
+# Extracts every field in a single round trip: for each field, the text of
+# the first selector that matches a non-empty element
+_EXTRACT_SCRIPT = """(fields) => {
+    const values = {};
+    const matched = {};
+    for (const [field, selectors] of Object.entries(fields)) {
+        values[field] = null;
+        matched[field] = null;
+        for (const selector of selectors) {
+            let element = null;
+            try {
+                element = document.querySelector(selector);
+            } catch (e) {
+                continue;
+            }
+            const text = element ? (element.innerText || "").trim() : "";
+            if (text) {
+                values[field] = text;
+                matched[field] = selector;
+                break;
+            }
+        }
+    }
+    return {values, matched, pageTitle: document.title};
+}"""
+
+
+# Outcome of fetching a job post
+JOB_OPEN = "open"
+JOB_CLOSED = "closed"
+JOB_UNKNOWN = "unknown"
+
+# Responses meaning the posting has been taken down
+GONE_STATUSES = (404, 410)
+
+
+def content_hash(description: str) -> str:
+    """
+    Hash of a job description with whitespace and case normalized, so a
+    re-scrape of an unchanged posting hashes the same.
+    """
+    normalized = " ".join(description.split()).lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def build_job_record(
+    fields: Dict[str, Optional[str]], page_title: str, url: str
+) -> Optional[dict]:
+    """
+    Turn extracted field texts into the job dictionary stored in the database.
+
+    Falls back to the page title ("Job Title | Company | LinkedIn") for the
+    title and company. Returns None when title or description is missing.
+    """
+    meta_title = None
+    meta_company = None
+    if page_title and "|" in page_title:
+        parts = page_title.split("|")
+        if len(parts) >= 2:
+            meta_title = parts[0].strip()
+            meta_company = parts[1].strip()
+
+    title = fields.get("title")
+    if not title and meta_title:
+        logger.info(f"Using fallback title from metadata: {meta_title}")
+        title = meta_title
+
+    description = fields.get("description")
+    poster = fields.get("poster") or "Not publicly available"
+
+    company = fields.get("company")
+    if not company and meta_company:
+        logger.info(f"Using fallback company from metadata: {meta_company}")
+        company = meta_company
+
+    # Validate we got minimum required data
+    if not title or not description:
+        logger.error("❌ Failed to extract minimum required data (title or description)")
+        return None
+
+    return {
+        "title": title,
+        "description": description[:500] + "..." if len(description) > 500 else description,
+        "full_description": description,
+        "poster": poster,
+        "company": company or "Unknown",
+        "url": url,
+        "content_hash": content_hash(description),
+    }
+
+
+class GuestJobFetcher:
+    """
+    Browserless fast path for public job pages.
+
+    Anonymous job views are server-rendered, so the title, company and
+    description can be read from the HTML without starting Chromium. A
+    single pooled ``httpx.AsyncClient`` (HTTP/2 when available) is reused
+    for every request. Requests are paced by the shared ``RateLimiter``.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_connections: int = 20,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.timeout = timeout or config.SCRAPER_HTTP_TIMEOUT
+        self.max_connections = max_connections
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def start(self):
+        """Create the shared HTTP client"""
+        if not self.client:
+            self.client = httpx.AsyncClient(
+                http2=HAS_HTTP2,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                headers={
+                    "User-Agent": CONTEXT_OPTIONS["user_agent"],
+                    "Accept": "text/html,application/xhtml+xml",
+                    "Accept-Language": "en-US,en;q=0.9",
+                },
+            )
+            logger.info(f"✅ HTTP job fetcher ready (HTTP/2: {HAS_HTTP2})")
+
+    async def close(self):
+        """Close the shared HTTP client"""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    async def fetch_page(self, url: str) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Fetch a page.
+
+        Returns:
+            ``(status_code, html)``; html is None unless the response is a
+            200 that did not land on a login wall, and status_code is None
+            if the request itself failed
+        """
+        if not self.client:
+            await self.start()
+        await self.rate_limiter.acquire(url)
+        try:
+            response = await self.client.get(url)
+        except httpx.HTTPError as e:
+            logger.warning(f"⚠️ HTTP fetch failed for {url}: {e}")
+            return None, None
+
+        final_url = str(response.url)
+        self.rate_limiter.observe(url, response.status_code, final_url)
+        if response.status_code != 200 or any(m in final_url for m in AUTHWALL_MARKERS):
+            logger.info(f"HTTP fetch of {url} returned {response.status_code} ({final_url})")
+            return response.status_code, None
+        return response.status_code, response.text
+
+    async def fetch_html(self, url: str) -> Optional[str]:
+        """Fetch a job page, returning None on errors or login redirects"""
+        _, html = await self.fetch_page(url)
+        return html
+
+    async def fetch_job_post(self, url: str) -> Tuple[str, Optional[dict]]:
+        """
+        Fetch and parse a canonical job URL.
+
+        Returns:
+            ``(JOB_OPEN, job)``, ``(JOB_CLOSED, None)`` if the posting is
+            gone, or ``(JOB_UNKNOWN, None)`` if required fields could not
+            be read over HTTP
+        """
+        status, html = await self.fetch_page(url)
+        if status in GONE_STATUSES:
+            return JOB_CLOSED, None
+        if not html:
+            return JOB_UNKNOWN, None
+        extracted = extract_fields(html, COMPILED_SELECTORS)
+        values = extracted["values"]
+        if not values.get("description") or not (
+            values.get("title") or extracted["pageTitle"]
+        ):
+            return JOB_UNKNOWN, None
+        job = build_job_record(values, extracted["pageTitle"], url)
+        return (JOB_OPEN, job) if job else (JOB_UNKNOWN, None)
+
+    async def scrape_job_post(self, url: str) -> Optional[dict]:
+        """Fetch and parse a canonical job URL; None if required fields are missing"""
+        _, job = await self.fetch_job_post(url)
+        return job
+
+
 class LinkedInScraper:
     """
     LinkedIn job scraper that works WITHOUT authentication.
     Scrapes publicly visible job post data only (as anonymous user).
+
+    When a ``BrowserPool`` is given, contexts are borrowed from the shared
+    pool instead of launching a dedicated browser for this scraper.
+    Images, fonts, media, stylesheets and trackers are blocked through a
+    ``RequestFilter`` unless disabled in settings.
+
+    Public job pages are first fetched over plain HTTP with a
+    ``GuestJobFetcher``; Chromium is only used when that misses the title
+    or description. Every navigation waits its turn on the shared
+    ``RateLimiter``.
+
+    When an ``AuthSessionManager`` (or a ``SessionRegistry`` of several
+    accounts) is given, browser scrapes lease a session and open pages in
+    its validated logged-in context instead; a redirect to a login wall
+    invalidates that session so it is re-validated or sidelined.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        pool: Optional[BrowserPool] = None,
+        request_filter: Optional[RequestFilter] = None,
+        fetcher: Optional[GuestJobFetcher] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[Union[AuthSessionManager, SessionRegistry]] = None,
+    ):
         self.browser: Optional[Browser] = None
         self.playwright = None
+        self.pool = pool
+        self.session = session
+        self.request_filter = request_filter or RequestFilter.from_config()
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self._owns_fetcher = fetcher is None
+        if fetcher is None and config.SCRAPER_HTTP_FAST_PATH:
+            fetcher = GuestJobFetcher(rate_limiter=self.rate_limiter)
+        self.fetcher = fetcher
     
     @staticmethod
-    def normalize_linkedin_url(url: str) -> str:
+    def extract_job_id(url: str) -> Optional[str]:
         """
-        Normalize LinkedIn job URLs to canonical format: https://www.linkedin.com/jobs/view/{job_id}
-        
+        Extract the numeric LinkedIn job ID from a job URL.
+
         Handles various URL formats:
         - https://www.linkedin.com/jobs/view/4284088753
+        - https://www.linkedin.com/jobs/view/python-developer-at-acme-4284088753
         - https://www.linkedin.com/jobs/collections/recommended/?currentJobId=4284088753
         - https://www.linkedin.com/jobs/search/?currentJobId=4284088753
-        
+
         Args:
             url: LinkedIn job URL in any format
-            
+
         Returns:
-            Canonical URL format
+            The job ID, or None if the URL does not contain one
         """
         import re
         from urllib.parse import urlparse, parse_qs
-        
-        # Extract job ID from URL
-        job_id = None
-        
+
         # Method 1: Extract from /jobs/view/{id} format
         match = re.search(r'/jobs/view/(\d+)', url)
         if match:
-            job_id = match.group(1)
-        
-        # Method 2: Extract from currentJobId parameter
-        if not job_id:
-            parsed = urlparse(url)
-            params = parse_qs(parsed.query)
-            if 'currentJobId' in params:
-                job_id = params['currentJobId'][0]
-        
-        # Method 3: Extract any sequence of digits after /jobs/
-        if not job_id:
-            match = re.search(r'/jobs/[^/]*/(\d+)', url)
-            if match:
-                job_id = match.group(1)
-        
+            return match.group(1)
+
+        # Method 2: Extract from /jobs/view/{slug}-{id} format (search results)
+        match = re.search(r'/jobs/view/[^/?#]*-(\d+)(?:[/?#]|$)', url)
+        if match:
+            return match.group(1)
+
+        # Method 3: Extract from currentJobId parameter
+        parsed = urlparse(url)
+        params = parse_qs(parsed.query)
+        if 'currentJobId' in params:
+            return params['currentJobId'][0]
+
+        # Method 4: Extract any sequence of digits after /jobs/
+        match = re.search(r'/jobs/[^/]*/(\d+)', url)
+        if match:
+            return match.group(1)
+
+        return None
+
+    @classmethod
+    def normalize_linkedin_url(cls, url: str) -> str:
+        """
+        Normalize LinkedIn job URLs to canonical format: https://www.linkedin.com/jobs/view/{job_id}
+
+        See ``extract_job_id`` for the supported URL formats.
+
+        Args:
+            url: LinkedIn job URL in any format
+            
+        Returns:
+            Canonical URL format
+        """
+        job_id = cls.extract_job_id(url)
+
         if job_id:
             canonical_url = f"https://www.linkedin.com/jobs/view/{job_id}"
             logger.info(f"🔗 Normalized URL: {url} → {canonical_url}")
@@ -72,22 +384,27 @@ class LinkedInScraper:
         await self.close()
     
     async def start(self):
-        """Initialize browser"""
+        """Initialize browser (no-op when using a shared pool)"""
+        if self.pool:
+            await self.pool.start()
+            return
         if not self.browser:
             self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled'
-                ]
-            )
+            try:
+                self.browser = await self.playwright.chromium.launch(
+                    headless=True,
+                    args=CHROMIUM_ARGS
+                )
+            except Exception:
+                await self.playwright.stop()
+                self.playwright = None
+                raise
             logger.info("✅ Browser initialized for anonymous scraping")
     
     async def close(self):
         """Close browser"""
+        if self.fetcher and self._owns_fetcher:
+            await self.fetcher.close()
         if self.browser:
             await self.browser.close()
             self.browser = None
@@ -96,10 +413,40 @@ class LinkedInScraper:
             self.playwright = None
             logger.info("✅ Browser closed")
 
+    @asynccontextmanager
+    async def _new_context(
+        self,
+    ) -> AsyncIterator[Tuple[BrowserContext, Optional[AuthSessionManager]]]:
+        """
+        Yield ``(context, session)``: a leased session's logged-in context,
+        or an isolated anonymous one from the pool or our own browser.
+        """
+        if self.session:
+            async with self.session.lease() as session:
+                context = await session.context()
+                if not context:
+                    raise RuntimeError("LinkedIn session is not authenticated")
+                # Shared across scrapes; only the page is closed afterwards
+                yield context, session
+            return
+
+        if self.pool:
+            async with self.pool.context(**CONTEXT_OPTIONS) as context:
+                yield context, None
+            return
+
+        if not self.browser:
+            await self.start()
+        context = await self.browser.new_context(**CONTEXT_OPTIONS)
+        try:
+            yield context, None
+        finally:
+            await context.close()
+
     async def scrape_job_post(self, url: str) -> Optional[dict]:
         """
-        Scrape a LinkedIn job post anonymously (no login required).
-        Only publicly visible data will be extracted.
+        Scrape a LinkedIn job post, anonymously unless the scraper was
+        given a session manager or account registry.
         
         Args:
             url: LinkedIn job post URL (any format)
@@ -107,140 +454,222 @@ class LinkedInScraper:
         Returns:
             Dictionary with job details or None if scraping failed
         """
+        _, job = await self.fetch_job_post(url)
+        return job
+
+    async def fetch_job_post(self, url: str) -> Tuple[str, Optional[dict]]:
+        """
+        Scrape a job post and report whether it is still online.
+
+        Args:
+            url: LinkedIn job post URL (any format)
+
+        Returns:
+            ``(JOB_OPEN, job)``, ``(JOB_CLOSED, None)`` if LinkedIn answers
+            404/410 for the posting, or ``(JOB_UNKNOWN, None)`` if scraping
+            failed
+        """
         # Normalize URL to canonical format
         url = self.normalize_linkedin_url(url)
-        
-        if not self.browser:
-            await self.start()
-        
-        # Create a new context for each scrape (isolated session)
-        context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        
-        page = await context.new_page()
-        
-        try:
-            logger.info(f"🔍 Scraping job post anonymously: {url}")
-            
-            # Navigate to job post
-            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            await page.wait_for_timeout(3000)  # Wait for dynamic content
-            
-            # Get page title for fallback
-            page_title = await page.title()
-            logger.info(f"📄 Page Title: {page_title}")
-            
-            # Parse title and company from page title
-            # Format: "Job Title | Company | LinkedIn" or "Job Title | Company"
-            meta_title = None
-            meta_company = None
-            if "|" in page_title:
-                parts = page_title.split("|")
-                if len(parts) >= 2:
-                    meta_title = parts[0].strip()
-                    meta_company = parts[1].strip()
-
-            # Extract Title
-            logger.info("📋 Extracting job title...")
-            title = await self._get_text(page, [
-                "h1.job-details-jobs-unified-top-card__job-title",
-                "h1.top-card-layout__title",
-                ".job-details-jobs-unified-top-card__job-title h1",
-                "h1.topcard__title",
-                "h1",
-                '[data-testid="job-title"]'
-            ])
-            
-            if not title and meta_title:
-                logger.info(f"Using fallback title from metadata: {meta_title}")
-                title = meta_title
 
-            # Extract Description
-            logger.info("📝 Extracting job description...")
+        # Fast path: server-rendered HTML, no browser
+        if self.fetcher:
+            started = time.perf_counter()
+            state, result = await self.fetcher.fetch_job_post(url)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if state == JOB_OPEN:
+                logger.info(
+                    f"⚡ Scraped over HTTP in {elapsed_ms:.0f} ms: "
+                    f"{result['title']} at {result['company']}"
+                )
+                return state, result
+            if state == JOB_CLOSED:
+                logger.info(f"🚫 Job post is gone: {url}")
+                return state, None
+            logger.info(f"↩️ HTTP fast path missed required fields, using browser: {url}")
+
+        # Each scrape gets its own isolated context
+        async with self._new_context() as (context, session):
+            page = await context.new_page()
+            traffic = None
+            if self.request_filter:
+                traffic = await self.request_filter.attach(page)
             try:
-                # Try to click "See more" button if it exists
-                see_more = await page.query_selector("button.jobs-description__footer-button")
-                if see_more:
-                    await see_more.click()
-                    await page.wait_for_timeout(1000)
-            except:
-                pass
+                return await self._load_job(page, url, session)
+            finally:
+                if traffic:
+                    self.request_filter.log_stats(traffic, url)
+                await page.close()
 
-            description = await self._get_text(page, [
-                "div.jobs-description__content",
-                "div.show-more-less-html__markup",
-                "#job-details",
-                '[data-testid="expandable-text-box"]',
-                ".description__text",
-                ".jobs-box__html-content"
-            ])
-
-            # Extract Poster (may not be available anonymously)
-            logger.info("👤 Extracting poster info...")
-            poster = await self._get_text(page, [
-                ".jobs-poster__name",
-                ".message-the-hiring-team__name",
-                ".hirer-card__hirer-information",
-                '[data-testid="hirer-card"]'
-            ])
-            
-            if not poster:
-                poster = "Not publicly available"
-            
-            # Extract Company
-            logger.info("🏢 Extracting company name...")
-            company = await self._get_text(page, [
-                ".job-details-jobs-unified-top-card__company-name",
-                ".topcard__org-name-link",
-                "a.app-aware-link",
-                'a[href*="/company/"]',
-                ".jobs-unified-top-card__company-name"
-            ])
-            
-            if not company and meta_company:
-                logger.info(f"Using fallback company from metadata: {meta_company}")
-                company = meta_company
+    @classmethod
+    def prepare_urls(cls, urls: Iterable[str]) -> List[str]:
+        """Normalize URLs and drop duplicates, keeping the original order"""
+        seen = set()
+        prepared = []
+        for url in urls:
+            canonical = cls.normalize_linkedin_url(str(url).strip())
+            if canonical and canonical not in seen:
+                seen.add(canonical)
+                prepared.append(canonical)
+        return prepared
+
+    async def scrape_many(
+        self, urls: Iterable[str], concurrency: int = 4, db=None
+    ) -> AsyncIterator[Dict]:
+        """
+        Scrape many job posts concurrently, yielding results as they finish.
+
+        URLs are normalized and de-duplicated first. If ``db`` is given, URLs
+        already stored are skipped using a single bulk lookup
+        (``db.get_existing_jobs``).
+
+        Args:
+            urls: LinkedIn job post URLs (any format)
+            concurrency: Maximum number of pages scraped at the same time
+            db: Optional AsyncDatabase used to skip known URLs
+
+        Yields:
+            Dictionaries with ``url``, ``status`` ("exists", "scraped" or
+            "failed") and ``job`` (scraped data or the existing row)
+        """
+        pending = self.prepare_urls(urls)
+
+        if db is not None and pending:
+            existing = await db.get_existing_jobs(pending)
+            for url in pending:
+                if url in existing:
+                    yield {"url": url, "status": "exists", "job": existing[url]}
+            pending = [url for url in pending if url not in existing]
 
-            # Validate we got minimum required data
-            if not title or not description:
-                logger.error("❌ Failed to extract minimum required data (title or description)")
-                return None
+        if not pending:
+            return
 
-            logger.info(f"✅ Successfully scraped: {title} at {company}")
+        logger.info(f"🚀 Scraping {len(pending)} job(s) with concurrency {concurrency}")
+        semaphore = asyncio.Semaphore(max(1, concurrency))
 
+        async def _scrape_one(url: str) -> Dict:
+            async with semaphore:
+                try:
+                    result = await self.scrape_job_post(url)
+                except Exception as e:
+                    logger.error(f"❌ Error scraping {url}: {e}")
+                    result = None
             return {
-                "title": title,
-                "description": description[:500] + "..." if len(description) > 500 else description,
-                "full_description": description,
-                "poster": poster,
-                "company": company or "Unknown",
-                "url": url
+                "url": url,
+                "status": "scraped" if result else "failed",
+                "job": result,
             }
 
+        tasks = [asyncio.create_task(_scrape_one(url)) for url in pending]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            # Consumer stopped early (e.g. client disconnected)
+            for task in tasks:
+                task.cancel()
+
+    async def _load_job(
+        self, page: Page, url: str, session: Optional[AuthSessionManager] = None
+    ) -> Tuple[str, Optional[dict]]:
+        """Navigate ``page`` to ``url``; returns ``(state, job)`` like ``fetch_job_post``"""
+        try:
+            session_id = session.session_id if session else None
+            if session_id:
+                logger.info(f"🔍 Scraping job post as account {session_id}: {url}")
+            else:
+                logger.info(f"🔍 Scraping job post anonymously: {url}")
+
+            # Navigate to job post
+            await self.rate_limiter.acquire(url, session=session_id)
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            self.rate_limiter.observe(
+                url, response.status if response else None, page.url, session=session_id
+            )
+            if session and session.check_navigation(url, page.url):
+                return JOB_UNKNOWN, None
+            if response and response.status in GONE_STATUSES:
+                logger.info(f"🚫 Job post is gone ({response.status}): {url}")
+                return JOB_CLOSED, None
+            await self._wait_until_ready(page)
+            
+            # Expand the description before reading it
+            await self._expand_description(page)
+
+            # Extract every field in one round trip
+            extracted = await self._extract_fields(page)
+            logger.info(f"📄 Page Title: {extracted['pageTitle']}")
+
+            result = build_job_record(extracted["values"], extracted["pageTitle"], url)
+            if not result:
+                return JOB_UNKNOWN, None
+            logger.info(f"✅ Successfully scraped: {result['title']} at {result['company']}")
+            return JOB_OPEN, result
+
         except Exception as e:
             logger.error(f"❌ Error scraping job post: {str(e)}")
             try:
-                await page.screenshot(path="logs/scraping_error.png")
-                logger.info("📸 Screenshot saved to logs/scraping_error.png")
+                # One screenshot per job so queued retries don't overwrite each other
+                path = f"logs/scraping_error_{self.extract_job_id(url) or 'unknown'}.png"
+                await page.screenshot(path=path)
+                logger.info(f"📸 Screenshot saved to {path}")
             except:
                 pass
-            return None
-            
-        finally:
-            await page.close()
-            await context.close()
+            return JOB_UNKNOWN, None
 
-    async def _get_text(self, page: Page, selectors: list) -> Optional[str]:
-        """Try multiple selectors and return first matching text"""
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    text = await element.inner_text()
-                    if text:
-                        return text.strip()
-            except:
-                continue
-        return None
+    async def _wait_until_ready(self, page: Page) -> bool:
+        """
+        Wait until a title and a description element exist, or until the
+        readiness deadline passes. Extraction runs either way.
+        """
+        timeout_ms = config.SCRAPER_READY_TIMEOUT_MS
+        started = time.perf_counter()
+        try:
+            await page.wait_for_function(
+                _READY_SCRIPT,
+                arg=[TITLE_SELECTORS, DESCRIPTION_SELECTORS],
+                timeout=timeout_ms,
+            )
+            ready = True
+        except PlaywrightTimeoutError:
+            ready = False
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"⏱️ Page ready={ready} after {elapsed_ms:.0f} ms "
+            f"(deadline {timeout_ms} ms)"
+        )
+        return ready
+
+    async def _expand_description(self, page: Page) -> bool:
+        """Click "See more" only if it exists, then wait for it to expand"""
+        if not SEE_MORE_SELECTORS:
+            return False
+        see_more = await page.query_selector(", ".join(SEE_MORE_SELECTORS))
+        if not see_more:
+            return False
+
+        timeout_ms = config.SCRAPER_EXPAND_TIMEOUT_MS
+        started = time.perf_counter()
+        try:
+            await see_more.click(timeout=timeout_ms)
+            await page.wait_for_function(
+                _EXPANDED_SCRIPT, arg=see_more, timeout=timeout_ms
+            )
+            expanded = True
+        except Exception:
+            expanded = False
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"⏱️ Description expanded={expanded} after {elapsed_ms:.0f} ms "
+            f"(deadline {timeout_ms} ms)"
+        )
+        return expanded
+
+    async def _extract_fields(self, page: Page) -> Dict:
+        """
+        Run the selector table against the page in a single ``evaluate`` call.
+
+        Returns ``{"values": {field: text}, "matched": {field: selector},
+        "pageTitle": str}``.
+        """
+        return await page.evaluate(_EXTRACT_SCRIPT, FIELD_SELECTORS)
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import re
+import time
+from typing import AsyncIterator, Iterable, List, Optional
+from urllib.parse import urlencode
+
+from . import config
+from .scraper import GuestJobFetcher, LinkedInScraper
+
+logger = logging.getLogger(__name__)
+
+# Public (guest) endpoint behind the "See more jobs" button on search pages
+SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+_HREF_RE = re.compile(r'href="([^"]*/jobs/view/[^"]*)"')
+_URN_RE = re.compile(r'urn:li:jobPosting:(\d+)')
+
+
+class DedupWorkQueue:
+    """
+    In-memory FIFO of canonical job URLs that ignores URLs it has seen before.
+    """
+
+    def __init__(self, seen: Optional[Iterable[str]] = None):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._seen = set(seen or ())
+
+    def enqueue(self, urls: Iterable[str]) -> int:
+        """Add URLs not seen before; returns how many were added"""
+        added = 0
+        for url in urls:
+            if url in self._seen:
+                continue
+            self._seen.add(url)
+            self._queue.put_nowait(url)
+            added += 1
+        return added
+
+    async def get(self) -> str:
+        return await self._queue.get()
+
+    def task_done(self):
+        self._queue.task_done()
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+
+class PageBudget:
+    """Spaces out requests so at most ``pages_per_second`` are made"""
+
+    def __init__(self, pages_per_second: float):
+        self.interval = 1.0 / pages_per_second if pages_per_second > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+            self._next = max(now, self._next) + self.interval
+
+
+class JobSearchCrawler:
+    """
+    Enumerates job IDs from LinkedIn's public job search listing.
+
+    Pages through the guest search endpoint for a keyword/location query,
+    extracts job IDs with ``LinkedInScraper.extract_job_id`` and feeds the
+    canonical URLs into a de-duplicating work queue.
+    """
+
+    def __init__(
+        self,
+        fetcher: Optional[GuestJobFetcher] = None,
+        pages_per_second: Optional[float] = None,
+    ):
+        self._owns_fetcher = fetcher is None
+        self.fetcher = fetcher or GuestJobFetcher()
+        self.budget = PageBudget(
+            config.CRAWLER_PAGES_PER_SECOND if pages_per_second is None else pages_per_second
+        )
+
+    async def close(self):
+        if self._owns_fetcher:
+            await self.fetcher.close()
+
+    @staticmethod
+    def extract_job_urls(html: str) -> List[str]:
+        """Canonical job URLs found on one search results page, in page order"""
+        urls = []
+        seen = set()
+        job_ids = [LinkedInScraper.extract_job_id(href) for href in _HREF_RE.findall(html)]
+        job_ids += _URN_RE.findall(html)
+        for job_id in job_ids:
+            if job_id and job_id not in seen:
+                seen.add(job_id)
+                urls.append(f"https://www.linkedin.com/jobs/view/{job_id}")
+        return urls
+
+    async def iter_pages(
+        self, keywords: str, location: str = "", max_pages: Optional[int] = None
+    ) -> AsyncIterator[List[str]]:
+        """
+        Yield the job URLs of each search results page until the listing
+        runs out or ``max_pages`` is reached.
+        """
+        max_pages = max_pages or config.CRAWLER_MAX_PAGES
+        start = 0
+        for page_number in range(max_pages):
+            await self.budget.wait()
+            query = urlencode({"keywords": keywords, "location": location, "start": start})
+            html = await self.fetcher.fetch_html(f"{SEARCH_URL}?{query}")
+            if not html:
+                break
+            urls = self.extract_job_urls(html)
+            logger.info(
+                f"🔎 Search page {page_number + 1} ({keywords!r}, {location!r}): "
+                f"{len(urls)} job(s)"
+            )
+            if not urls:
+                break
+            yield urls
+            start += len(urls)
+
+    async def crawl(
+        self,
+        keywords: str,
+        location: str,
+        queue: DedupWorkQueue,
+        max_pages: Optional[int] = None,
+        db=None,
+    ) -> int:
+        """
+        Crawl a search query into ``queue``.
+
+        If ``db`` (an ``AsyncDatabase``) is given, URLs already stored are
+        skipped with one bulk ``db.get_existing_jobs`` lookup per results
+        page.
+
+        Returns:
+            Number of new URLs added to the queue
+        """
+        added = 0
+        async for urls in self.iter_pages(keywords, location, max_pages):
+            if db is not None:
+                existing = await db.get_existing_jobs(urls)
+                urls = [url for url in urls if url not in existing]
+            added += queue.enqueue(urls)
+        logger.info(f"✅ Crawl of {keywords!r} in {location!r} queued {added} new job(s)")
+        return added
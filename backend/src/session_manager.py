@@ -0,0 +1,125 @@
+"""
+Cached, validated LinkedIn session for authenticated scraping.
+
+``LinkedInAuth.is_logged_in`` loads the feed to prove the cookies work,
+which is far too slow to run per job. ``AuthSessionManager`` runs it once,
+keeps the validated browser context for ``ttl`` seconds and only checks
+again when the TTL runs out or a scrape reports evidence of logout (a
+redirect to a login wall).
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+
+from playwright.async_api import BrowserContext
+
+from . import config
+from .linkedin_auth import LinkedInAuth
+from .rate_limiter import AUTHWALL_MARKERS
+
+logger = logging.getLogger(__name__)
+
+
+class AuthSessionManager:
+    """
+    Owns one ``LinkedInAuth`` and hands out its context once validated.
+
+    If ``email`` and ``password`` are given, a failed validation falls back
+    to a fresh login; otherwise ``context()`` returns None until the saved
+    cookies are valid again.
+    """
+
+    def __init__(
+        self,
+        auth: LinkedInAuth,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.auth = auth
+        self.email = email
+        self.password = password
+        self.ttl = config.AUTH_SESSION_TTL_SECONDS if ttl is None else ttl
+        self.clock = clock
+        self.challenges = 0
+        self._validated_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def session_id(self) -> str:
+        """Rate-limiter session key of the underlying account"""
+        return self.auth.session_id
+
+    @property
+    def is_valid(self) -> bool:
+        """True while the cached context is validated and within its TTL"""
+        return (
+            self._validated_at is not None
+            and self.clock() - self._validated_at < self.ttl
+        )
+
+    async def context(self) -> Optional[BrowserContext]:
+        """
+        The authenticated context, validating (or logging in) only when the
+        cache is empty, expired or invalidated.
+
+        Concurrent callers share a single validation.
+        """
+        if self.is_valid:
+            return self.auth.context
+        async with self._lock:
+            if not self.is_valid:
+                await self._validate()
+        return self.auth.context if self.is_valid else None
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator["AuthSessionManager"]:
+        """Borrow this session for one scrape (same interface as ``SessionRegistry``)"""
+        yield self
+
+    async def _validate(self):
+        started = self.clock()
+        if await self.auth.is_logged_in():
+            logger.info("✅ Already logged in with saved cookies")
+        elif self.email and self.password:
+            logger.info("🔐 Saved cookies rejected, performing LinkedIn login...")
+            if not await self.auth.login(self.email, self.password):
+                logger.error("❌ Login failed - check credentials and logs")
+                self._validated_at = None
+                return
+            logger.info("🍪 Session cookies saved for future sessions")
+        else:
+            logger.error("Not authenticated. Please login first.")
+            self._validated_at = None
+            return
+        self._validated_at = self.clock()
+        logger.info(
+            f"🔓 Session validated in {self._validated_at - started:.1f}s, "
+            f"reused for up to {self.ttl:.0f}s"
+        )
+
+    def mark_logged_out(self, reason: str = ""):
+        """Drop the cached validation; the next ``context()`` re-validates"""
+        if self._validated_at is not None:
+            logger.warning(f"🔒 Session looks logged out{f' ({reason})' if reason else ''}")
+        self._validated_at = None
+
+    def check_navigation(self, requested_url: str, final_url: str) -> bool:
+        """
+        Invalidate the session if a navigation was bounced to a login wall.
+
+        Returns:
+            True if the navigation is evidence of logout
+        """
+        if any(m in final_url and m not in requested_url for m in AUTHWALL_MARKERS):
+            self.challenges += 1
+            self.mark_logged_out(f"redirected to {final_url}")
+            return True
+        return False
+
+    async def close(self):
+        await self.auth.close_browser()
@@ -0,0 +1,160 @@
+"""
+Pool of LinkedIn accounts for authenticated scraping.
+
+Each account is one cookie jar (``LINKEDIN_SESSIONS_DIR/*.json``) with its
+own ``AuthSessionManager``, rate-limiter budget, health and cooldown timer.
+``lease()`` hands each scrape the least busy healthy session; a session
+that hits a login wall or checkpoint is sidelined for a cooldown that
+doubles on every further strike, so throughput scales with the number of
+healthy accounts.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from . import config
+from .linkedin_auth import LinkedInAuth
+from .session_manager import AuthSessionManager
+
+logger = logging.getLogger(__name__)
+
+HEALTHY = "healthy"
+COOLING_DOWN = "cooling_down"
+
+
+class _SessionSlot:
+    def __init__(self, session: AuthSessionManager):
+        self.session = session
+        self.active = 0
+        self.leases = 0
+        self.strikes = 0
+        self.challenges = 0
+        self.cooldown_until = 0.0
+        self.last_leased = 0.0
+
+
+class SessionRegistry:
+    """
+    Schedules scrapes across several ``AuthSessionManager`` instances.
+
+    Args:
+        sessions: One session per LinkedIn account
+        cooldown: Seconds a session is sidelined after its first challenge
+        max_cooldown: Upper bound on the doubling cooldown
+    """
+
+    def __init__(
+        self,
+        sessions: List[AuthSessionManager],
+        cooldown: Optional[float] = None,
+        max_cooldown: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.cooldown = config.SESSION_COOLDOWN_SECONDS if cooldown is None else cooldown
+        self.max_cooldown = (
+            config.SESSION_MAX_COOLDOWN_SECONDS if max_cooldown is None else max_cooldown
+        )
+        self.clock = clock
+        self._slots = [_SessionSlot(session) for session in sessions]
+
+    @classmethod
+    def from_config(cls) -> "SessionRegistry":
+        """
+        One session per cookie jar in ``LINKEDIN_SESSIONS_DIR``, falling back
+        to the single ``data/cookies.json`` used by ``main.py``.
+        """
+        files = sorted(Path(config.LINKEDIN_SESSIONS_DIR).glob("*.json"))
+        if not files and Path("data/cookies.json").exists():
+            files = [Path("data/cookies.json")]
+        sessions = [
+            AuthSessionManager(LinkedInAuth(headless=config.HEADLESS, cookies_file=str(path)))
+            for path in files
+        ]
+        logger.info(f"🔑 Session registry loaded {len(sessions)} account(s)")
+        return cls(sessions)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _state(self, slot: _SessionSlot) -> str:
+        return COOLING_DOWN if slot.cooldown_until > self.clock() else HEALTHY
+
+    def _pick(self) -> Optional[_SessionSlot]:
+        healthy = [slot for slot in self._slots if self._state(slot) == HEALTHY]
+        if not healthy:
+            return None
+        return min(healthy, key=lambda slot: (slot.active, slot.last_leased))
+
+    def sideline(self, slot: _SessionSlot, reason: str):
+        """Put a session on cooldown; each further strike doubles it"""
+        slot.strikes += 1
+        slot.challenges += 1
+        delay = min(self.cooldown * (2 ** (slot.strikes - 1)), self.max_cooldown)
+        slot.cooldown_until = self.clock() + delay
+        slot.session.mark_logged_out(reason)
+        logger.warning(
+            f"⏸️ Sidelining session {slot.session.session_id} for {delay:.0f}s ({reason})"
+        )
+
+    async def _acquire(self) -> _SessionSlot:
+        if not self._slots:
+            raise RuntimeError("No LinkedIn sessions configured")
+        while True:
+            slot = self._pick()
+            if slot is None:
+                # Everyone is cooling down; wait for the first to come back
+                wake = min(s.cooldown_until for s in self._slots)
+                await asyncio.sleep(max(wake - self.clock(), 0.0))
+                continue
+
+            slot.active += 1
+            slot.last_leased = self.clock()
+            if await slot.session.context():
+                return slot
+            slot.active -= 1
+            self.sideline(slot, "validation failed")
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[AuthSessionManager]:
+        """
+        Borrow the least busy healthy session for one scrape.
+
+        Waits while every session is cooling down. If the session is
+        invalidated during the lease (the scrape hit a login wall or
+        checkpoint), it is sidelined on release.
+        """
+        slot = await self._acquire()
+        slot.leases += 1
+        challenges = slot.session.challenges
+        try:
+            yield slot.session
+        finally:
+            slot.active -= 1
+            if slot.session.challenges > challenges:
+                if self._state(slot) == HEALTHY:
+                    self.sideline(slot, "challenged during scrape")
+            else:
+                slot.strikes = 0
+
+    def stats(self) -> List[Dict]:
+        """Health, cooldown and usage of each session"""
+        now = self.clock()
+        return [
+            {
+                "session": slot.session.session_id,
+                "state": self._state(slot),
+                "cooldown_seconds": round(max(slot.cooldown_until - now, 0.0), 1),
+                "active": slot.active,
+                "leases": slot.leases,
+                "challenges": slot.challenges,
+            }
+            for slot in self._slots
+        ]
+
+    async def close(self):
+        for slot in self._slots:
+            await slot.session.close()
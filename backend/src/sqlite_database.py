@@ -0,0 +1,489 @@
+"""
+Local SQLite implementation of the ``JobStore`` interface.
+
+One file (``DATABASE_PATH``) in WAL mode, so readers never block the
+writer. Reads are local disk lookups instead of WAN round trips, which
+makes it the store for single-node deployments, offline development,
+benchmarks and CI. Select it with ``DATABASE_BACKEND=sqlite``.
+"""
+
+import asyncio
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from . import config
+from .database import (
+    JOB_LIST_COLUMNS,
+    AsyncJobStore,
+    JobStore,
+    _chunks,
+    _cv_row,
+    _job_upsert_rows,
+    _job_row,
+    _page_result,
+    _search_result,
+    _with_keys,
+    decode_cursor,
+)
+
+logger = logging.getLogger(__name__)
+
+# Mirrors the Supabase tables in docs/SUPABASE_SETUP.md
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    email           TEXT UNIQUE NOT NULL,
+    hashed_password TEXT NOT NULL,
+    is_active       INTEGER DEFAULT 1,
+    created_at      TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id               INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id          INTEGER REFERENCES users (id),
+    url              TEXT,
+    title            TEXT,
+    company          TEXT,
+    poster           TEXT,
+    description      TEXT,
+    full_description TEXT,
+    content_hash     TEXT,
+    status           TEXT DEFAULT 'open',
+    closed_at        TEXT,
+    scraped_at       TEXT,
+    refreshed_at     TEXT
+);
+CREATE TABLE IF NOT EXISTS cv_generations (
+    id                  INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id              INTEGER REFERENCES jobs (id),
+    original_cv_content TEXT,
+    tailored_cv_content TEXT,
+    generated_at        TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_url ON jobs (url);
+CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs (scraped_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_cv_generations_job_id ON cv_generations (job_id);
+"""
+
+# FTS5 index over the searchable columns, kept in sync by triggers. The
+# porter stemmer matches the english tsvector config used on Supabase.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5 (
+    title, company, full_description,
+    content='jobs', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, company, full_description)
+    VALUES (new.id, new.title, new.company, new.full_description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, full_description)
+    VALUES ('delete', old.id, old.title, old.company, old.full_description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update
+AFTER UPDATE OF title, company, full_description ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, full_description)
+    VALUES ('delete', old.id, old.title, old.company, old.full_description);
+    INSERT INTO jobs_fts (rowid, title, company, full_description)
+    VALUES (new.id, new.title, new.company, new.full_description);
+END;
+"""
+
+# bm25 weights of title, company and full_description
+_FTS_WEIGHTS = (10.0, 5.0, 1.0)
+_SEARCH_COLUMNS = "j.id, j.url, j.title, j.company, j.poster, j.scraped_at"
+
+JOB_COLUMNS = (
+    "id", "user_id", "url", "title", "company", "poster", "description",
+    "full_description", "content_hash", "status", "closed_at", "scraped_at",
+    "refreshed_at",
+)
+
+_UPSERT_COLUMNS = (
+    "url", "status", "title", "company", "poster", "description",
+    "full_description", "content_hash", "refreshed_at", "scraped_at",
+)
+# scraped_at is only set on insert (see _job_upsert_row)
+_UPSERT_JOB = (
+    f"INSERT INTO jobs ({', '.join(_UPSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _UPSERT_COLUMNS)}) "
+    f"ON CONFLICT (url) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in _UPSERT_COLUMNS[1:-1])
+    + " RETURNING id, url"
+)
+
+
+def _select_list(columns: str) -> str:
+    """Validated column list for a jobs query (columns are interpolated)"""
+    names = [c.strip() for c in _with_keys(columns).split(",")]
+    unknown = [c for c in names if c != "*" and c not in JOB_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown job columns: {', '.join(unknown)}")
+    return ", ".join(names)
+
+
+def _placeholders(values: List) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _fts_match(query: str, skills: Iterable[str]) -> str:
+    """
+    FTS5 MATCH expression requiring every query word and every skill phrase.
+
+    Each term is quoted, so user input can never be parsed as FTS syntax.
+    """
+    terms = re.findall(r"\w+", query or "")
+    terms += [skill for skill in skills if skill and skill.strip()]
+    return " AND ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+class SQLiteDatabase(JobStore):
+    """
+    ``JobStore`` on a local SQLite file.
+
+    Args:
+        path: Database file (defaults to ``DATABASE_PATH``); ``":memory:"``
+            for a throwaway store
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or config.DATABASE_PATH
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Statements are short and local, so one connection guarded by a
+        # lock is shared by every caller (and every to_thread worker)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        self._add_missing_columns()
+        has_fts = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'"
+        ).fetchone()
+        self._conn.executescript(_FTS_SCHEMA)
+        if not has_fts:
+            # Index rows stored before full-text search existed
+            self._conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+        self._lock = threading.Lock()
+        logger.info(f"🗄️ Using SQLite database at {self.path}")
+
+    def close(self):
+        self._conn.close()
+
+    def _add_missing_columns(self):
+        """Upgrade job tables created by older versions"""
+        present = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "refreshed_at" not in present:
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN refreshed_at TEXT")
+
+    def _all(self, sql: str, params: Iterable = ()) -> List[Dict]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, tuple(params))]
+
+    def _one(self, sql: str, params: Iterable = ()) -> Optional[Dict]:
+        rows = self._all(sql, params)
+        return rows[0] if rows else None
+
+    def save_job(self, job_data: Dict) -> int:
+        """Save job to database"""
+        return self.save_jobs([job_data])[job_data["url"]]
+
+    def save_jobs(
+        self, jobs: Iterable[Dict], batch_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Upsert many scraped jobs, one transaction per batch"""
+        saved = {}
+        for chunk in _chunks(_job_upsert_rows(jobs), batch_size or config.DB_BATCH_SIZE):
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    for row in chunk:
+                        job_id, url = self._conn.execute(
+                            _UPSERT_JOB, [row[c] for c in _UPSERT_COLUMNS]
+                        ).fetchone()
+                        saved[url] = job_id
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        return saved
+
+    def check_job_exists(self, url: str) -> Optional[Dict]:
+        """Check if job exists by URL"""
+        return self._one(
+            "SELECT id, title, company, scraped_at FROM jobs WHERE url = ?", (url,)
+        )
+
+    def get_existing_jobs(self, urls: List[str], chunk_size: int = 200) -> Dict[str, Dict]:
+        """Bulk existence check for many URLs"""
+        existing = {}
+        for chunk in _chunks(list(urls), chunk_size):
+            for row in self._all(
+                "SELECT id, url, title, company, scraped_at FROM jobs "
+                f"WHERE url IN ({_placeholders(chunk)})",
+                chunk,
+            ):
+                existing[row["url"]] = row
+        return existing
+
+    def get_open_jobs(self, after_id: int = 0, limit: int = 200) -> List[Dict]:
+        """Jobs not marked closed, ordered by id"""
+        return self._all(
+            "SELECT id, url, content_hash, full_description FROM jobs "
+            "WHERE (status IS NULL OR status != 'closed') AND id > ? "
+            "ORDER BY id LIMIT ?",
+            (after_id, limit),
+        )
+
+    def update_job_content(self, job_id: int, job_data: Dict):
+        """Overwrite the scraped fields of an existing job"""
+        row = _job_row(job_data)
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET {', '.join(f'{c} = ?' for c in row)} WHERE id = ?",
+                (*row.values(), job_id),
+            )
+
+    def mark_jobs_closed(self, job_ids: List[int]):
+        """Flag jobs whose posting has been taken down"""
+        if not job_ids:
+            return
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'closed', closed_at = ? "
+                f"WHERE id IN ({_placeholders(job_ids)})",
+                (datetime.now().isoformat(), *job_ids),
+            )
+
+    def get_job(self, job_id: int) -> Optional[Dict]:
+        """Get job by ID"""
+        return self._one("SELECT * FROM jobs WHERE id = ?", (job_id,))
+
+    def get_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        columns: str = JOB_LIST_COLUMNS,
+        since: Optional[str] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """One keyset page of jobs, newest first (see ``Database.get_jobs_page``)"""
+        where, params = [], []
+        if since:
+            where.append("scraped_at >= ?")
+            params.append(since)
+        if cursor:
+            where.append("(scraped_at, id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+        sql = f"SELECT {_select_list(columns)} FROM jobs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY scraped_at DESC, id DESC LIMIT ?"
+        return _page_result(self._all(sql, (*params, limit)), limit)
+
+    def search_jobs(
+        self,
+        query: str = "",
+        skills: Iterable[str] = (),
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[Dict], int]:
+        """Ranked FTS5 search (see ``JobStore.search_jobs``)"""
+        match = _fts_match(query, skills)
+        if not match:
+            rows = self._all(
+                f"SELECT {_SEARCH_COLUMNS}, 0.0 AS rank, count(*) OVER () AS total "
+                "FROM jobs j ORDER BY j.scraped_at DESC, j.id DESC LIMIT ? OFFSET ?",
+                (limit, offset),
+            )
+            return _search_result(rows)
+        # bm25() is only allowed directly on the MATCH query, so rank in a CTE
+        rows = self._all(
+            "WITH hits AS ("
+            f"  SELECT rowid, -bm25(jobs_fts, {', '.join(map(str, _FTS_WEIGHTS))}) AS rank"
+            "   FROM jobs_fts WHERE jobs_fts MATCH ?"
+            f") SELECT {_SEARCH_COLUMNS}, hits.rank, count(*) OVER () AS total "
+            "FROM hits JOIN jobs j ON j.id = hits.rowid "
+            "ORDER BY hits.rank DESC, j.scraped_at DESC, j.id DESC LIMIT ? OFFSET ?",
+            (match, limit, offset),
+        )
+        return _search_result(rows)
+
+    def delete_job(self, job_id: int) -> bool:
+        """Delete job and associated CVs; False if there was no such job"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM cv_generations WHERE job_id = ?", (job_id,))
+                deleted = self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return deleted.rowcount > 0
+
+    def save_generated_cv(self, job_id: int, original_cv: str, tailored_cv: str):
+        """Save generated CV"""
+        self.save_generated_cvs([(job_id, original_cv, tailored_cv)])
+
+    def save_generated_cvs(
+        self, cvs: Iterable[Tuple[int, str, str]], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        """Save many generated CVs, one transaction per batch"""
+        rows = [_cv_row(*cv) for cv in cvs]
+        saved = {}
+        for chunk in _chunks(rows, batch_size or config.DB_BATCH_SIZE):
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    for row in chunk:
+                        (cv_id,) = self._conn.execute(
+                            "INSERT INTO cv_generations (job_id, original_cv_content, "
+                            "tailored_cv_content, generated_at) VALUES (?, ?, ?, ?) "
+                            "RETURNING id",
+                            tuple(row.values()),
+                        ).fetchone()
+                        saved[row["job_id"]] = cv_id
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        return saved
+
+    def get_generated_cv_ids(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        """Bulk lookup of which jobs already have a generated CV"""
+        ids = list(dict.fromkeys(job_ids))
+        found = {}
+        for chunk in _chunks(ids, batch_size or config.DB_BATCH_SIZE):
+            for row in self._all(
+                "SELECT job_id, MAX(id) AS id FROM cv_generations "
+                f"WHERE job_id IN ({_placeholders(chunk)}) GROUP BY job_id",
+                chunk,
+            ):
+                found[row["job_id"]] = row["id"]
+        return found
+
+    def delete_generated_cvs(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ):
+        """Delete the generated CVs of the given jobs"""
+        ids = list(dict.fromkeys(job_ids))
+        for chunk in _chunks(ids, batch_size or config.DB_BATCH_SIZE):
+            with self._lock:
+                self._conn.execute(
+                    f"DELETE FROM cv_generations WHERE job_id IN ({_placeholders(chunk)})",
+                    chunk,
+                )
+
+    def create_user(self, email: str, hashed_password: str) -> int:
+        """Create a new user"""
+        row = self._one(
+            "INSERT INTO users (email, hashed_password) VALUES (?, ?) RETURNING id",
+            (email, hashed_password),
+        )
+        return row["id"]
+
+    def get_user_by_email(self, email: str) -> Optional[Dict]:
+        """Get user by email"""
+        user = self._one("SELECT * FROM users WHERE email = ?", (email,))
+        if user:
+            user["is_active"] = bool(user["is_active"])
+        return user
+
+
+class AsyncSQLiteDatabase(AsyncJobStore):
+    """
+    ``AsyncJobStore`` over ``SQLiteDatabase``.
+
+    Each call runs in a worker thread so disk I/O never blocks the event
+    loop; the shared connection's lock serializes them.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.db = SQLiteDatabase(path)
+
+    async def close(self):
+        self.db.close()
+
+    async def _run(self, method, *args, **kwargs):
+        return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def save_job(self, job_data: Dict) -> int:
+        return await self._run(self.db.save_job, job_data)
+
+    async def save_jobs(
+        self, jobs: Iterable[Dict], batch_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        return await self._run(self.db.save_jobs, list(jobs), batch_size)
+
+    async def check_job_exists(self, url: str) -> Optional[Dict]:
+        return await self._run(self.db.check_job_exists, url)
+
+    async def get_existing_jobs(
+        self, urls: List[str], chunk_size: int = 200
+    ) -> Dict[str, Dict]:
+        return await self._run(self.db.get_existing_jobs, urls, chunk_size)
+
+    async def get_open_jobs(self, after_id: int = 0, limit: int = 200) -> List[Dict]:
+        return await self._run(self.db.get_open_jobs, after_id, limit)
+
+    async def update_job_content(self, job_id: int, job_data: Dict):
+        return await self._run(self.db.update_job_content, job_id, job_data)
+
+    async def mark_jobs_closed(self, job_ids: List[int]):
+        return await self._run(self.db.mark_jobs_closed, job_ids)
+
+    async def get_job(self, job_id: int) -> Optional[Dict]:
+        return await self._run(self.db.get_job, job_id)
+
+    async def get_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        columns: str = JOB_LIST_COLUMNS,
+        since: Optional[str] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        return await self._run(self.db.get_jobs_page, limit, cursor, columns, since)
+
+    async def search_jobs(
+        self,
+        query: str = "",
+        skills: Iterable[str] = (),
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[Dict], int]:
+        return await self._run(self.db.search_jobs, query, list(skills), limit, offset)
+
+    async def delete_job(self, job_id: int) -> bool:
+        return await self._run(self.db.delete_job, job_id)
+
+    async def save_generated_cv(self, job_id: int, original_cv: str, tailored_cv: str):
+        return await self._run(self.db.save_generated_cv, job_id, original_cv, tailored_cv)
+
+    async def save_generated_cvs(
+        self, cvs: Iterable[Tuple[int, str, str]], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        return await self._run(self.db.save_generated_cvs, list(cvs), batch_size)
+
+    async def get_generated_cv_ids(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        return await self._run(self.db.get_generated_cv_ids, list(job_ids), batch_size)
+
+    async def delete_generated_cvs(
+        self, job_ids: Iterable[int], batch_size: Optional[int] = None
+    ):
+        return await self._run(self.db.delete_generated_cvs, list(job_ids), batch_size)
+
+    async def create_user(self, email: str, hashed_password: str) -> int:
+        return await self._run(self.db.create_user, email, hashed_password)
+
+    async def get_user_by_email(self, email: str) -> Optional[Dict]:
+        return await self._run(self.db.get_user_by_email, email)
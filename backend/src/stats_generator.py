@@ -1,16 +1,27 @@
 from collections import Counter
+from functools import lru_cache
+import hashlib
 from pathlib import Path
+from typing import Iterable, List, Optional
 import json
 
 # ------------------------------------------------------------
 # 1️⃣ Dependencies
 # ------------------------------------------------------------
 import spacy
-from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+import numpy as np
+from sklearn.feature_extraction.text import (
+    CountVectorizer,
+    HashingVectorizer,
+    TfidfTransformer,
+)
 import pandas as pd
 import matplotlib.pyplot as plt
 import logging
 
+from src import config
+from src.normalize_cache import NormalizedTextCache, text_hash
+
 logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------
@@ -211,7 +222,19 @@ COMMON_IRRELEVANT_TERMS = {
 # ------------------------------------------------------------
 # 3️⃣ Normalisation helpers
 # ------------------------------------------------------------
-nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
+SPACY_MODEL = "en_core_web_sm"
+# Lemmas only need the tagger (plus its tok2vec and the attribute ruler that
+# maps tags to POS); the rest of the pipeline is never loaded
+SPACY_EXCLUDE = ["parser", "senter", "ner"]
+# Bump when _normalize_doc changes so cached normalised texts are rebuilt
+NORMALIZER_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def get_nlp():
+    """The spaCy pipeline, loaded on first use"""
+    return spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+
 
 SYNONYMS = {
     "aws": "amazon web services",
@@ -228,9 +251,7 @@ SYNONYMS = {
 }
 
 
-def _normalize(text: str) -> str:
-    """Lower‑case, lemmatise, drop stop‑words and apply synonym map."""
-    doc = nlp(text.lower())
+def _normalize_doc(doc) -> str:
     tokens = []
     for tok in doc:
         if tok.is_stop or not tok.is_alpha:
@@ -244,30 +265,225 @@ def _normalize(text: str) -> str:
     return " ".join(tokens)
 
 
+def _normalize(text: str) -> str:
+    """Lower‑case, lemmatise, drop stop‑words and apply synonym map."""
+    return _normalize_doc(get_nlp()(text.lower()))
+
+
+def normalize_texts(
+    texts: Iterable[str],
+    batch_size: Optional[int] = None,
+    n_process: Optional[int] = None,
+) -> List[str]:
+    """
+    ``_normalize`` over many texts, streamed through ``nlp.pipe``.
+
+    Args:
+        texts: Raw descriptions
+        batch_size: Texts per spaCy batch (defaults to ``STATS_NLP_BATCH_SIZE``)
+        n_process: Worker processes (defaults to ``STATS_NLP_PROCESSES``)
+
+    Returns:
+        One normalised string per text, in order
+    """
+    docs = get_nlp().pipe(
+        (text.lower() for text in texts),
+        batch_size=batch_size or config.STATS_NLP_BATCH_SIZE,
+        n_process=n_process or config.STATS_NLP_PROCESSES,
+    )
+    return [_normalize_doc(doc) for doc in docs]
+
+
+def pipeline_version() -> str:
+    """
+    Fingerprint of everything that shapes ``_normalize`` output: the spaCy
+    and model versions, the enabled components, SYNONYMS,
+    COMMON_IRRELEVANT_TERMS and ``NORMALIZER_VERSION``.
+    """
+    parts = [
+        NORMALIZER_VERSION,
+        spacy.__version__,
+        SPACY_MODEL,
+        spacy.util.get_package_version(SPACY_MODEL),
+        sorted(SPACY_EXCLUDE),
+        sorted(SYNONYMS.items()),
+        sorted(COMMON_IRRELEVANT_TERMS),
+    ]
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()[:16]
+
+
+def normalize_descriptions(
+    texts: List[str], cache: Optional[NormalizedTextCache] = None
+) -> List[str]:
+    """
+    ``normalize_texts`` that only lemmatises descriptions not seen before.
+
+    Results are looked up in (and new ones written to) ``cache`` by the
+    hash of the raw description and the current ``pipeline_version()``;
+    entries from older pipeline versions are pruned.
+    """
+    if cache is None:
+        return normalize_texts(texts)
+
+    version = pipeline_version()
+    hashes = [text_hash(text) for text in texts]
+    cached = cache.get_many(version, hashes)
+    missing = {h: text for h, text in zip(hashes, texts) if h not in cached}
+    if missing:
+        fresh = dict(zip(missing, normalize_texts(missing.values())))
+        cache.put_many(version, fresh.items())
+        cached.update(fresh)
+    cache.prune(version)
+    logger.info(
+        f"🔤 Normalised {len(missing)} new description(s), "
+        f"reused {len(texts) - len(missing)} from cache"
+    )
+    return [cached[h] for h in hashes]
+
+
 # ------------------------------------------------------------
 # 4️⃣ Vectorisers
 # ------------------------------------------------------------
 def _prepare_vocab(term_list):
-    return set(_normalize(t) for t in term_list)
+    return set(normalize_texts(term_list, n_process=1))
 
 
-VOCAB_TECH = _prepare_vocab(TECHNOLOGIES)
-VOCAB_LANG = _prepare_vocab(PROGRAMMING_LANGUAGES)
-VOCAB_SOFT = _prepare_vocab(SOFT_SKILLS)
-VOCAB_HARD = _prepare_vocab(HARD_SKILLS)
-VOCAB = VOCAB_TECH | VOCAB_LANG | VOCAB_SOFT | VOCAB_HARD
+@lru_cache(maxsize=None)
+def _vocabularies() -> dict:
+    vocabs = {
+        "VOCAB_TECH": _prepare_vocab(TECHNOLOGIES),
+        "VOCAB_LANG": _prepare_vocab(PROGRAMMING_LANGUAGES),
+        "VOCAB_SOFT": _prepare_vocab(SOFT_SKILLS),
+        "VOCAB_HARD": _prepare_vocab(HARD_SKILLS),
+    }
+    vocabs["VOCAB"] = set().union(*vocabs.values())
+    return vocabs
 
-count_vectoriser = CountVectorizer(
-    lowercase=True,
-    token_pattern=r"[a-zA-Z][a-zA-Z0-9\+\-\.]*",
-    ngram_range=(1, 3),
-)
 
-tfidf_vectoriser = TfidfVectorizer(
-    lowercase=True,
-    token_pattern=r"[a-zA-Z][a-zA-Z0-9\+\-\.]*",
-    ngram_range=(1, 3),
-)
+def __getattr__(name):
+    # VOCAB* need the spaCy model, so they are built on first access
+    if name in ("VOCAB", "VOCAB_TECH", "VOCAB_LANG", "VOCAB_SOFT", "VOCAB_HARD"):
+        return _vocabularies()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+TOKEN_PATTERN = r"[a-zA-Z][a-zA-Z0-9\+\-\.]*"
+NGRAM_RANGE = (1, 3)
+
+# Heaviest hashed buckets named in the emerging-terms pass, and how many
+# descriptions are re-read per bucket to recover its term
+EMERGING_CANDIDATES = 50
+EMERGING_SAMPLE_DOCS = 20
+
+
+def category_vectoriser() -> CountVectorizer:
+    """Counts only the VOCAB terms, so its size does not grow with the corpus"""
+    return CountVectorizer(
+        lowercase=True,
+        token_pattern=TOKEN_PATTERN,
+        ngram_range=NGRAM_RANGE,
+        vocabulary=sorted(_vocabularies()["VOCAB"]),
+    )
+
+
+def mean_tfidf(X_cnt, terms) -> dict:
+    """
+    Mean TF-IDF of each term, computed from an existing count matrix.
+
+    Same weights as fitting a ``TfidfVectorizer`` with the same vocabulary,
+    without tokenising the corpus a second time.
+    """
+    X_tfidf = TfidfTransformer().fit_transform(X_cnt)
+    return {term: float(score) for term, score in zip(terms, X_tfidf.mean(axis=0).A1)}
+
+
+def _single_term(term: str) -> List[str]:
+    return [term]
+
+
+def emerging_terms(
+    normalised: List[str],
+    vocab_counts: dict,
+    limit: int = EMERGING_CANDIDATES,
+    n_features: Optional[int] = None,
+) -> Counter:
+    """
+    Most frequent terms outside the skill vocabularies.
+
+    Every n-gram is hashed into ``n_features`` buckets
+    (``STATS_EMERGING_FEATURES``) instead of being stored by name, so memory
+    is bounded however diverse the corpus is. The occurrences of the VOCAB
+    terms are subtracted from their buckets, then the heaviest buckets are
+    named by re-reading a few of the descriptions that hit them.
+
+    Args:
+        normalised: Normalised job descriptions
+        vocab_counts: Occurrences of every VOCAB term (zero counts included)
+        limit: Number of buckets to name
+        n_features: Hash buckets (defaults to ``STATS_EMERGING_FEATURES``)
+
+    Returns:
+        Counter of term -> occurrences (exact unless two terms share a bucket)
+    """
+    params = dict(
+        n_features=n_features or config.STATS_EMERGING_FEATURES,
+        alternate_sign=False,
+        norm=None,
+    )
+    hasher = HashingVectorizer(
+        lowercase=True, token_pattern=TOKEN_PATTERN, ngram_range=NGRAM_RANGE, **params
+    )
+    term_hasher = HashingVectorizer(analyzer=_single_term, **params)
+
+    def buckets(terms):
+        return term_hasher.transform(terms).indices
+
+    X_hash = hasher.transform(normalised)
+    totals = X_hash.sum(axis=0).A1
+    if vocab_counts:
+        known = list(vocab_counts)
+        np.subtract.at(totals, buckets(known), [vocab_counts[t] for t in known])
+
+    top = [int(b) for b in np.argsort(totals)[::-1][:limit] if totals[b] > 0]
+    if not top:
+        return Counter()
+
+    # Descriptions containing each heavy bucket, a few per bucket
+    hits = X_hash[:, top].tocsc()
+    sample = set()
+    for col in range(len(top)):
+        rows = hits.indices[hits.indptr[col] : hits.indptr[col + 1]]
+        sample.update(rows[:EMERGING_SAMPLE_DOCS].tolist())
+
+    analyse = hasher.build_analyzer()
+    wanted = set(top)
+    names = {b: Counter() for b in top}
+    for row in sorted(sample):
+        candidates = [t for t in set(analyse(normalised[row])) if t not in vocab_counts]
+        if not candidates:
+            continue
+        for term, bucket in zip(candidates, buckets(candidates).tolist()):
+            if bucket in wanted:
+                names[bucket][term] += 1
+
+    return Counter(
+        {
+            names[b].most_common(1)[0][0]: int(round(totals[b]))
+            for b in top
+            if names[b]
+        }
+    )
+
+
+def job_document_counts(X_cnt, terms) -> Counter:
+    """
+    Number of jobs containing each term.
+
+    That is the count of non-zero entries in the term's column of the
+    document-term matrix, so whole tokens are matched ("go" is not found in
+    "google") in one pass over the sparse data.
+    """
+    return Counter(dict(zip(terms, X_cnt.tocsr().getnnz(axis=0).tolist())))
 
 
 # ------------------------------------------------------------
@@ -324,32 +540,15 @@ def generate_job_stats(
     # Ensure output directory exists
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    # ---- Load job descriptions via Database (Supabase only) -------------------
-    from src.database import Database
+    # ---- Load job descriptions via the configured database -------------------
+    from src.database import open_database
     from src.llm_generator import LLMGenerator
 
-    db = Database()
-    # Fetch all jobs (paginated)
-    all_jobs = db.get_all_jobs(limit=1000, offset=0, include_description=True)
-    offset = 1000
-    while True:
-        more_jobs = db.get_all_jobs(limit=1000, offset=offset, include_description=True)
-        if not more_jobs:
-            break
-        all_jobs.extend(more_jobs)
-        offset += 1000
-
-    # Ensure we have unique job IDs (prevent accidental duplicates)
-    seen_ids = set()
-    unique_jobs = []
-    for job in all_jobs:
-        jid = job.get("id")
-        if jid is None or jid in seen_ids:
-            continue
-        seen_ids.add(jid)
-        unique_jobs.append(job)
+    db = open_database()
+    # Stream all jobs with keyset pagination (consistent even mid-scrape)
+    all_jobs = list(db.iter_jobs(batch_size=1000, columns="id, full_description"))
 
-    rows = [(job.get("full_description", ""),) for job in unique_jobs]
+    rows = [(job.get("full_description", ""),) for job in all_jobs]
     total_jobs = len(rows)
 
     # Guard clauses for empty data
@@ -385,99 +584,31 @@ def generate_job_stats(
         return "# 📊 Job Market Analysis Report\n\n**No job descriptions found.**\n\nThe jobs in the database don't have descriptions to analyze."
 
     rows = valid_rows
-    normalised = [_normalize(desc) for (desc,) in rows]
-
-    # ---- Phrase counting ------------------------------------------------------
-    X_cnt = count_vectoriser.fit_transform(normalised)
-    raw_counts = Counter(
-        {
-            term: int(cnt)
-            for term, cnt in zip(
-                count_vectoriser.get_feature_names_out(), X_cnt.sum(axis=0).A1
-            )
-        }
-    )
-
-    # ---- TF‑IDF weighting ----------------------------------------------------
-    if use_tfidf:
-        X_tfidf = tfidf_vectoriser.fit_transform(normalised)
-        tfidf_scores = {
-            term: float(score)
-            for term, score in zip(
-                tfidf_vectoriser.get_feature_names_out(), X_tfidf.mean(axis=0).A1
-            )
-        }
-        weighted = Counter(
-            {
-                term: raw_counts[term] * tfidf_scores.get(term, 1.0)
-                for term in raw_counts
-            }
-        )
+    if config.STATS_NORMALIZE_CACHE_PATH:
+        cache = NormalizedTextCache()
+        try:
+            normalised = normalize_descriptions([desc for (desc,) in rows], cache)
+        finally:
+            cache.close()
     else:
-        weighted = raw_counts
-
-    # ---- Split into categories ------------------------------------------------
-    def _filter(counter: Counter, vocab: set) -> Counter:
-        return Counter({k: v for k, v in counter.items() if k in vocab})
-
-    def _filter_exclude(counter: Counter, vocab: set) -> Counter:
-        return Counter({k: v for k, v in counter.items() if k not in vocab})
-
-    tech_counter = _filter(weighted, VOCAB_TECH)
-    lang_counter = _filter(weighted, VOCAB_LANG)
-    soft_counter = _filter(weighted, VOCAB_SOFT)
-    hard_counter = _filter(weighted, VOCAB_HARD)
-    uncategorized_counter = _filter_exclude(weighted, VOCAB)
-
-    # ---- Calculate job counts (unique jobs containing each term) --------------
-    # This counts how many jobs contain each skill, not total occurrences
-    job_counts = Counter()
-    for desc in normalised:
-        # Get unique terms in this job description
-        terms_in_job = set()
-        for term in raw_counts.keys():
-            if term in desc:
-                terms_in_job.add(term)
-        # Increment count for each unique term
-        for term in terms_in_job:
-            job_counts[term] += 1
-
-    # ---- Create visualizations ------------------------------------------------
-    output_path = Path(output_dir)
-    output_path.mkdir(exist_ok=True)
-
-    # Color palettes (unchanged) ... (rest of function unchanged)
-
-    # Check if we have any jobs
-    if total_jobs == 0:
-        return "# 📊 Job Market Analysis Report\\n\\n**No jobs found in database.**\\n\\nPlease scrape some job postings first before generating statistics."
-
-    normalised = [_normalize(desc or "") for (desc,) in rows]
+        normalised = normalize_texts(desc for (desc,) in rows)
 
     # Check if we have any meaningful content after normalization
-    if not any(normalised) or all(len(n.strip()) == 0 for n in normalised):
-        return "# 📊 Job Market Analysis Report\\n\\n**No job descriptions found.**\\n\\nThe jobs in the database don't have descriptions to analyze."
+    if not any(n.strip() for n in normalised):
+        return "# 📊 Job Market Analysis Report\n\n**No job descriptions found.**\n\nThe jobs in the database don't have descriptions to analyze."
 
     # ---- Phrase counting ------------------------------------------------------
+    # Category terms come from a fixed VOCAB vocabulary; everything else goes
+    # through the bounded hashed pass in emerging_terms
+    count_vectoriser = category_vectoriser()
     X_cnt = count_vectoriser.fit_transform(normalised)
-    raw_counts = Counter(
-        {
-            term: int(cnt)
-            for term, cnt in zip(
-                count_vectoriser.get_feature_names_out(), X_cnt.sum(axis=0).A1
-            )
-        }
-    )
+    terms = count_vectoriser.get_feature_names_out()
+    vocab_counts = dict(zip(terms, X_cnt.sum(axis=0).A1.astype(int).tolist()))
+    raw_counts = Counter({term: cnt for term, cnt in vocab_counts.items() if cnt})
 
-    # ---- TF‑IDF weighting --------------------------------------------
+    # ---- TF‑IDF weighting ----------------------------------------------------
     if use_tfidf:
-        X_tfidf = tfidf_vectoriser.fit_transform(normalised)
-        tfidf_scores = {
-            term: float(score)
-            for term, score in zip(
-                tfidf_vectoriser.get_feature_names_out(), X_tfidf.mean(axis=0).A1
-            )
-        }
+        tfidf_scores = mean_tfidf(X_cnt, terms)
         weighted = Counter(
             {
                 term: raw_counts[term] * tfidf_scores.get(term, 1.0)
@@ -491,14 +622,17 @@ def generate_job_stats(
     def _filter(counter: Counter, vocab: set) -> Counter:
         return Counter({k: v for k, v in counter.items() if k in vocab})
 
-    def _filter_exclude(counter: Counter, vocab: set) -> Counter:
-        return Counter({k: v for k, v in counter.items() if k not in vocab})
+    vocabs = _vocabularies()
+    tech_counter = _filter(weighted, vocabs["VOCAB_TECH"])
+    lang_counter = _filter(weighted, vocabs["VOCAB_LANG"])
+    soft_counter = _filter(weighted, vocabs["VOCAB_SOFT"])
+    hard_counter = _filter(weighted, vocabs["VOCAB_HARD"])
+    uncategorized_counter = emerging_terms(normalised, vocab_counts)
+    raw_counts.update(uncategorized_counter)
 
-    tech_counter = _filter(weighted, VOCAB_TECH)
-    lang_counter = _filter(weighted, VOCAB_LANG)
-    soft_counter = _filter(weighted, VOCAB_SOFT)
-    hard_counter = _filter(weighted, VOCAB_HARD)
-    uncategorized_counter = _filter_exclude(weighted, VOCAB)
+    # ---- Calculate job counts (unique jobs containing each term) --------------
+    # This counts how many jobs contain each skill, not total occurrences
+    job_counts = job_document_counts(X_cnt, terms)
 
     # ---- Create visualizations ------------------------------------------------
     output_path = Path(output_dir)
@@ -0,0 +1,268 @@
+"""
+Persistent scrape work queue backed by SQLite.
+
+Every URL moves through ``pending -> in_flight -> done``. A failed attempt
+puts it back to ``pending`` with an exponential backoff until it reaches
+the attempt limit, at which point it is parked as ``failed`` (poison) and
+no longer retried. Rows left ``in_flight`` by a crash are picked up again
+by ``recover()`` on the next start.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from . import config
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+STATES = (PENDING, IN_FLIGHT, DONE, FAILED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrape_queue (
+    url             TEXT PRIMARY KEY,
+    state           TEXT NOT NULL DEFAULT 'pending',
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    last_error      TEXT,
+    job_id          INTEGER,
+    created_at      REAL NOT NULL,
+    updated_at      REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scrape_queue_due
+    ON scrape_queue (state, next_attempt_at);
+"""
+
+
+@dataclass
+class QueueItem:
+    url: str
+    attempts: int
+
+
+class ScrapeQueue:
+    """
+    Durable FIFO of job URLs with per-URL attempt counts and backoff.
+
+    ``enqueue`` has the same signature as ``DedupWorkQueue.enqueue`` so the
+    search crawler can feed either one. URLs already in the queue, in any
+    state, are ignored.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_attempts: Optional[int] = None,
+        backoff_seconds: Optional[float] = None,
+        backoff_max_seconds: Optional[float] = None,
+    ):
+        self.path = path or config.SCRAPE_QUEUE_PATH
+        self.max_attempts = max_attempts or config.SCRAPE_QUEUE_MAX_ATTEMPTS
+        self.backoff_seconds = (
+            config.SCRAPE_QUEUE_BACKOFF_SECONDS if backoff_seconds is None else backoff_seconds
+        )
+        self.backoff_max_seconds = (
+            config.SCRAPE_QUEUE_BACKOFF_MAX_SECONDS
+            if backoff_max_seconds is None
+            else backoff_max_seconds
+        )
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Statements are short and local, so one connection guarded by a
+        # lock is shared by every worker on the event loop
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self._conn.close()
+
+    def enqueue(self, urls: Iterable[str]) -> int:
+        """Add URLs not queued before; returns how many were added"""
+        now = time.time()
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO scrape_queue (url, created_at, updated_at) "
+                "VALUES (?, ?, ?)",
+                [(url, now, now) for url in urls],
+            )
+            return self._conn.total_changes - before
+
+    def claim(self, now: Optional[float] = None) -> Optional[QueueItem]:
+        """
+        Take the oldest due pending URL and mark it in flight.
+
+        Returns:
+            The claimed item (``attempts`` includes this attempt), or None
+            if nothing is due
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute(
+                "UPDATE scrape_queue SET state = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE url = (SELECT url FROM scrape_queue "
+                "             WHERE state = ? AND next_attempt_at <= ? "
+                "             ORDER BY next_attempt_at, created_at LIMIT 1) "
+                "RETURNING url, attempts",
+                (IN_FLIGHT, now, PENDING, now),
+            ).fetchone()
+        return QueueItem(*row) if row else None
+
+    def complete(self, url: str, job_id: Optional[int] = None):
+        """Mark an in-flight URL as done"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE scrape_queue SET state = ?, job_id = ?, last_error = NULL, "
+                "updated_at = ? WHERE url = ?",
+                (DONE, job_id, time.time(), url),
+            )
+
+    def fail(self, url: str, error: str, now: Optional[float] = None) -> str:
+        """
+        Record a failed attempt.
+
+        The URL goes back to pending after ``backoff_delay(attempts)``
+        seconds, or to failed once it has used up ``max_attempts``.
+
+        Returns:
+            The new state
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT attempts FROM scrape_queue WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return FAILED
+            attempts = row[0]
+            state = FAILED if attempts >= self.max_attempts else PENDING
+            self._conn.execute(
+                "UPDATE scrape_queue SET state = ?, last_error = ?, next_attempt_at = ?, "
+                "updated_at = ? WHERE url = ?",
+                (state, error, now + self.backoff_delay(attempts), now, url),
+            )
+        if state == FAILED:
+            logger.warning(f"☠️ Giving up on {url} after {attempts} attempt(s): {error}")
+        return state
+
+    def release(self, url: str):
+        """Put an in-flight URL back to pending without counting the attempt"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE scrape_queue SET state = ?, attempts = MAX(attempts - 1, 0), "
+                "updated_at = ? WHERE url = ? AND state = ?",
+                (PENDING, time.time(), url, IN_FLIGHT),
+            )
+
+    def backoff_delay(self, attempts: int) -> float:
+        """Seconds to wait before retrying a URL that has failed ``attempts`` times"""
+        delay = self.backoff_seconds * (2 ** max(attempts - 1, 0))
+        return min(delay, self.backoff_max_seconds)
+
+    def recover(self) -> int:
+        """
+        Return URLs left in flight by a previous run to pending.
+
+        The interrupted attempt still counts, so a URL that keeps taking
+        the process down ends up failed instead of looping forever.
+
+        Returns:
+            Number of URLs recovered
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE scrape_queue SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "last_error = COALESCE(last_error, 'interrupted'), updated_at = ? "
+                "WHERE state = ?",
+                (self.max_attempts, FAILED, PENDING, time.time(), IN_FLIGHT),
+            )
+            return cursor.rowcount
+
+    def retry_failed(self) -> int:
+        """Give every failed URL a fresh set of attempts; returns how many"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE scrape_queue SET state = ?, attempts = 0, next_attempt_at = 0, "
+                "updated_at = ? WHERE state = ?",
+                (PENDING, time.time(), FAILED),
+            )
+            return cursor.rowcount
+
+    def next_due_in(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the next pending URL is due, or None if none are pending"""
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) FROM scrape_queue WHERE state = ?", (PENDING,)
+            ).fetchone()
+        if row[0] is None:
+            return None
+        return max(row[0] - now, 0.0)
+
+    def stats(self) -> Dict[str, int]:
+        """Number of URLs in each state"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) FROM scrape_queue GROUP BY state"
+            ).fetchall()
+        counts = {state: 0 for state in STATES}
+        counts.update(dict(rows))
+        return counts
+
+    def __len__(self) -> int:
+        """Number of URLs still waiting to be scraped"""
+        stats = self.stats()
+        return stats[PENDING] + stats[IN_FLIGHT]
+
+
+async def run_worker(
+    queue: ScrapeQueue,
+    scraper,
+    db,
+    poll_seconds: Optional[float] = None,
+):
+    """
+    Drain ``queue`` forever: scrape each due URL, save it and record the
+    outcome. Sleeps while nothing is due; cancel the task to stop it.
+
+    Args:
+        queue: Queue to take URLs from
+        scraper: Object with ``async scrape_job_post(url)`` (a LinkedInScraper)
+        db: Object with ``async save_job(job_data)`` (an AsyncDatabase)
+        poll_seconds: Longest idle sleep between polls
+    """
+    poll_seconds = config.SCRAPE_QUEUE_POLL_SECONDS if poll_seconds is None else poll_seconds
+    while True:
+        item = queue.claim()
+        if item is None:
+            due_in = queue.next_due_in()
+            await asyncio.sleep(poll_seconds if due_in is None else min(due_in, poll_seconds))
+            continue
+
+        try:
+            result = await scraper.scrape_job_post(item.url)
+            if not result:
+                queue.fail(item.url, "no job data extracted")
+                continue
+            job_id = await db.save_job(result)
+            queue.complete(item.url, job_id)
+            logger.info(f"✅ Queued job saved with ID: {job_id}")
+        except asyncio.CancelledError:
+            # Shutting down mid-scrape is not the URL's fault
+            queue.release(item.url)
+            raise
+        except Exception as e:
+            logger.error(f"❌ Error scraping queued job {item.url}: {e}")
+            queue.fail(item.url, str(e))
@@ -0,0 +1,36 @@
+import json
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tests.helpers import FIXTURES_DIR
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    """Recorded LinkedIn job pages: {filename: {"layout", "expected", "html"}}"""
+    manifest = json.loads((FIXTURES_DIR / "corpus.json").read_text())
+    pages = {}
+    for name, entry in manifest["pages"].items():
+        pages[name] = dict(entry, html=(FIXTURES_DIR / name).read_text())
+    return pages
+
+
+@pytest.fixture(scope="session")
+def fixture_server():
+    """Local HTTP stand-in serving the corpus; yields its base URL"""
+    handler = partial(_QuietHandler, directory=str(FIXTURES_DIR))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
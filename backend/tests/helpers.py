@@ -0,0 +1,41 @@
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "linkedin"
+
+FIELDS = ("title", "company", "poster", "description")
+
+
+def check_job(result, expected):
+    """Per-field pass/fail of a scraped job against a corpus entry"""
+    if expected is None:
+        return {"rejected": result is None}
+    result = result or {}
+    description = result.get("full_description") or ""
+    return {
+        "title": result.get("title") == expected["title"],
+        "company": result.get("company") == expected["company"],
+        "poster": result.get("poster") == expected["poster"],
+        "description": all(s in description for s in expected["description_contains"]),
+    }
+
+
+def success_rates(checks):
+    """Fraction of pages where each field was extracted correctly"""
+    rates = {}
+    for field in FIELDS + ("rejected",):
+        values = [c[field] for c in checks if field in c]
+        if values:
+            rates[field] = sum(values) / len(values)
+    return rates
+
+
+def record_throughput(benchmark, unit, n):
+    """Store ``n`` and, when timings were taken, ``n`` per second in ``extra_info``
+
+    ``benchmark.stats`` is None under ``--benchmark-disable``.
+    """
+    benchmark.extra_info[unit] = n
+    if benchmark.stats is not None:
+        benchmark.extra_info[f"{unit}_per_sec"] = round(
+            n / benchmark.stats.stats.mean, 1
+        )
@@ -0,0 +1,84 @@
+import json
+import os
+
+from src.cookies_manager import (
+    CookiesManager,
+    playwright_state,
+    session_storage_entry,
+    session_storage_script,
+)
+
+STATE = {
+    "cookies": [{"name": "li_at", "value": "token", "domain": ".linkedin.com", "path": "/"}],
+    "origins": [
+        {
+            "origin": "https://www.linkedin.com",
+            "localStorage": [{"name": "voyager", "value": "1"}],
+        }
+    ],
+    "sessionStorage": [
+        {
+            "origin": "https://www.linkedin.com",
+            "sessionStorage": [{"name": "li_tab", "value": "7"}],
+        }
+    ],
+}
+
+
+def test_storage_state_round_trip_is_cached(tmp_path):
+    path = str(tmp_path / "account.json")
+    CookiesManager(path).save_storage_state(STATE)
+
+    first = CookiesManager(path).load_storage_state()
+    second = CookiesManager(path).load_storage_state()
+    assert first == STATE
+    # Served from memory: the same object every time until the file changes
+    assert first is second
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_external_change_is_picked_up(tmp_path):
+    path = tmp_path / "account.json"
+    manager = CookiesManager(str(path))
+    manager.save_storage_state(STATE)
+    manager.load_storage_state()
+
+    path.write_text(json.dumps({"cookies": [], "origins": []}))
+    os.utime(path, (1, 1))
+    assert manager.load_storage_state() == {"cookies": [], "origins": []}
+
+
+def test_legacy_cookie_list_is_read_and_save_cookies_keeps_origins(tmp_path):
+    path = tmp_path / "cookies.json"
+    path.write_text(json.dumps(STATE["cookies"]))
+    manager = CookiesManager(str(path))
+    assert manager.load_storage_state() == {"cookies": STATE["cookies"], "origins": []}
+
+    manager.save_storage_state(STATE)
+    manager.save_cookies([])
+    assert manager.load_storage_state() == {**STATE, "cookies": []}
+    assert manager.load_cookies() == []
+
+
+def test_session_storage_is_split_from_the_playwright_state():
+    assert playwright_state(STATE) == {"cookies": STATE["cookies"], "origins": STATE["origins"]}
+    assert playwright_state(None) is None
+
+    script = session_storage_script(STATE)
+    assert '"https://www.linkedin.com": [{"name": "li_tab", "value": "7"}]' in script
+    assert session_storage_script({"cookies": [], "origins": []}) is None
+
+    read = {
+        "origin": "https://www.linkedin.com",
+        "sessionStorage": [
+            {"name": "li_tab", "value": "7"},
+            {"name": "__li_session_restored", "value": "1"},
+        ],
+    }
+    assert session_storage_entry(read) == STATE["sessionStorage"][0]
+
+
+def test_missing_file(tmp_path):
+    manager = CookiesManager(str(tmp_path / "none.json"))
+    assert manager.load_storage_state() is None
+    assert manager.load_cookies() == []
@@ -0,0 +1,216 @@
+import re
+
+import pytest
+
+from src.database import (
+    AsyncDatabase,
+    Database,
+    _page_result,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class _FakeQuery:
+    """Evaluates the subset of PostgREST filters the keyset query uses"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.filters = []
+        self.limit_n = None
+
+    def select(self, columns):
+        self.columns = [c.strip() for c in columns.split(",")]
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(lambda r: r[column] >= value)
+        return self
+
+    def or_(self, expr):
+        ts = re.search(r'scraped_at\.lt\."([^"]+)"', expr).group(1)
+        job_id = int(re.search(r"id\.lt\.(\d+)", expr).group(1))
+        self.filters.append(
+            lambda r: r["scraped_at"] < ts or (r["scraped_at"] == ts and r["id"] < job_id)
+        )
+        return self
+
+    def order(self, column, desc=False):
+        return self
+
+    def limit(self, n):
+        self.limit_n = n
+        return self
+
+    def execute(self):
+        rows = [r for r in self.rows if all(f(r) for f in self.filters)]
+        rows.sort(key=lambda r: (r["scraped_at"], r["id"]), reverse=True)
+        data = [{c: r.get(c) for c in self.columns} for r in rows[: self.limit_n]]
+        return type("Result", (), {"data": data})()
+
+
+class _FakeSupabase:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    def table(self, name):
+        self.queries += 1
+        return _FakeQuery(self.rows)
+
+
+def _db(rows):
+    db = Database.__new__(Database)
+    db.supabase = _FakeSupabase(rows)
+    return db
+
+
+def _job(job_id, scraped_at):
+    return {"id": job_id, "scraped_at": scraped_at, "title": f"Job {job_id}"}
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    cursor = encode_cursor({"id": 42, "scraped_at": "2025-01-02T03:04:05.123456"})
+    assert decode_cursor(cursor) == ("2025-01-02T03:04:05.123456", 42)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_iter_jobs_visits_every_row_once_across_timestamp_ties():
+    rows = [_job(i, f"2025-01-0{1 + i % 3}T00:00:00") for i in range(1, 11)]
+    db = _db(rows)
+
+    seen = [row["id"] for row in db.iter_jobs(batch_size=3, columns="title")]
+
+    assert sorted(seen) == list(range(1, 11))
+    assert db.supabase.queries == 4
+    assert all("title" in row for row in db.iter_jobs(batch_size=3, columns="title"))
+
+
+def test_rows_inserted_mid_scan_do_not_shift_pages():
+    rows = [_job(i, f"2025-01-01T00:00:{i:02d}") for i in range(1, 7)]
+    db = _db(rows)
+
+    first, cursor = db.get_jobs_page(limit=3)
+    rows.append(_job(7, "2025-01-01T00:00:59"))
+    second, cursor = db.get_jobs_page(limit=3, cursor=cursor)
+
+    assert [r["id"] for r in first] == [6, 5, 4]
+    assert [r["id"] for r in second] == [3, 2, 1]
+
+
+def test_empty_page_has_no_next_cursor():
+    assert _page_result([], 0) == ([], None)
+    assert _db([]).get_jobs_page(limit=5) == ([], None)
+
+
+def test_since_bounds_the_scan():
+    rows = [_job(i, f"2025-01-0{i}T00:00:00") for i in range(1, 6)]
+    ids = [r["id"] for r in _db(rows).iter_jobs(since="2025-01-03T00:00:00")]
+    assert ids == [5, 4, 3]
+
+
+class _FakeWrites:
+    """Records bulk writes and serves ``in_`` lookups on cv_generations"""
+
+    def __init__(self):
+        self.calls = []
+        self.cvs = []
+
+    def table(self, name):
+        self.name = name
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self.calls.append(("upsert", len(rows)))
+        self.data = [{"id": 100 + i, "url": row["url"]} for i, row in enumerate(rows)]
+        return self
+
+    def insert(self, rows):
+        self.calls.append(("insert", len(rows)))
+        for row in rows:
+            self.cvs.append({"id": len(self.cvs) + 1, "job_id": row["job_id"]})
+        self.data = self.cvs[-len(rows):]
+        return self
+
+    def select(self, columns):
+        return self
+
+    def in_(self, column, values):
+        self.calls.append(("select", len(values)))
+        self.data = [cv for cv in self.cvs if cv["job_id"] in values]
+        return self
+
+    def order(self, column, desc=False):
+        return self
+
+    def execute(self):
+        return type("Result", (), {"data": self.data})()
+
+
+def _job_data(url):
+    return {"url": url, "title": "Engineer", "company": "Acme"}
+
+
+def test_save_jobs_upserts_in_batches_and_dedupes_urls():
+    db = Database.__new__(Database)
+    db.supabase = _FakeWrites()
+    jobs = [_job_data(f"https://example.test/{i}") for i in range(5)]
+
+    saved = db.save_jobs(jobs + [_job_data("https://example.test/0")], batch_size=2)
+
+    assert db.supabase.calls == [("upsert", 2), ("upsert", 2), ("upsert", 1)]
+    assert sorted(saved) == sorted(job["url"] for job in jobs)
+
+
+def test_generated_cvs_round_trip_in_batches():
+    db = Database.__new__(Database)
+    db.supabase = _FakeWrites()
+
+    saved = db.save_generated_cvs([(i, "cv", f"tailored {i}") for i in range(1, 4)], batch_size=2)
+    found = db.get_generated_cv_ids([1, 3, 5, 3], batch_size=2)
+
+    assert saved == {1: 1, 2: 2, 3: 3}
+    assert found == {1: 1, 3: 3}
+    assert db.supabase.calls == [("insert", 2), ("insert", 1), ("select", 2), ("select", 1)]
+
+
+class _AsyncFakeWrites(_FakeWrites):
+    async def execute(self):
+        return super().execute()
+
+
+class _FailingQuery(_FakeWrites):
+    def delete(self):
+        return self
+
+    def eq(self, column, value):
+        return self
+
+    def execute(self):
+        raise ConnectionError("offline")
+
+
+async def test_async_database_runs_the_same_queries():
+    sync_db = Database.__new__(Database)
+    sync_db.supabase = _FakeWrites()
+    async_db = AsyncDatabase(_AsyncFakeWrites())
+    jobs = [_job_data(f"https://example.test/{i}") for i in range(3)]
+    cvs = [(i, "cv", "tailored") for i in range(1, 4)]
+
+    assert await async_db.save_jobs(jobs, batch_size=2) == sync_db.save_jobs(jobs, batch_size=2)
+    assert await async_db.save_generated_cvs(cvs, batch_size=2) == sync_db.save_generated_cvs(
+        cvs, batch_size=2
+    )
+    assert await async_db.get_generated_cv_ids([1, 2]) == sync_db.get_generated_cv_ids([1, 2])
+    assert async_db.supabase.calls == sync_db.supabase.calls
+
+
+def test_failed_queries_fall_back_or_raise_per_method():
+    db = Database.__new__(Database)
+    db.supabase = _FailingQuery()
+
+    assert db.check_job_exists("https://example.test/1") is None
+    assert db.delete_job(1) is False
+    with pytest.raises(ConnectionError):
+        db.save_jobs([_job_data("https://example.test/1")])
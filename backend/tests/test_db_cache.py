@@ -0,0 +1,70 @@
+import pytest
+
+from src.db_cache import _MISSING, CachedJobStore, LRUCache
+from src.sqlite_database import AsyncSQLiteDatabase
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+async def store(tmp_path):
+    db = CachedJobStore(AsyncSQLiteDatabase(str(tmp_path / "jobs.db")))
+    yield db
+    await db.close()
+
+
+def _job(url, title="Data Engineer"):
+    return {"url": url, "title": title, "company": "Acme", "full_description": "Python"}
+
+
+async def test_repeat_reads_are_served_from_cache(store):
+    job_id = await store.save_job(_job("https://example.test/1"))
+
+    for _ in range(3):
+        assert (await store.get_job(job_id))["id"] == job_id
+        assert (await store.check_job_exists("https://example.test/1"))["id"] == job_id
+        await store.get_jobs_page(limit=10)
+
+    stats = store.stats()
+    for kind in ("job", "url", "page"):
+        assert stats[kind]["misses"] == 1 and stats[kind]["hits"] == 2
+
+
+async def test_writes_invalidate_rows_urls_and_pages(store):
+    url = "https://example.test/1"
+    job_id = await store.save_job(_job(url))
+    await store.get_job(job_id)
+    await store.check_job_exists(url)
+    assert len((await store.get_jobs_page(limit=10))[0]) == 1
+
+    await store.save_job(_job(url, title="Staff Engineer"))
+    await store.save_job(_job("https://example.test/2"))
+
+    assert (await store.get_job(job_id))["title"] == "Staff Engineer"
+    assert (await store.check_job_exists(url))["title"] == "Staff Engineer"
+    assert len((await store.get_jobs_page(limit=10))[0]) == 2
+
+    await store.delete_job(job_id)
+    assert await store.get_job(job_id) is None
+    assert await store.check_job_exists(url) is None
+
+
+async def test_lru_evicts_oldest_and_expires_entries():
+    clock = _Clock()
+    cache = LRUCache(max_entries=2, ttl=10, clock=clock)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is _MISSING and cache.evictions == 1
+    clock.now = 11
+    assert len(cache) == 2
+    assert await cache.get("a") is _MISSING
+    assert len(cache) == 1
@@ -0,0 +1,99 @@
+"""
+Extraction benchmarks over the recorded LinkedIn corpus.
+
+Each benchmark scrapes every page in ``tests/fixtures/linkedin`` per round
+and records pages/sec and per-field success rates in ``extra_info``
+(shown with ``--benchmark-verbose`` or saved with ``--benchmark-json``).
+
+    uv run pytest tests/test_extraction_benchmark.py --benchmark-only
+"""
+
+import asyncio
+
+import pytest
+
+from src import config
+from src.html_extractor import extract_fields
+from src.scraper import (
+    COMPILED_SELECTORS,
+    GuestJobFetcher,
+    LinkedInScraper,
+    build_job_record,
+)
+from tests.helpers import check_job, record_throughput, success_rates
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _record(benchmark, corpus, results):
+    checks = [check_job(results[name], page["expected"]) for name, page in corpus.items()]
+    rates = success_rates(checks)
+    record_throughput(benchmark, "pages", len(corpus))
+    benchmark.extra_info["field_success"] = rates
+    return rates
+
+
+@pytest.fixture
+def event_loop_runner():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+def test_benchmark_html_parser(benchmark, corpus):
+    def run():
+        results = {}
+        for name, page in corpus.items():
+            extracted = extract_fields(page["html"], COMPILED_SELECTORS)
+            results[name] = build_job_record(
+                extracted["values"], extracted["pageTitle"], name
+            )
+        return results
+
+    results = benchmark(run)
+    rates = _record(benchmark, corpus, results)
+    assert all(rate == 1.0 for rate in rates.values())
+
+
+def test_benchmark_http_fast_path(benchmark, corpus, fixture_server, event_loop_runner):
+    fetcher = GuestJobFetcher()
+
+    async def scrape_all():
+        pages = list(corpus)
+        scraped = await asyncio.gather(
+            *(fetcher.scrape_job_post(f"{fixture_server}/{name}") for name in pages)
+        )
+        return dict(zip(pages, scraped))
+
+    try:
+        results = benchmark(lambda: event_loop_runner(scrape_all()))
+    finally:
+        event_loop_runner(fetcher.close())
+    rates = _record(benchmark, corpus, results)
+    assert all(rate == 1.0 for rate in rates.values())
+
+
+def test_benchmark_playwright(benchmark, corpus, fixture_server, event_loop_runner, monkeypatch):
+    monkeypatch.setattr(config, "SCRAPER_HTTP_FAST_PATH", False)
+    monkeypatch.setattr(config, "SCRAPER_READY_TIMEOUT_MS", 1000)
+    scraper = LinkedInScraper()
+    try:
+        event_loop_runner(scraper.start())
+    except Exception as e:
+        pytest.skip(f"Chromium not available: {e}")
+
+    async def scrape_all():
+        pages = list(corpus)
+        scraped = await asyncio.gather(
+            *(scraper.scrape_job_post(f"{fixture_server}/{name}") for name in pages)
+        )
+        return dict(zip(pages, scraped))
+
+    try:
+        results = benchmark.pedantic(
+            lambda: event_loop_runner(scrape_all()), rounds=3, iterations=1
+        )
+    finally:
+        event_loop_runner(scraper.close())
+    rates = _record(benchmark, corpus, results)
+    assert all(rate == 1.0 for rate in rates.values())
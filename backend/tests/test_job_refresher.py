@@ -0,0 +1,133 @@
+import httpx
+
+from src.job_refresher import refresh_jobs
+from src.scraper import (
+    JOB_CLOSED,
+    JOB_OPEN,
+    JOB_UNKNOWN,
+    GuestJobFetcher,
+    content_hash,
+)
+
+DESCRIPTION = "Build data pipelines in Python.\nWork with PostgreSQL."
+
+
+def test_content_hash_ignores_whitespace_and_case():
+    reformatted = "  build data pipelines in python. work with  postgresql."
+    assert content_hash(DESCRIPTION) == content_hash(reformatted)
+    assert content_hash(DESCRIPTION) != content_hash(DESCRIPTION + " Remote.")
+
+
+async def test_fetcher_reports_gone_postings_as_closed(corpus):
+    def handler(request):
+        if request.url.path.endswith("/gone"):
+            return httpx.Response(404)
+        if request.url.path.endswith("/authwall"):
+            return httpx.Response(200, text=corpus["authwall.html"]["html"])
+        return httpx.Response(200, text=corpus["guest_job_view.html"]["html"])
+
+    fetcher = GuestJobFetcher()
+    fetcher.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        assert (await fetcher.fetch_job_post("https://example.test/gone")) == (JOB_CLOSED, None)
+        assert (await fetcher.fetch_job_post("https://example.test/authwall"))[0] == JOB_UNKNOWN
+        state, job = await fetcher.fetch_job_post("https://example.test/open")
+    finally:
+        await fetcher.close()
+    assert state == JOB_OPEN
+    assert job["content_hash"] == content_hash(job["full_description"])
+
+
+class _FakeDB:
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.updated = []
+        self.closed = []
+        self.cvs_deleted = []
+
+    async def get_open_jobs(self, after_id=0, limit=200):
+        rows = [j for j in self.jobs if j["id"] > after_id and j["id"] not in self.closed]
+        return rows[:limit]
+
+    async def update_job_content(self, job_id, job_data):
+        self.updated.append(job_id)
+
+    async def mark_jobs_closed(self, job_ids):
+        self.closed.extend(job_ids)
+
+    async def delete_generated_cvs(self, job_ids):
+        self.cvs_deleted.extend(job_ids)
+
+
+class _FakeScraper:
+    def __init__(self, pages):
+        self.pages = pages
+
+    async def fetch_job_post(self, url):
+        return self.pages[url]
+
+
+def _job(description):
+    return {"title": "Engineer", "company": "Acme", "full_description": description,
+            "content_hash": content_hash(description)}
+
+
+async def test_refresh_only_writes_changed_and_closed_jobs(tmp_path):
+    (tmp_path / "stats_data.json").write_text("{}")
+    (tmp_path / "tailored_cv_2.md").write_text("cv")
+    (tmp_path / "tailored_cv_1.md").write_text("cv")
+
+    db = _FakeDB([
+        {"id": 1, "url": "u1", "content_hash": content_hash(DESCRIPTION)},
+        {"id": 2, "url": "u2", "content_hash": content_hash(DESCRIPTION)},
+        {"id": 3, "url": "u3", "content_hash": content_hash(DESCRIPTION)},
+        {"id": 4, "url": "u4", "content_hash": content_hash(DESCRIPTION)},
+    ])
+    scraper = _FakeScraper({
+        "u1": (JOB_OPEN, _job("build data pipelines in python.  work with postgresql.")),
+        "u2": (JOB_OPEN, _job(DESCRIPTION + " Now remote.")),
+        "u3": (JOB_CLOSED, None),
+        "u4": (JOB_UNKNOWN, None),
+    })
+
+    result = await refresh_jobs(db, scraper, batch_size=2, data_dir=str(tmp_path))
+
+    assert result.to_dict() == {
+        "checked": 4, "unchanged": 1, "updated": 1, "closed": 1, "failed": 1,
+    }
+    assert db.updated == [2]
+    assert db.closed == [3]
+    assert db.cvs_deleted == [2]
+    assert not (tmp_path / "stats_data.json").exists()
+    assert not (tmp_path / "tailored_cv_2.md").exists()
+    assert (tmp_path / "tailored_cv_1.md").exists()
+
+
+async def test_rows_without_a_stored_hash_compare_by_description(tmp_path):
+    (tmp_path / "tailored_cv_1.md").write_text("cv")
+    db = _FakeDB([
+        {"id": 1, "url": "u1", "content_hash": None, "full_description": DESCRIPTION},
+        {"id": 2, "url": "u2", "content_hash": None, "full_description": DESCRIPTION},
+    ])
+    scraper = _FakeScraper({
+        "u1": (JOB_OPEN, _job(DESCRIPTION)),
+        "u2": (JOB_OPEN, _job(DESCRIPTION + " Now remote.")),
+    })
+
+    result = await refresh_jobs(db, scraper, data_dir=str(tmp_path))
+
+    assert result.unchanged == 1 and result.updated == 1
+    assert db.updated == [2] and db.cvs_deleted == [2]
+    assert (tmp_path / "tailored_cv_1.md").exists()
+
+
+async def test_refresh_without_changes_leaves_artifacts(tmp_path):
+    (tmp_path / "stats_data.json").write_text("{}")
+    db = _FakeDB([{"id": 1, "url": "u1", "content_hash": content_hash(DESCRIPTION)}])
+    scraper = _FakeScraper({"u1": (JOB_OPEN, _job(DESCRIPTION))})
+
+    result = await refresh_jobs(db, scraper, data_dir=str(tmp_path))
+
+    assert result.unchanged == 1
+    assert db.updated == [] and db.closed == [] and db.cvs_deleted == []
+    assert (tmp_path / "stats_data.json").exists()
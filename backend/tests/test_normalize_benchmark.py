@@ -0,0 +1,117 @@
+"""
+Normalisation throughput of ``stats_generator`` (spaCy lemmatisation).
+
+Compares the per-description ``_normalize`` loop with batched
+``normalize_texts`` and records docs/sec in ``extra_info``. Everything but
+the offline ordering test needs the ``en_core_web_sm`` model; the
+100k-description run takes minutes and only runs with
+``STATS_BENCHMARK_LARGE=1``.
+
+    uv run pytest tests/test_normalize_benchmark.py --benchmark-only
+"""
+
+import os
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+spacy = pytest.importorskip("spacy")
+from spacy.language import Language  # noqa: E402
+
+from src import stats_generator  # noqa: E402
+from src.stats_generator import _normalize, normalize_texts  # noqa: E402
+from tests.helpers import record_throughput  # noqa: E402
+
+_MODEL = pytest.mark.skipif(
+    not spacy.util.is_package("en_core_web_sm"),
+    reason="spaCy model en_core_web_sm is not installed",
+)
+_LARGE = pytest.mark.skipif(
+    os.getenv("STATS_BENCHMARK_LARGE") != "1", reason="set STATS_BENCHMARK_LARGE=1"
+)
+
+_FILLER = (
+    "We are looking for an engineer who enjoys building reliable systems. "
+    "You will work closely with product teams and mentor other developers. "
+    "Experience with {a}, {b} and {c} is required; {d} is a plus. "
+    "Strong communication and problem solving skills. Remote friendly, "
+    "competitive salary and benefits."
+)
+
+
+def _descriptions(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    terms = (
+        stats_generator.TECHNOLOGIES
+        + stats_generator.PROGRAMMING_LANGUAGES
+        + stats_generator.HARD_SKILLS
+    )
+    return [
+        _FILLER.format(**dict(zip("abcd", rng.sample(terms, 4)))) for _ in range(n)
+    ]
+
+
+def _baseline_normalize(nlp, text):
+    """Per-text normalisation as it was before ``normalize_texts``"""
+    tokens = []
+    for tok in nlp(text.lower()):
+        if tok.is_stop or not tok.is_alpha:
+            continue
+        lemma = stats_generator.SYNONYMS.get(tok.text.lower())
+        if not lemma:
+            lemma = stats_generator.SYNONYMS.get(tok.lemma_, tok.lemma_)
+        if lemma in stats_generator.COMMON_IRRELEVANT_TERMS:
+            continue
+        tokens.append(lemma)
+    return " ".join(tokens)
+
+
+@Language.component("test_text_as_lemma")
+def _text_as_lemma(doc):
+    for tok in doc:
+        tok.lemma_ = tok.text
+    return doc
+
+
+def test_pipe_keeps_order_without_the_model(monkeypatch):
+    nlp = spacy.blank("en")
+    nlp.add_pipe("test_text_as_lemma")
+    monkeypatch.setattr(stats_generator, "get_nlp", lambda: nlp)
+    tools = ["kafka", "spark", "rust", "scala", "flink", "docker", "terraform"]
+    texts = [f"Needs {tool.upper()} and the 2 others" for tool in tools]
+    texts += ["", "AWS and GCP"]
+
+    normalised = normalize_texts(texts, batch_size=2, n_process=1)
+
+    assert normalised == [_normalize(text) for text in texts]
+    assert normalised[:7] == [f"needs {tool}" for tool in tools]
+    assert normalised[7:] == ["", "amazon web services google cloud platform"]
+
+
+@_MODEL
+def test_pipe_matches_baseline_normalisation():
+    baseline = spacy.load("en_core_web_sm", disable=["parser", "ner"])
+    texts = _descriptions(50) + ["", "AWS and GCP", "Node and ReactJS, CI/CD!"]
+    expected = [_baseline_normalize(baseline, text) for text in texts]
+    assert normalize_texts(texts, batch_size=8) == expected
+    assert normalize_texts(texts, batch_size=8, n_process=2) == expected
+
+
+@_MODEL
+@pytest.mark.parametrize("n", [1_000, 10_000, pytest.param(100_000, marks=_LARGE)])
+def test_benchmark_normalize_loop(benchmark, n):
+    texts = _descriptions(n)
+    benchmark.pedantic(lambda: [_normalize(t) for t in texts], rounds=1, iterations=1)
+    record_throughput(benchmark, "docs", n)
+
+
+@_MODEL
+@pytest.mark.parametrize("n", [1_000, 10_000, pytest.param(100_000, marks=_LARGE)])
+@pytest.mark.parametrize("n_process", [1, 2])
+def test_benchmark_normalize_pipe(benchmark, n, n_process):
+    texts = _descriptions(n)
+    benchmark.pedantic(
+        lambda: normalize_texts(texts, n_process=n_process), rounds=1, iterations=1
+    )
+    record_throughput(benchmark, "docs", n)
@@ -0,0 +1,53 @@
+from src import stats_generator
+from src.normalize_cache import NormalizedTextCache, text_hash
+
+
+def _fake_normalizer(calls):
+    def normalize_texts(texts):
+        texts = list(texts)
+        calls.append(texts)
+        return [text.upper() for text in texts]
+
+    return normalize_texts
+
+
+def test_cache_round_trip_and_prune(tmp_path):
+    cache = NormalizedTextCache(str(tmp_path / "cache.db"))
+    cache.put_many("v1", [(text_hash("a"), "A"), (text_hash("b"), "B")])
+    cache.put_many("v2", [(text_hash("a"), "a2")])
+
+    assert cache.get_many("v1", [text_hash("a"), text_hash("c")]) == {text_hash("a"): "A"}
+    assert cache.prune("v2") == 2
+    assert cache.get_many("v1", [text_hash("a")]) == {}
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_only_new_or_changed_descriptions_are_normalised(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(stats_generator, "normalize_texts", _fake_normalizer(calls))
+    cache = NormalizedTextCache(str(tmp_path / "cache.db"))
+
+    first = stats_generator.normalize_descriptions(["python", "java", "python"], cache)
+    second = stats_generator.normalize_descriptions(["python", "java edited", "go"], cache)
+
+    assert first == ["PYTHON", "JAVA", "PYTHON"]
+    assert second == ["PYTHON", "JAVA EDITED", "GO"]
+    assert calls == [["python", "java"], ["java edited", "go"]]
+    cache.close()
+
+
+def test_pipeline_change_invalidates_the_cache(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(stats_generator, "normalize_texts", _fake_normalizer(calls))
+    cache = NormalizedTextCache(str(tmp_path / "cache.db"))
+
+    version = stats_generator.pipeline_version()
+    stats_generator.normalize_descriptions(["kubernetes"], cache)
+    monkeypatch.setitem(stats_generator.SYNONYMS, "k8s", "kubernetes")
+    assert stats_generator.pipeline_version() != version
+    stats_generator.normalize_descriptions(["kubernetes"], cache)
+
+    assert calls == [["kubernetes"], ["kubernetes"]]
+    assert len(cache) == 1
+    cache.close()
@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+from src.rate_limiter import RateLimiter, TokenBucket
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _limiter(**kwargs):
+    options = dict(
+        hosts=["linkedin.com"],
+        host_rate=10,
+        host_burst=2,
+        session_rate=1,
+        session_burst=1,
+        jitter=0,
+        max_slowdown=8,
+        recovery=0.5,
+    )
+    options.update(kwargs)
+    return RateLimiter(**options)
+
+
+def test_bucket_queues_reservations_after_burst():
+    clock = _Clock()
+    bucket = TokenBucket(rate=2, burst=2, clock=clock)
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+    clock.now = 1.0
+    assert bucket.reserve() == 0.5
+
+
+def test_throttle_halves_rate_until_recovered():
+    clock = _Clock()
+    bucket = TokenBucket(rate=4, burst=4, clock=clock)
+    bucket.throttle(max_slowdown=8)
+    bucket.throttle(max_slowdown=8)
+    assert bucket.effective_rate == 1
+    assert bucket.reserve() == 1.0
+    for _ in range(3):
+        bucket.recover(0.5)
+    assert bucket.effective_rate == 4
+
+
+async def test_acquire_spaces_requests_per_host():
+    limiter = _limiter()
+    started = time.monotonic()
+    for _ in range(4):
+        await limiter.acquire("https://www.linkedin.com/jobs/view/1")
+    elapsed = time.monotonic() - started
+    assert 0.15 <= elapsed < 0.5
+
+    stats = limiter.stats()["host:www.linkedin.com"]
+    assert stats["requests"] == 4
+    assert stats["waiting"] == 0
+    assert stats["max_wait_seconds"] > 0
+
+
+async def test_other_hosts_are_not_limited():
+    limiter = _limiter(host_rate=0.001, host_burst=1)
+    await asyncio.wait_for(
+        asyncio.gather(*(limiter.acquire("http://127.0.0.1/page") for _ in range(5))),
+        timeout=0.5,
+    )
+    assert limiter.stats() == {}
+
+
+def test_throttle_signals_slow_host_and_session_down():
+    limiter = _limiter()
+    url = "https://www.linkedin.com/jobs/view/1"
+    assert limiter.observe(url, 999, session="a") is True
+    assert limiter.observe(url, 200, "https://www.linkedin.com/authwall?trk=x") is True
+    assert limiter.observe(url, 200, url) is False
+    # Landing on the login page we asked for is not a login wall
+    login = "https://www.linkedin.com/login"
+    assert limiter.observe(login, 200, login) is False
+
+    stats = limiter.stats()
+    assert stats["host:www.linkedin.com"]["throttled"] == 2
+    assert stats["session:a"]["throttled"] == 1
+    assert stats["session:a"]["slowdown"] == 2
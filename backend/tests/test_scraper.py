@@ -0,0 +1,103 @@
+import pytest
+
+from src import config, scraper as scraper_module
+from src.html_extractor import extract_fields
+from src.scraper import (
+    COMPILED_SELECTORS,
+    GuestJobFetcher,
+    LinkedInScraper,
+    build_job_record,
+)
+from tests.helpers import check_job
+
+PAGES = [
+    "guest_job_view.html",
+    "guest_closed_job.html",
+    "logged_in_job_view.html",
+    "logged_in_title_only_meta.html",
+    "authwall.html",
+]
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.linkedin.com/jobs/view/4284088753",
+        "https://www.linkedin.com/jobs/view/4284088753/?trk=public_jobs",
+        "https://www.linkedin.com/jobs/collections/recommended/?currentJobId=4284088753",
+        "https://www.linkedin.com/jobs/search/?currentJobId=4284088753&keywords=python",
+    ],
+)
+def test_normalize_linkedin_url(url):
+    assert (
+        LinkedInScraper.normalize_linkedin_url(url)
+        == "https://www.linkedin.com/jobs/view/4284088753"
+    )
+
+
+def test_prepare_urls_dedupes_after_normalizing():
+    urls = [
+        "https://www.linkedin.com/jobs/view/1",
+        "https://www.linkedin.com/jobs/search/?currentJobId=1",
+        "https://www.linkedin.com/jobs/view/2",
+    ]
+    assert LinkedInScraper.prepare_urls(urls) == [
+        "https://www.linkedin.com/jobs/view/1",
+        "https://www.linkedin.com/jobs/view/2",
+    ]
+
+
+def test_build_job_record_falls_back_to_page_title():
+    record = build_job_record(
+        {"title": None, "description": "Write SQL", "company": None, "poster": None},
+        "Data Analyst | Fabrikam | LinkedIn",
+        "https://www.linkedin.com/jobs/view/1",
+    )
+    assert record["title"] == "Data Analyst"
+    assert record["company"] == "Fabrikam"
+    assert record["poster"] == "Not publicly available"
+
+
+async def test_expand_description_without_see_more_selectors(monkeypatch):
+    class _Page:
+        async def query_selector(self, selector):
+            raise AssertionError(f"queried {selector!r}")
+
+    monkeypatch.setattr(scraper_module, "SEE_MORE_SELECTORS", [])
+    assert await LinkedInScraper()._expand_description(_Page()) is False
+
+
+@pytest.mark.parametrize("name", PAGES)
+def test_html_extraction_matches_corpus(corpus, name):
+    page = corpus[name]
+    extracted = extract_fields(page["html"], COMPILED_SELECTORS)
+    result = build_job_record(extracted["values"], extracted["pageTitle"], name)
+    assert all(check_job(result, page["expected"]).values())
+
+
+@pytest.mark.parametrize("name", PAGES)
+async def test_http_fast_path_against_local_server(corpus, fixture_server, name):
+    fetcher = GuestJobFetcher()
+    try:
+        result = await fetcher.scrape_job_post(f"{fixture_server}/{name}")
+    finally:
+        await fetcher.close()
+    assert all(check_job(result, corpus[name]["expected"]).values())
+
+
+@pytest.mark.parametrize("name", PAGES)
+async def test_playwright_extraction_against_local_server(
+    corpus, fixture_server, monkeypatch, name
+):
+    monkeypatch.setattr(config, "SCRAPER_HTTP_FAST_PATH", False)
+    monkeypatch.setattr(config, "SCRAPER_READY_TIMEOUT_MS", 1000)
+    scraper = LinkedInScraper()
+    try:
+        await scraper.start()
+    except Exception as e:
+        pytest.skip(f"Chromium not available: {e}")
+    try:
+        result = await scraper.scrape_job_post(f"{fixture_server}/{name}")
+    finally:
+        await scraper.close()
+    assert all(check_job(result, corpus[name]["expected"]).values())
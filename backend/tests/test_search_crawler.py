@@ -0,0 +1,54 @@
+import httpx
+
+from src.scraper import GuestJobFetcher, LinkedInScraper
+from src.search_crawler import DedupWorkQueue, JobSearchCrawler
+
+SEARCH_PAGE = """
+<li>
+  <div class="base-card job-search-card" data-entity-urn="urn:li:jobPosting:4284088753">
+    <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/senior-backend-engineer-python-at-northwind-4284088753?position=1&amp;pageNum=0">
+      <span class="sr-only">Senior Backend Engineer (Python)</span>
+    </a>
+  </div>
+</li>
+<li>
+  <div class="base-card job-search-card" data-entity-urn="urn:li:jobPosting:4012345678">
+    <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/machine-learning-engineer-at-contoso-4012345678?position=2&amp;pageNum=0">
+      <span class="sr-only">Machine Learning Engineer</span>
+    </a>
+  </div>
+</li>
+"""
+
+
+def test_extract_job_id_from_search_result_slug():
+    url = "https://www.linkedin.com/jobs/view/python-developer-at-acme-4284088753?position=3"
+    assert LinkedInScraper.extract_job_id(url) == "4284088753"
+
+
+def test_extract_job_urls_dedupes_hrefs_and_urns():
+    assert JobSearchCrawler.extract_job_urls(SEARCH_PAGE) == [
+        "https://www.linkedin.com/jobs/view/4284088753",
+        "https://www.linkedin.com/jobs/view/4012345678",
+    ]
+
+
+async def test_crawl_pages_until_listing_runs_out():
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.params["start"])
+        body = SEARCH_PAGE if request.url.params["start"] == "0" else ""
+        return httpx.Response(200, text=body)
+
+    fetcher = GuestJobFetcher()
+    fetcher.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    crawler = JobSearchCrawler(fetcher=fetcher, pages_per_second=0)
+    queue = DedupWorkQueue(seen=["https://www.linkedin.com/jobs/view/4012345678"])
+
+    added = await crawler.crawl("python", "Berlin", queue, max_pages=5)
+    await fetcher.close()
+
+    assert added == 1
+    assert requested == ["0", "2"]
+    assert await queue.get() == "https://www.linkedin.com/jobs/view/4284088753"
@@ -0,0 +1,76 @@
+import asyncio
+
+from src.session_manager import AuthSessionManager
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeAuth:
+    session_id = "data/cookies.json"
+
+    def __init__(self, logged_in=True, login_ok=True):
+        self.context = object()
+        self.logged_in = logged_in
+        self.login_ok = login_ok
+        self.validations = 0
+        self.logins = 0
+
+    async def is_logged_in(self):
+        self.validations += 1
+        await asyncio.sleep(0.01)
+        return self.logged_in
+
+    async def login(self, email, password):
+        self.logins += 1
+        return self.login_ok
+
+    async def close_browser(self):
+        pass
+
+
+async def test_validates_once_for_concurrent_callers():
+    auth = _FakeAuth()
+    session = AuthSessionManager(auth, ttl=60)
+    contexts = await asyncio.gather(*(session.context() for _ in range(5)))
+    assert contexts == [auth.context] * 5
+    assert auth.validations == 1
+
+
+async def test_revalidates_after_ttl_or_login_wall():
+    auth = _FakeAuth()
+    clock = _Clock()
+    session = AuthSessionManager(auth, ttl=60, clock=clock)
+    await session.context()
+
+    clock.now = 59
+    await session.context()
+    assert auth.validations == 1
+
+    clock.now = 61
+    await session.context()
+    assert auth.validations == 2
+
+    job = "https://www.linkedin.com/jobs/view/1"
+    assert not session.check_navigation(job, job)
+    assert session.check_navigation(job, "https://www.linkedin.com/authwall?sessionRedirect=x")
+    await session.context()
+    assert auth.validations == 3
+
+
+async def test_falls_back_to_login_with_credentials():
+    auth = _FakeAuth(logged_in=False)
+    session = AuthSessionManager(auth, email="a@b.c", password="pw")
+    assert await session.context() is auth.context
+    assert auth.logins == 1
+
+
+async def test_returns_none_when_not_authenticated():
+    auth = _FakeAuth(logged_in=False, login_ok=False)
+    assert await AuthSessionManager(auth).context() is None
+    assert await AuthSessionManager(auth, email="a@b.c", password="pw").context() is None
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from src.session_registry import COOLING_DOWN, HEALTHY, SessionRegistry
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeSession:
+    """Stands in for AuthSessionManager"""
+
+    def __init__(self, name, authenticated=True):
+        self.session_id = name
+        self.authenticated = authenticated
+        self.challenges = 0
+        self.logged_out = 0
+
+    async def context(self):
+        return object() if self.authenticated else None
+
+    def mark_logged_out(self, reason=""):
+        self.logged_out += 1
+
+    def challenge(self):
+        self.challenges += 1
+
+    async def close(self):
+        pass
+
+
+def _states(registry):
+    return {s["session"]: s["state"] for s in registry.stats()}
+
+
+async def test_leases_spread_across_sessions():
+    sessions = [_FakeSession("a"), _FakeSession("b"), _FakeSession("c")]
+    registry = SessionRegistry(sessions, cooldown=60)
+
+    async def scrape():
+        async with registry.lease() as session:
+            await asyncio.sleep(0.01)
+            return session.session_id
+
+    used = await asyncio.gather(*(scrape() for _ in range(6)))
+    assert sorted(used) == ["a", "a", "b", "b", "c", "c"]
+
+
+async def test_challenged_session_is_sidelined_with_doubling_cooldown():
+    clock = _Clock()
+    a, b = _FakeSession("a"), _FakeSession("b")
+    registry = SessionRegistry([a, b], cooldown=60, max_cooldown=100, clock=clock)
+
+    async with registry.lease() as session:
+        assert session is a
+        a.challenge()
+    assert _states(registry) == {"a": COOLING_DOWN, "b": HEALTHY}
+
+    for _ in range(3):
+        async with registry.lease() as session:
+            assert session is b
+
+    clock.now = 61
+    async with registry.lease() as session:
+        assert session is a
+        a.challenge()
+    # Second strike: 120s, capped at 100s
+    assert registry.stats()[0]["cooldown_seconds"] == 100
+
+
+async def test_unauthenticated_sessions_are_skipped():
+    broken, ok = _FakeSession("broken", authenticated=False), _FakeSession("ok")
+    registry = SessionRegistry([broken, ok], cooldown=60)
+    async with registry.lease() as session:
+        assert session is ok
+    assert _states(registry)["broken"] == COOLING_DOWN
+
+
+async def test_waits_while_every_session_cools_down():
+    a = _FakeSession("a")
+    registry = SessionRegistry([a], cooldown=0.05)
+    async with registry.lease():
+        a.challenge()
+    async with registry.lease() as session:
+        assert session is a
+
+
+async def test_empty_registry_raises():
+    with pytest.raises(RuntimeError):
+        async with SessionRegistry([]).lease():
+            pass
@@ -0,0 +1,80 @@
+"""
+Job counts (documents containing each term) in ``generate_job_stats``.
+
+Compares the old substring scan over every (description, term) pair with
+``job_document_counts``, which reads the non-zeros per column of the count
+matrix. Works on already-normalised text, so spaCy is not needed.
+
+    uv run pytest tests/test_stats_benchmark.py --benchmark-only
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from sklearn.feature_extraction.text import CountVectorizer  # noqa: E402
+
+from src import stats_generator  # noqa: E402
+from src.stats_generator import job_document_counts  # noqa: E402
+
+_DOCS = 10_000
+
+
+def _normalised(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    vocab = stats_generator.TECHNOLOGIES + stats_generator.PROGRAMMING_LANGUAGES
+    filler = ["build", "team", "service", "experience", "work", "product", "scale"]
+    return [
+        " ".join(rng.sample(vocab, 6) + rng.sample(filler, 4)).lower() for _ in range(n)
+    ]
+
+
+def _substring_job_counts(normalised, terms):
+    """The loop ``generate_job_stats`` used before ``job_document_counts``"""
+    job_counts = Counter()
+    for desc in normalised:
+        terms_in_job = set()
+        for term in terms:
+            if term in desc:
+                terms_in_job.add(term)
+        for term in terms_in_job:
+            job_counts[term] += 1
+    return job_counts
+
+
+@pytest.fixture(scope="module")
+def matrix():
+    # Unigrams keep the old loop's runtime bounded at 10k documents
+    vectoriser = CountVectorizer(token_pattern=stats_generator.TOKEN_PATTERN)
+    normalised = _normalised(_DOCS)
+    X_cnt = vectoriser.fit_transform(normalised)
+    return normalised, X_cnt, vectoriser.get_feature_names_out()
+
+
+def test_job_counts_match_whole_tokens_not_substrings():
+    normalised = ["go and kafka", "google cloud", "kafka kafka", "java"]
+    vectoriser = CountVectorizer(token_pattern=stats_generator.TOKEN_PATTERN)
+    X_cnt = vectoriser.fit_transform(normalised)
+
+    counts = job_document_counts(X_cnt, vectoriser.get_feature_names_out())
+
+    assert counts["go"] == 1 and counts["google"] == 1
+    assert counts["kafka"] == 2 and counts["java"] == 1
+    assert _substring_job_counts(normalised, ["go"])["go"] == 2
+
+
+def test_benchmark_job_counts_substring_loop(benchmark, matrix):
+    normalised, _, terms = matrix
+    benchmark.extra_info.update(docs=len(normalised), terms=len(terms))
+    benchmark.pedantic(
+        lambda: _substring_job_counts(normalised, terms), rounds=1, iterations=1
+    )
+
+
+def test_benchmark_job_counts_vectorised(benchmark, matrix):
+    normalised, X_cnt, terms = matrix
+    benchmark.extra_info.update(docs=len(normalised), terms=len(terms))
+    benchmark(job_document_counts, X_cnt, terms)
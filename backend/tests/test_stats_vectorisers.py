@@ -0,0 +1,70 @@
+from collections import Counter
+
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from src import stats_generator
+from src.stats_generator import category_vectoriser, emerging_terms, mean_tfidf
+
+_NORMALISED = [
+    "python and docker with langgraph agent",
+    "python service on kubernetes with langgraph agent",
+    "java and docker , langgraph agent",
+    "rust and docker",
+]
+
+
+@pytest.fixture
+def vocab(monkeypatch):
+    vocabs = {"VOCAB": {"python", "java", "rust", "docker", "kubernetes", "google cloud"}}
+    monkeypatch.setattr(stats_generator, "_vocabularies", lambda: vocabs)
+    return vocabs["VOCAB"]
+
+
+def _vocab_counts():
+    vectoriser = category_vectoriser()
+    X_cnt = vectoriser.fit_transform(_NORMALISED)
+    return dict(zip(vectoriser.get_feature_names_out(), X_cnt.sum(axis=0).A1.tolist()))
+
+
+def test_category_vectoriser_only_counts_vocabulary_terms(vocab):
+    counts = _vocab_counts()
+
+    assert set(counts) == vocab
+    assert counts["docker"] == 3 and counts["python"] == 2
+    assert counts["google cloud"] == 0
+
+
+def test_emerging_terms_are_named_and_exclude_the_vocabulary(vocab):
+    emerging = emerging_terms(_NORMALISED, _vocab_counts(), limit=200, n_features=2**18)
+
+    assert not vocab & set(emerging)
+    assert emerging["langgraph"] == 3
+    assert emerging["langgraph agent"] == 3
+    assert emerging["with langgraph agent"] == 2
+
+
+def test_emerging_terms_respect_the_bucket_limit(vocab):
+    emerging = emerging_terms(_NORMALISED, _vocab_counts(), limit=2, n_features=2**18)
+
+    assert len(emerging) == 2
+    assert set(emerging.values()) == {3}
+
+
+def test_emerging_terms_of_vocabulary_only_text_are_empty(vocab):
+    assert emerging_terms(["python", "docker"], {"python": 1, "docker": 1}) == Counter()
+
+
+def test_mean_tfidf_from_counts_matches_a_tfidf_vectoriser(vocab):
+    vectoriser = category_vectoriser()
+    X_cnt = vectoriser.fit_transform(_NORMALISED)
+    reference = TfidfVectorizer(
+        token_pattern=stats_generator.TOKEN_PATTERN,
+        ngram_range=stats_generator.NGRAM_RANGE,
+        vocabulary=sorted(vocab),
+    ).fit_transform(_NORMALISED)
+
+    scores = mean_tfidf(X_cnt, vectoriser.get_feature_names_out())
+
+    expected = dict(zip(sorted(vocab), reference.mean(axis=0).A1.tolist()))
+    assert scores == pytest.approx(expected)
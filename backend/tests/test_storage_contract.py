@@ -0,0 +1,229 @@
+"""
+Contract every ``JobStore`` backend must satisfy.
+
+SQLite always runs. The Supabase backend writes real rows, so it only runs
+with ``SUPABASE_CONTRACT_TESTS=1`` (plus SUPABASE_URL/SUPABASE_KEY); the
+tests clean up the jobs they create.
+"""
+
+import os
+import sqlite3
+import uuid
+from datetime import datetime
+
+import pytest
+
+from src.database import Database
+from src.sqlite_database import AsyncSQLiteDatabase, SQLiteDatabase
+
+
+@pytest.fixture(params=["sqlite", "supabase"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        db = SQLiteDatabase(str(tmp_path / "jobs.db"))
+    else:
+        if os.getenv("SUPABASE_CONTRACT_TESTS") != "1":
+            pytest.skip("set SUPABASE_CONTRACT_TESTS=1 to run against Supabase")
+        db = Database()
+    created = []
+    db.created = created
+    yield db
+    for job_id in created:
+        db.delete_job(job_id)
+    db.close()
+
+
+@pytest.fixture
+def urls():
+    run = uuid.uuid4().hex[:8]
+    return [f"https://www.linkedin.com/jobs/view/contract-{run}-{i}/" for i in range(5)]
+
+
+def _job(url, description="Python and SQL"):
+    return {
+        "url": url,
+        "title": "Data Engineer",
+        "company": "Acme",
+        "poster": None,
+        "description": description,
+        "full_description": description,
+        "content_hash": f"hash:{description}",
+    }
+
+
+def _save(store, jobs):
+    saved = store.save_jobs(jobs, batch_size=2)
+    store.created.extend(saved.values())
+    return saved
+
+
+def test_save_job_is_an_upsert_by_url(store, urls):
+    job_id = store.save_job(_job(urls[0]))
+    store.created.append(job_id)
+
+    assert store.save_job(_job(urls[0], "Rust")) == job_id
+    assert store.get_job(job_id)["full_description"] == "Rust"
+    assert store.check_job_exists(urls[0])["id"] == job_id
+    assert store.check_job_exists(urls[1]) is None
+
+
+def test_rewrites_keep_scraped_at(store, urls):
+    job_id = store.save_job(_job(urls[0]))
+    store.created.append(job_id)
+    scraped_at = store.get_job(job_id)["scraped_at"]
+
+    store.save_job(_job(urls[0], "Rust"))
+    store.save_jobs([_job(urls[0], "Go")])
+    store.update_job_content(job_id, _job(urls[0], "Kafka"))
+
+    job = store.get_job(job_id)
+    assert job["scraped_at"] == scraped_at
+    assert job["refreshed_at"] >= scraped_at
+    assert store.check_job_exists(urls[0])["scraped_at"] == scraped_at
+
+
+def test_bulk_save_and_existing_lookup(store, urls):
+    saved = _save(store, [_job(url) for url in urls[:3]])
+
+    existing = store.get_existing_jobs(urls, chunk_size=2)
+
+    assert set(saved) == set(urls[:3])
+    assert {url: row["id"] for url, row in existing.items()} == saved
+
+
+def test_keyset_pages_cover_every_job_once(store, urls):
+    started = datetime.now().isoformat()
+    saved = _save(store, [_job(url) for url in urls])
+
+    ids = [row["id"] for row in store.iter_jobs(batch_size=2, since=started)]
+    rows, cursor = store.get_jobs_page(limit=2, since=started, columns="url")
+
+    assert sorted(ids) == sorted(saved.values())
+    assert len(rows) == 2 and cursor
+    assert {"id", "url", "scraped_at"} <= set(rows[0])
+
+
+def test_scan_yields_each_job_once_when_rows_are_rewritten(store, urls):
+    started = datetime.now().isoformat()
+    saved = _save(store, [_job(url) for url in urls])
+
+    ids = []
+    for row in store.iter_jobs(batch_size=2, since=started):
+        ids.append(row["id"])
+        if len(ids) == 3:
+            # Rewrite the newest job, already yielded, and an unseen one
+            store.save_job(_job(urls[-1], "Rust"))
+            store.save_jobs([_job(urls[0], "Go")])
+
+    assert sorted(ids) == sorted(saved.values())
+
+
+def test_refresh_cycle(store, urls):
+    saved = _save(store, [_job(url) for url in urls[:2]])
+    keep, gone = saved[urls[0]], saved[urls[1]]
+
+    store.update_job_content(keep, _job(urls[0], "Go and Kafka"))
+    store.mark_jobs_closed([gone])
+
+    open_ids = {row["id"] for row in store.get_open_jobs(after_id=min(keep, gone) - 1)}
+    assert keep in open_ids and gone not in open_ids
+    assert store.get_job(keep)["content_hash"] == "hash:Go and Kafka"
+    assert store.get_job(gone)["status"] == "closed"
+
+
+def test_generated_cvs_and_delete(store, urls):
+    saved = _save(store, [_job(url) for url in urls[:3]])
+    ids = list(saved.values())
+
+    store.save_generated_cv(ids[0], "cv", "tailored")
+    cv_ids = store.save_generated_cvs([(ids[1], "cv", "tailored")], batch_size=1)
+
+    found = store.get_generated_cv_ids(ids)
+    assert set(found) == {ids[0], ids[1]}
+    assert found[ids[1]] == cv_ids[ids[1]]
+
+    store.save_generated_cv(ids[2], "cv", "tailored")
+    store.delete_generated_cvs([ids[1], ids[2]], batch_size=1)
+    assert set(store.get_generated_cv_ids(ids)) == {ids[0]}
+
+    assert store.delete_job(ids[0])
+    assert store.get_job(ids[0]) is None
+    assert not store.delete_job(ids[0])
+    assert ids[0] not in store.get_generated_cv_ids(ids)
+
+
+def test_search_ranks_and_filters_by_skill(store, urls):
+    tag = urls[0].split("-")[1]
+    saved = _save(
+        store,
+        [
+            {
+                **_job(urls[0], f"{tag} role using Python for machine learning"),
+                "title": f"Python Engineer {tag}",
+            },
+            _job(urls[1], f"{tag} role building Python services"),
+            _job(urls[2], f"{tag} role writing Java"),
+        ],
+    )
+
+    rows, total = store.search_jobs(f"{tag} python")
+    assert total == 2
+    assert [row["id"] for row in rows] == [saved[urls[0]], saved[urls[1]]]
+    assert set(rows[0]) == {"id", "url", "title", "company", "poster", "scraped_at", "rank"}
+
+    rows, total = store.search_jobs(tag, skills=["machine learning"])
+    assert total == 1 and rows[0]["id"] == saved[urls[0]]
+
+    page, total = store.search_jobs(tag, limit=2, offset=2)
+    assert total == 3 and len(page) == 1
+
+    store.update_job_content(saved[urls[2]], _job(urls[2], f"{tag} role writing Python"))
+    assert store.search_jobs(f"{tag} python")[1] == 3
+
+
+def test_users(store):
+    email = f"contract-{uuid.uuid4().hex[:8]}@example.test"
+    user_id = store.create_user(email, "hashed")
+
+    user = store.get_user_by_email(email)
+    assert user["id"] == user_id and user["is_active"] is True
+    assert store.get_user_by_email("nobody-" + email) is None
+    with pytest.raises(Exception):
+        store.create_user(email, "again")
+
+
+def test_sqlite_indexes_jobs_stored_before_search_existed(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    SQLiteDatabase(path).save_job(_job("https://example.test/1", "Kubernetes"))
+    conn = sqlite3.connect(path)
+    conn.executescript("DROP TABLE jobs_fts; DROP TRIGGER jobs_fts_insert;")
+    conn.close()
+
+    db = SQLiteDatabase(path)
+    assert db.search_jobs("kubernetes")[1] == 1
+    db.close()
+
+
+def test_sqlite_adds_columns_missing_from_older_files(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    SQLiteDatabase(path).save_job(_job("https://example.test/1"))
+    conn = sqlite3.connect(path)
+    conn.execute("ALTER TABLE jobs DROP COLUMN refreshed_at")
+    conn.close()
+
+    db = SQLiteDatabase(path)
+    job_id = db.save_job(_job("https://example.test/1", "Rust"))
+    assert db.get_job(job_id)["refreshed_at"]
+    db.close()
+
+
+async def test_async_sqlite_store_round_trips(tmp_path):
+    db = AsyncSQLiteDatabase(str(tmp_path / "jobs.db"))
+    try:
+        job_id = await db.save_job(_job("https://example.test/1"))
+        await db.save_jobs([_job("https://example.test/2")])
+
+        assert (await db.get_job(job_id))["url"] == "https://example.test/1"
+        assert len([row async for row in db.iter_jobs(batch_size=1)]) == 2
+    finally:
+        await db.close()
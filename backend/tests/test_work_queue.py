@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from src.work_queue import DONE, FAILED, IN_FLIGHT, PENDING, ScrapeQueue, run_worker
+
+URL = "https://www.linkedin.com/jobs/view/1"
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = ScrapeQueue(
+        path=str(tmp_path / "queue.db"),
+        max_attempts=3,
+        backoff_seconds=10,
+        backoff_max_seconds=25,
+    )
+    yield q
+    q.close()
+
+
+def test_enqueue_ignores_urls_already_queued(queue):
+    assert queue.enqueue([URL, URL]) == 1
+    assert queue.enqueue([URL, "https://www.linkedin.com/jobs/view/2"]) == 1
+    assert queue.stats()[PENDING] == 2
+
+
+def test_failed_attempts_back_off_exponentially_then_poison(queue):
+    queue.enqueue([URL])
+
+    item = queue.claim(now=0)
+    assert item.attempts == 1
+    assert queue.fail(URL, "timeout", now=0) == PENDING
+    assert queue.claim(now=9) is None
+    assert queue.next_due_in(now=0) == 10
+
+    assert queue.claim(now=10).attempts == 2
+    assert queue.fail(URL, "timeout", now=10) == PENDING
+    assert queue.next_due_in(now=10) == 20
+
+    assert queue.claim(now=30).attempts == 3
+    assert queue.fail(URL, "timeout", now=30) == FAILED
+    assert queue.claim(now=1000) is None
+    assert queue.stats()[FAILED] == 1
+
+
+def test_backoff_is_capped(queue):
+    assert [queue.backoff_delay(n) for n in (1, 2, 3, 4)] == [10, 20, 25, 25]
+
+
+def test_in_flight_urls_resume_after_restart(tmp_path):
+    path = str(tmp_path / "queue.db")
+    first = ScrapeQueue(path=path, max_attempts=2)
+    first.enqueue([URL, "https://www.linkedin.com/jobs/view/2"])
+    first.claim()
+    first.close()
+
+    # Simulated crash: the new process finds one URL still in flight
+    second = ScrapeQueue(path=path, max_attempts=2)
+    assert second.stats()[IN_FLIGHT] == 1
+    assert second.recover() == 1
+    assert second.stats()[PENDING] == 2
+    assert second.claim().attempts == 2
+    second.close()
+
+
+def test_retry_failed_resets_attempts(queue):
+    queue.enqueue([URL])
+    for _ in range(3):
+        queue.claim(now=10**9)
+        queue.fail(URL, "boom", now=0)
+    assert queue.retry_failed() == 1
+    assert queue.claim().attempts == 1
+
+
+class _FlakyScraper:
+    def __init__(self):
+        self.calls = 0
+
+    async def scrape_job_post(self, url):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("navigation timeout")
+        return {"url": url, "title": "Engineer"}
+
+
+class _FakeDB:
+    def __init__(self):
+        self.saved = []
+
+    async def save_job(self, job):
+        self.saved.append(job)
+        return len(self.saved)
+
+
+async def test_worker_retries_then_completes(tmp_path):
+    queue = ScrapeQueue(path=str(tmp_path / "queue.db"), backoff_seconds=0)
+    queue.enqueue([URL])
+    db = _FakeDB()
+
+    worker = asyncio.create_task(run_worker(queue, _FlakyScraper(), db, poll_seconds=0.01))
+    for _ in range(100):
+        if queue.stats()[DONE]:
+            break
+        await asyncio.sleep(0.01)
+    worker.cancel()
+    await asyncio.gather(worker, return_exceptions=True)
+
+    assert queue.stats()[DONE] == 1
+    assert db.saved == [{"url": URL, "title": "Engineer"}]
+    queue.close()
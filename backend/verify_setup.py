@@ -116,14 +116,15 @@ def check_database_config() -> Dict[str, any]:
 
     # Try to initialize database
     try:
-        from src.database import Database
+        from src import config
+        from src.database import open_database
 
-        db = Database()
+        db = open_database()
+        db.close()
+        use_supabase = config.DATABASE_BACKEND == "supabase"
         results["can_connect"] = True
-        results["db_type"] = (
-            "Supabase (PostgreSQL)" if db.use_supabase else "SQLite (Local)"
-        )
-        results["use_supabase"] = db.use_supabase
+        results["db_type"] = "Supabase (PostgreSQL)" if use_supabase else "SQLite (Local)"
+        results["use_supabase"] = use_supabase
     except Exception as e:
         results["error"] = str(e)
 
@@ -240,7 +241,7 @@ def main():
 
     if db_config["can_connect"]:
         print_success("Database connection successful")
-        print_success("Connected to Supabase (PostgreSQL) ✨")
+        print_success(f"Connected to {db_config['db_type']} ✨")
         if db_config["has_supabase_sdk"]:
             print_success("Supabase SDK installed")
     else: